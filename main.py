@@ -5,40 +5,54 @@ Hotel Price Scraper - Main Entry Point
 A command-line tool for scraping hotel prices from Booking.com with retry functionality.
 """
 
+import os
 import sys
-import time
+from datetime import datetime
 
 from src.cli import parse_arguments
-from src.scraper import scrape_hotels_with_args
+from src.utils import get_scraper_settings, set_scraper_overrides
+from src.scraper import (
+    scrape_hotels,
+    sweep_destination,
+    scrape_hotels_with_args,
+    close_session_pool,
+    close_http_fetcher
+)
 from src.data import (
-    save_results_to_json,
+    build_output_path,
+    JsonlResultWriter,
+    read_results_stream,
+    finalize_results_stream,
+    create_run_manifest,
+    update_run_status,
+    load_run_manifest,
+    manifest_dates,
+    load_completed_tasks,
+    PriceStore,
+    is_sqlite_path,
+    export_results_to_parquet,
     load_failed_searches_from_json,
     update_json_with_results,
     scrape_specific_dates
 )
 
 
-def handle_retry_mode(args):
+def _is_successful(result):
+    """Check if a result holds an actual price"""
+    return result['price'] is not None and 'Not available' not in str(result['price'])
+
+
+def _retry_failed_searches(failed_searches, on_result=None):
     """
-    Handle retry mode for failed searches
+    Scrape again every failed search, one hotel at a time
     
     Args:
-        args: Parsed command line arguments with retry file path
+        failed_searches (list): Failed search dictionaries
+        on_result (callable, optional): Called with each result as soon as it is produced
+        
+    Returns:
+        list: List of retry results
     """
-    print(f'🔄 RETRY MODE')
-    print(f'   📁 JSON file: {args.retry}')
-    
-    # Load failed searches from JSON
-    original_json_data, failed_searches = load_failed_searches_from_json(args.retry)
-    
-    if not original_json_data:
-        print('❌ Could not load JSON file')
-        return
-    
-    if not failed_searches:
-        print('✅ No failed searches found - all searches were successful!')
-        return
-    
     # Group failed searches by hotel
     hotels_to_retry = {}
     for search in failed_searches:
@@ -58,22 +72,46 @@ def handle_retry_mode(args):
         print(f'🔄 Retrying {len(hotel_failed)} failed searches')
         print(f'{"="*60}')
         
-        retry_results = scrape_specific_dates(hotel_name, hotel_failed)
+        retry_results = scrape_specific_dates(hotel_name, hotel_failed, on_result=on_result)
         all_retry_results.extend(retry_results)
-        
-        # Wait between hotels
-        if hotel_idx < len(hotels_to_retry) - 1:
-            print(f'\n⏸️ Waiting before next hotel...')
-            time.sleep(10)
+    
+    return all_retry_results
+
+
+def handle_retry_mode(args):
+    """
+    Handle retry mode for failed searches
+    
+    Args:
+        args: Parsed command line arguments with retry file path
+    """
+    if is_sqlite_path(args.retry):
+        handle_sqlite_retry_mode(args)
+        return
+    
+    print(f'🔄 RETRY MODE')
+    print(f'   📁 JSON file: {args.retry}')
+    
+    # Load failed searches from JSON
+    retry_index, failed_searches = load_failed_searches_from_json(args.retry)
+    
+    if not retry_index:
+        print('❌ Could not load JSON file')
+        return
+    
+    if not failed_searches:
+        print('✅ No failed searches found - all searches were successful!')
+        return
+    
+    all_retry_results = _retry_failed_searches(failed_searches)
     
     # Update the original JSON file with retry results
     if all_retry_results:
-        success = update_json_with_results(original_json_data, all_retry_results, args.retry)
+        success = update_json_with_results(retry_index, all_retry_results, args.retry)
         
         if success:
             # Print retry summary
-            successful_retries = len([r for r in all_retry_results 
-                                    if r['price'] is not None and 'Not available' not in str(r['price'])])
+            successful_retries = len([r for r in all_retry_results if _is_successful(r)])
             
             print(f'\n🎉 RETRY SUMMARY:')
             print(f'📊 Total retry attempts: {len(all_retry_results)}')
@@ -88,6 +126,157 @@ def handle_retry_mode(args):
         print('\n❌ No retry results to save')
 
 
+def handle_sqlite_retry_mode(args):
+    """
+    Retry the stays whose latest result in a SQLite price store failed
+    
+    Args:
+        args: Parsed command line arguments with the database path
+    """
+    print(f'🔄 RETRY MODE')
+    print(f'   🗄️ SQLite store: {args.retry}')
+    
+    if not os.path.exists(args.retry):
+        print(f'❌ SQLite store not found: {args.retry}')
+        return
+    
+    store = _open_price_store(args.retry, run_id=f'retry_{datetime.now().strftime("%Y%m%d_%H%M%S")}')
+    try:
+        failed_searches = store.failed_searches()
+        print(f'🔍 Found {len(failed_searches)} failed searches to retry')
+        
+        if not failed_searches:
+            print('✅ No failed searches found - all searches were successful!')
+            return
+        
+        # Every retry result is added to the store as a new row
+        all_retry_results = _retry_failed_searches(failed_searches, on_result=store.write)
+    finally:
+        store.close()
+    
+    if all_retry_results:
+        successful_retries = len([r for r in all_retry_results if _is_successful(r)])
+        
+        print(f'\n🎉 RETRY SUMMARY:')
+        print(f'📊 Total retry attempts: {len(all_retry_results)}')
+        print(f'✅ Successful: {successful_retries}')
+        print(f'❌ Still failed: {len(all_retry_results) - successful_retries}')
+        print(f'📈 Retry success rate: {(successful_retries/len(all_retry_results)*100):.1f}%')
+        print(f'💾 Updated store: {args.retry}')
+        print('\n✅ Retry completed!')
+    else:
+        print('\n❌ No retry results to save')
+
+
+def _open_price_store(path, run_id=None):
+    """Open the SQLite price store that keeps the history of every search"""
+    settings = get_scraper_settings()
+    return PriceStore(path, run_id=run_id, batch_size=settings['sqlite_batch_size'])
+
+
+def handle_export_mode(args):
+    """
+    Export results to a Parquet dataset partitioned by scrape date and hotel
+    
+    Args:
+        args: Parsed command line arguments with the files to export
+    """
+    output_dir = args.export_dir or get_scraper_settings()['export_dir']
+    
+    print(f'📦 EXPORT MODE')
+    print(f'   📁 Sources: {len(args.export)}')
+    print(f'   🗂️ Dataset: {output_dir}')
+    
+    exported = export_results_to_parquet(args.export, output_dir)
+    if exported is None:
+        return
+    
+    if exported:
+        print(f'\n✅ Exported {exported} results to {output_dir}')
+    else:
+        print('\n❌ No results to export')
+
+
+def _open_results_stream(stream_path):
+    """Open the JSONL stream that receives every result as soon as it is produced"""
+    settings = get_scraper_settings()
+    return JsonlResultWriter(
+        stream_path,
+        fsync_every=settings['stream_fsync_every'],
+        fsync_interval=settings['stream_fsync_interval']
+    )
+
+
+def _run_and_finalize(writer, run, scrape, hotel_name=None, store=None):
+    """
+    Run a scrape into the results stream and build the JSON file from it
+    
+    Args:
+        writer (JsonlResultWriter): Results stream of the run
+        run (dict): Holds the run 'manifest' once the plan is known
+        scrape (callable): Called with the result callback, runs the scraper
+        hotel_name (str, optional): Hotel name for single hotel mode
+        store (PriceStore, optional): SQLite price store that also receives every result
+    """
+    on_result = writer.write
+    if store is not None:
+        def on_result(result):
+            writer.write(result)
+            store.write(result)
+    
+    status = 'interrupted'
+    json_file = None
+    try:
+        scrape(on_result)
+        status = 'completed'
+    finally:
+        # Also runs on interrupt, so partial progress ends up in the JSON file
+        writer.close()
+        if store is not None:
+            store.close()
+        if run.get('manifest'):
+            update_run_status(run['manifest'], status)
+        if os.path.getsize(writer.path) > 0:
+            json_file = finalize_results_stream(writer.path, hotel_name=hotel_name)
+    
+    _print_final_summary(writer.path, json_file)
+
+
+def _print_final_summary(stream_path, json_file):
+    """Print the per-hotel summary of a run, counted straight from its results stream"""
+    hotel_counts = {}
+    for result in read_results_stream(stream_path):
+        counts = hotel_counts.setdefault(result['hotel_name'], [0, 0])
+        counts[1] += 1
+        if _is_successful(result):
+            counts[0] += 1
+    
+    if not hotel_counts:
+        print('\n❌ No results to save')
+        return
+    
+    total_searches = sum(total for _, total in hotel_counts.values())
+    successful = sum(ok for ok, _ in hotel_counts.values())
+    
+    print(f'\n🎉 FINAL SUMMARY:')
+    print(f'📊 Hotels processed: {len(hotel_counts)}')
+    print(f'📊 Total searches: {total_searches}')
+    print(f'📊 Successful: {successful}')
+    print(f'📊 Failed: {total_searches - successful}')
+    print(f'📊 Success rate: {(successful/total_searches*100):.1f}%')
+    
+    print(f'\n📋 Results by hotel:')
+    for hotel, (hotel_successful, hotel_total) in hotel_counts.items():
+        print(f'   🏨 {hotel}: {hotel_successful}/{hotel_total} successful')
+    
+    print(f'\n📁 FILES CREATED:')
+    print(f'   📜 Results stream: {stream_path}')
+    if json_file:
+        print(f'   📋 JSON Data: {json_file}')
+    
+    print('\n✅ Scraping completed!')
+
+
 def handle_normal_mode(args):
     """
     Handle normal scraping mode
@@ -100,44 +289,73 @@ def handle_normal_mode(args):
         print(f'   🏨 Single hotel: {args.hotel}')
     else:
         print(f'   📁 Hotel file: {args.file}')
+    if args.destination:
+        print(f'   🗺️ Destination sweep: {args.destination}')
     
-    # Run the scraper
-    results = scrape_hotels_with_args(args)
+    # Stream every result to disk as soon as it is produced
+    stream_path = build_output_path(args.hotel, extension='jsonl')
+    writer = _open_results_stream(stream_path)
+    print(f'   💾 Results stream: {stream_path}')
     
-    if results:
-        # Save to JSON only
-        if args.hotel:
-            # Single hotel mode - use hotel name in filename
-            json_file = save_results_to_json(results, hotel_name=args.hotel)
-        else:
-            # Multiple hotels from file - use default naming
-            json_file = save_results_to_json(results)
-        
-        # Print final summary
-        hotels = list(set([r['hotel_name'] for r in results]))
-        total_searches = len(results)
-        successful = len([r for r in results if r['price'] is not None and 'Not available' not in str(r['price'])])
-        
-        print(f'\n🎉 FINAL SUMMARY:')
-        print(f'📊 Hotels processed: {len(hotels)}')
-        print(f'📊 Total searches: {total_searches}')
-        print(f'📊 Successful: {successful}')
-        print(f'📊 Failed: {total_searches - successful}')
-        print(f'📊 Success rate: {(successful/total_searches*100):.1f}%')
-        
-        print(f'\n📋 Results by hotel:')
-        for hotel in hotels:
-            hotel_results = [r for r in results if r['hotel_name'] == hotel]
-            hotel_successful = len([r for r in hotel_results if r['price'] is not None and 'Not available' not in str(r['price'])])
-            print(f'   🏨 {hotel}: {hotel_successful}/{len(hotel_results)} successful')
-        
-        print(f'\n📁 FILE CREATED:')
-        if json_file:
-            print(f'   📋 JSON Data: {json_file}')
-        
-        print('\n✅ Scraping completed!')
-    else:
-        print('\n❌ No results to save')
+    store = None
+    if args.sqlite:
+        store = _open_price_store(args.sqlite, run_id=os.path.splitext(os.path.basename(stream_path))[0])
+        print(f'   🗄️ SQLite store: {args.sqlite}')
+    
+    run = {}
+    
+    def checkpoint_plan(hotel_names, dates_list):
+        run['manifest'] = create_run_manifest(stream_path, hotel_names, dates_list, hotel_name=args.hotel,
+                                              destination=args.destination, workers=args.workers)
+    
+    _run_and_finalize(
+        writer, run,
+        lambda on_result: scrape_hotels_with_args(args, on_result=on_result, on_plan=checkpoint_plan),
+        hotel_name=args.hotel,
+        store=store
+    )
+
+
+def handle_resume_mode(args):
+    """
+    Continue an interrupted run where it stopped
+    
+    Args:
+        args: Parsed command line arguments with the run id to resume
+    """
+    manifest = load_run_manifest(args.resume)
+    if not manifest:
+        return
+    
+    hotel_names = manifest['hotel_names']
+    dates_list = manifest_dates(manifest)
+    completed = load_completed_tasks(manifest['stream_path'])
+    # Searched the way the run started; manifests of older runs do not record it
+    destination = manifest.get('destination')
+    workers = manifest.get('workers') or args.workers
+    
+    print(f'⏯️ RESUME MODE')
+    print(f'   🧾 Run: {manifest["run_id"]} (was {manifest["status"]})')
+    print(f'   🏨 Hotels: {len(hotel_names)}, 📅 Dates: {len(dates_list)}, 👷 Workers: {workers}')
+    if destination:
+        print(f'   🌆 Destination sweep: {destination}')
+    print(f'   ✅ Searches already done: {len(completed)}/{len(hotel_names) * len(dates_list)}')
+    
+    writer = _open_results_stream(manifest['stream_path'])
+    store = _open_price_store(args.sqlite, run_id=manifest['run_id']) if args.sqlite else None
+    update_run_status(manifest, 'running')
+    
+    def scrape(on_result):
+        if destination:
+            return sweep_destination(destination, hotel_names, dates_list, workers, on_result, completed)
+        return scrape_hotels(hotel_names, dates_list, workers, on_result, completed)
+    
+    _run_and_finalize(
+        writer, {'manifest': manifest},
+        scrape,
+        hotel_name=manifest['hotel_name'],
+        store=store
+    )
 
 
 def main():
@@ -147,10 +365,23 @@ def main():
     try:
         # Parse command line arguments
         args = parse_arguments()
+        set_scraper_overrides(
+            navigation_mode=args.navigation,
+            price_extraction=args.extraction,
+            fetch_mode=args.fetch,
+            refresh_resolution=args.refresh_resolution or None,
+            adaptive_concurrency=args.adaptive or None,
+            tabs_per_session=args.tabs,
+            prefetch_next_search=args.prefetch or None
+        )
         
         # Handle different modes
         if args.retry:
             handle_retry_mode(args)
+        elif args.resume:
+            handle_resume_mode(args)
+        elif args.export:
+            handle_export_mode(args)
         else:
             handle_normal_mode(args)
             
@@ -160,6 +391,9 @@ def main():
     except Exception as e:
         print(f'\n❌ Unexpected error: {str(e)}')
         sys.exit(1)
+    finally:
+        close_http_fetcher()
+        close_session_pool()
 
 
 if __name__ == "__main__":
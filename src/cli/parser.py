@@ -18,8 +18,39 @@ Examples:
   # Scrape all hotels from file
   python main.py --file hotel_names.txt
   
+  # Scrape with 4 browser sessions sharing the (hotel, date) queue
+  python main.py --file hotel_names.txt --workers 4
+  
+  # 2 sessions with 3 tabs each: 6 searches loading at once
+  python main.py --file hotel_names.txt --workers 2 --tabs 3
+  
+  # Load the next date of a hotel in a background tab while the current one is read
+  python main.py --file hotel_names.txt --prefetch
+  
+  # Read prices from the network responses instead of the rendered page
+  python main.py --file hotel_names.txt --extraction network
+  
+  # Answer searches over plain HTTP where possible, with the browser as fallback
+  python main.py --file hotel_names.txt --fetch http
+  
+  # One Bogotá search per date pair for every hotel in the file
+  python main.py --file hotel_names.txt --destination "Bogotá"
+  
+  # Start with one session and grow up to 8 while searches stay healthy
+  python main.py --file hotel_names.txt --workers 8 --adaptive
+  
   # Retry failed searches from existing JSON
   python main.py --retry outputs/hotel_dann_carlton_bogota_20241220_143022.json
+  
+  # Also keep every result in a SQLite price history, and retry its failures later
+  python main.py --file hotel_names.txt --sqlite outputs/prices.db
+  python main.py --retry outputs/prices.db
+  
+  # Export results to a Parquet dataset partitioned by scrape date and hotel
+  python main.py --export outputs/*.json --export-dir exports
+  
+  # Continue an interrupted run
+  python main.py --resume hotel_prices_20241220_143022
         """
     )
     
@@ -44,7 +75,124 @@ Examples:
     mode_group.add_argument(
         '--retry', '-r',
         type=str,
-        help='Path to existing JSON output file to retry failed searches'
+        help='Path to existing JSON output file (or SQLite price store) to retry failed searches'
     )
     
-    return parser.parse_args() 
\ No newline at end of file
+    # Resume mode
+    mode_group.add_argument(
+        '--resume',
+        type=str,
+        metavar='RUN_ID',
+        help='Run id (outputs/<run-id>.manifest.json) of an interrupted run to continue'
+    )
+    
+    # Export mode
+    mode_group.add_argument(
+        '--export',
+        type=str,
+        nargs='+',
+        metavar='SOURCE',
+        help='JSON outputs, JSONL streams or SQLite stores to export as a Parquet dataset'
+    )
+    
+    # Parallel scraping
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Number of concurrent browser sessions sharing the (hotel, date) task queue (default: 1)'
+    )
+    
+    # Tabs per browser session
+    parser.add_argument(
+        '--tabs',
+        type=int,
+        default=None,
+        help='Searches each browser session runs at once in separate tabs (default: 1)'
+    )
+    
+    # Speculative prefetch
+    parser.add_argument(
+        '--prefetch',
+        action='store_true',
+        help='Start loading the next date of the same hotel in a second tab while the current search is read'
+    )
+    
+    # Adaptive concurrency
+    parser.add_argument(
+        '--adaptive',
+        action='store_true',
+        help='Treat --workers as an upper bound and adjust the active workers and searches per session '
+             'to the observed success rate, latency and blocks'
+    )
+    
+    # Navigation mode
+    parser.add_argument(
+        '--navigation',
+        choices=['direct', 'ui'],
+        default=None,
+        help='How to reach the results page: "direct" loads the search URL and falls back to the '
+             'search form when needed, "ui" always uses the search form (default: direct)'
+    )
+    
+    # Price extraction mode
+    parser.add_argument(
+        '--extraction',
+        choices=['dom', 'network'],
+        default=None,
+        help='Where to read prices from: "dom" reads the rendered results page, "network" reads the '
+             'responses received by the browser through the DevTools Protocol (default: dom)'
+    )
+    
+    # Destination sweep
+    parser.add_argument(
+        '--destination',
+        type=str,
+        metavar='CITY',
+        help='Search this city or district once per date pair and read all hotels from its results pages '
+             'instead of searching each hotel'
+    )
+    
+    # Fetch backend
+    parser.add_argument(
+        '--fetch',
+        choices=['browser', 'http'],
+        default=None,
+        help='How to load results pages: "browser" always uses a browser session, "http" fetches the '
+             'server-rendered page first and only uses the browser when needed (default: browser)'
+    )
+    
+    # SQLite price store
+    parser.add_argument(
+        '--sqlite',
+        type=str,
+        metavar='DB_PATH',
+        help='Also store every result in this SQLite price history database'
+    )
+    
+    parser.add_argument(
+        '--export-dir',
+        type=str,
+        default=None,
+        help='Root folder of the Parquet dataset written by --export (default: exports)'
+    )
+    
+    # Hotel resolution cache
+    parser.add_argument(
+        '--refresh-resolution',
+        action='store_true',
+        help='Ignore cached hotel resolutions and resolve every hotel through the search form again'
+    )
+    
+    args = parser.parse_args()
+    
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.tabs is not None and args.tabs < 1:
+        parser.error('--tabs must be at least 1')
+    if args.destination and not (args.hotel or args.file):
+        parser.error('--destination needs --hotel or --file (--resume uses the destination of the run)')
+    if args.destination and args.adaptive:
+        parser.error('--adaptive does not apply to --destination sweeps')
+    
+    return args 
\ No newline at end of file
@@ -2,7 +2,18 @@
 Data handling modules for hotel price scraper
 """
 
-from .storage import save_results_to_json
+from .storage import build_output_path, backfill_price_fields
+from .stats import PriceStats
+from .stream import JsonlResultWriter, read_results_stream, finalize_results_stream
+from .checkpoint import (
+    create_run_manifest,
+    update_run_status,
+    load_run_manifest,
+    manifest_dates,
+    load_completed_tasks
+)
+from .sqlite_store import PriceStore, is_sqlite_path
+from .export import export_results_to_parquet, read_price_history
 from .retry import (
     load_failed_searches_from_json, 
     update_json_with_results, 
@@ -10,7 +21,21 @@ from .retry import (
 )
 
 __all__ = [
-    'save_results_to_json',
+    'build_output_path',
+    'backfill_price_fields',
+    'PriceStats',
+    'JsonlResultWriter',
+    'read_results_stream',
+    'finalize_results_stream',
+    'create_run_manifest',
+    'update_run_status',
+    'load_run_manifest',
+    'manifest_dates',
+    'load_completed_tasks',
+    'PriceStore',
+    'is_sqlite_path',
+    'export_results_to_parquet',
+    'read_price_history',
     'load_failed_searches_from_json', 
     'update_json_with_results', 
     'scrape_specific_dates'
@@ -0,0 +1,136 @@
+"""
+Run checkpoints for resuming interrupted scrapes
+"""
+
+import os
+import json
+from datetime import datetime
+
+from .stream import read_results_stream
+
+
+def _manifest_path(stream_path):
+    """Manifest file that goes with a results stream"""
+    return os.path.splitext(stream_path)[0] + '.manifest.json'
+
+
+def _save_manifest(manifest):
+    path = _manifest_path(manifest['stream_path'])
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def create_run_manifest(stream_path, hotel_names, dates_list, hotel_name=None, destination=None, workers=1):
+    """
+    Record the plan of a run next to its results stream
+
+    The manifest holds everything needed to rebuild the task list (hotels,
+    date pairs and how they were searched); the results stream records
+    which tasks finished.
+
+    Args:
+        stream_path (str): Path to the .jsonl results stream of the run
+        hotel_names (list): Hotels of the run
+        dates_list (list): List of (checkin_date, checkout_date) tuples
+        hotel_name (str, optional): Hotel name for single hotel mode
+        destination (str, optional): City searched once per date pair in sweep mode
+        workers (int): Number of parallel workers of the run
+
+    Returns:
+        dict: The saved manifest
+    """
+    manifest = {
+        'run_id': os.path.splitext(os.path.basename(stream_path))[0],
+        'created_at': datetime.now().isoformat(),
+        'updated_at': datetime.now().isoformat(),
+        'status': 'running',
+        'hotel_name': hotel_name,
+        'hotel_names': list(hotel_names),
+        'destination': destination,
+        'workers': workers,
+        'dates': [[str(checkin_date), str(checkout_date)] for checkin_date, checkout_date in dates_list],
+        'stream_path': stream_path,
+        'json_path': os.path.splitext(stream_path)[0] + '.json'
+    }
+    _save_manifest(manifest)
+    print(f'🧾 Run manifest: {_manifest_path(stream_path)} (resume with --resume {manifest["run_id"]})')
+    return manifest
+
+
+def update_run_status(manifest, status):
+    """
+    Update the status of a run (running, interrupted, completed)
+
+    Args:
+        manifest (dict): Manifest returned by create_run_manifest or load_run_manifest
+        status (str): New status
+    """
+    manifest['status'] = status
+    manifest['updated_at'] = datetime.now().isoformat()
+    try:
+        _save_manifest(manifest)
+    except Exception as e:
+        print(f'⚠️ Could not update run manifest: {str(e)}')
+
+
+def load_run_manifest(run_id, output_folder='outputs'):
+    """
+    Load the manifest of an earlier run
+
+    Args:
+        run_id (str): Run id (e.g. hotel_prices_20241220_143022) or path to its manifest
+        output_folder (str): Folder where runs are stored
+
+    Returns:
+        dict or None: Manifest, or None if it could not be loaded
+    """
+    if run_id.endswith('.manifest.json'):
+        path = run_id
+    else:
+        path = os.path.join(output_folder, f'{run_id}.manifest.json')
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f'❌ Run manifest not found: {path}')
+        return None
+    except Exception as e:
+        print(f'❌ Error loading run manifest: {str(e)}')
+        return None
+
+
+def manifest_dates(manifest):
+    """
+    Date pairs of a run as date objects
+
+    Args:
+        manifest (dict): Run manifest
+
+    Returns:
+        list: List of (checkin_date, checkout_date) tuples
+    """
+    return [
+        (datetime.strptime(checkin, '%Y-%m-%d').date(), datetime.strptime(checkout, '%Y-%m-%d').date())
+        for checkin, checkout in manifest['dates']
+    ]
+
+
+def load_completed_tasks(stream_path):
+    """
+    Tasks that already have a result in the run's results stream
+
+    Args:
+        stream_path (str): Path to the .jsonl results stream
+
+    Returns:
+        set: (hotel_name, checkin, checkout) tuples with dates as strings
+    """
+    if not os.path.exists(stream_path):
+        return set()
+    return {
+        (result['hotel_name'], result['checkin'], result['checkout'])
+        for result in read_results_stream(stream_path)
+    }
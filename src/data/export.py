@@ -0,0 +1,224 @@
+"""
+Columnar Parquet export of scrape history for hotel price scraper
+"""
+
+import os
+import json
+from datetime import datetime
+
+from .stream import read_results_stream
+from .sqlite_store import PriceStore, is_sqlite_path
+from ..scraper.errors import classify_result
+from ..utils.files import clean_filename
+from ..utils.prices import add_price_fields, to_major_units
+
+
+AVAILABILITY_VALUES = [
+    'Available',
+    'Not available',
+    'Search failed',
+    'Date selection failed',
+    'Price extraction failed',
+    'Skipped',
+    'Error'
+]
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for the Parquet export"""
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        return pyarrow, pyarrow.dataset
+    except ImportError:
+        print('❌ Parquet export needs pyarrow: pip install pyarrow')
+        return None, None
+
+
+def _load_json_results(path):
+    """Flatten the single or multiple hotels JSON output back into results"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if 'hotel_name' in data:
+        hotels = [data]
+    else:
+        hotels = data.get('hotels', {}).values()
+
+    for hotel_data in hotels:
+        for search in hotel_data.get('searches', []):
+            yield {
+                'hotel_name': hotel_data['hotel_name'],
+                'checkin': search['checkin_date'],
+                'checkout': search['checkout_date'],
+                'price': search.get('price'),
+                'price_amount': search.get('price_amount'),
+                'price_currency': search.get('price_currency'),
+                'taxes_amount': search.get('taxes_amount'),
+                'availability': search.get('availability'),
+                'error': search.get('error'),
+                'error_class': search.get('error_class'),
+                'timestamp': search.get('timestamp')
+            }
+
+
+def load_results(source):
+    """
+    Read the results of a JSON output file, a JSONL results stream or a SQLite price store
+
+    Args:
+        source (str): Path to the .json, .jsonl or .db file
+
+    Returns:
+        list: Result dictionaries
+    """
+    if source.endswith('.jsonl'):
+        return list(read_results_stream(source))
+    if is_sqlite_path(source):
+        store = PriceStore(source)
+        try:
+            return list(store.iter_results())
+        finally:
+            store.close()
+    return list(_load_json_results(source))
+
+
+def _to_date(value):
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def _results_to_table(pa, results):
+    """Build a typed Arrow table (plus partition columns) from result dictionaries"""
+    # Results scraped before numeric prices were stored get them parsed here
+    add_price_fields(results)
+
+    columns = {name: [] for name in (
+        'hotel_name', 'checkin', 'checkout', 'nights', 'price', 'price_amount', 'taxes_amount', 'currency', 'price_text',
+        'availability', 'error', 'error_class', 'scraped_at', 'scrape_date', 'hotel'
+    )}
+
+    for result in results:
+        checkin = _to_date(result['checkin'])
+        checkout = _to_date(result['checkout'])
+        scraped_at = datetime.fromisoformat(result['timestamp']) if result.get('timestamp') else datetime.now()
+        amount = result['price_amount']
+        currency = result['price_currency']
+        availability = result.get('availability')
+
+        columns['hotel_name'].append(result['hotel_name'])
+        columns['checkin'].append(checkin)
+        columns['checkout'].append(checkout)
+        columns['nights'].append((checkout - checkin).days)
+        columns['price'].append(to_major_units(amount, currency) if amount is not None else None)
+        columns['price_amount'].append(amount)
+        columns['taxes_amount'].append(result.get('taxes_amount'))
+        columns['currency'].append(currency)
+        columns['price_text'].append(result.get('price'))
+        columns['availability'].append(availability if availability in AVAILABILITY_VALUES else 'Error')
+        columns['error'].append(result.get('error'))
+        columns['error_class'].append(classify_result(result))
+        columns['scraped_at'].append(scraped_at)
+        columns['scrape_date'].append(scraped_at.date())
+        columns['hotel'].append(clean_filename(result['hotel_name']))
+
+    availability = pa.DictionaryArray.from_arrays(
+        pa.array([AVAILABILITY_VALUES.index(value) for value in columns['availability']], type=pa.int8()),
+        pa.array(AVAILABILITY_VALUES)
+    )
+
+    return pa.table({
+        'hotel_name': pa.array(columns['hotel_name'], type=pa.string()),
+        'checkin': pa.array(columns['checkin'], type=pa.date32()),
+        'checkout': pa.array(columns['checkout'], type=pa.date32()),
+        'nights': pa.array(columns['nights'], type=pa.int16()),
+        'price': pa.array(columns['price'], type=pa.float64()),
+        'price_amount': pa.array(columns['price_amount'], type=pa.int64()),
+        'taxes_amount': pa.array(columns['taxes_amount'], type=pa.int64()),
+        'currency': pa.array(columns['currency'], type=pa.string()).dictionary_encode(),
+        'price_text': pa.array(columns['price_text'], type=pa.string()),
+        'availability': availability,
+        'error': pa.array(columns['error'], type=pa.string()),
+        'error_class': pa.array(columns['error_class'], type=pa.string()).dictionary_encode(),
+        'scraped_at': pa.array(columns['scraped_at'], type=pa.timestamp('us')),
+        'scrape_date': pa.array(columns['scrape_date'], type=pa.date32()),
+        'hotel': pa.array(columns['hotel'], type=pa.string())
+    })
+
+
+def _partitioning(pa, ds):
+    return ds.partitioning(
+        pa.schema([('scrape_date', pa.date32()), ('hotel', pa.string())]),
+        flavor='hive'
+    )
+
+
+def export_results_to_parquet(sources, output_dir='exports'):
+    """
+    Export scrape results as a Parquet dataset partitioned by scrape date and hotel
+
+    Files are laid out as <output_dir>/scrape_date=YYYY-MM-DD/hotel=<hotel>/<source>-N.parquet.
+    Exporting the same source again overwrites its files instead of duplicating rows.
+
+    Args:
+        sources (list): Paths to JSON output files, JSONL results streams or SQLite price stores
+        output_dir (str): Root folder of the Parquet dataset
+
+    Returns:
+        int or None: Number of exported rows, or None if the export failed
+    """
+    pa, ds = _import_pyarrow()
+    if pa is None:
+        return None
+
+    exported = 0
+    for source in sources:
+        try:
+            results = load_results(source)
+        except Exception as e:
+            print(f'❌ Could not read {source}: {str(e)}')
+            continue
+
+        if not results:
+            print(f'⚠️ No results in {source}')
+            continue
+
+        table = _results_to_table(pa, results)
+        source_name = clean_filename(os.path.splitext(os.path.basename(source))[0])
+        ds.write_dataset(
+            table,
+            output_dir,
+            format='parquet',
+            partitioning=_partitioning(pa, ds),
+            basename_template=f'{source_name}-{{i}}.parquet',
+            existing_data_behavior='overwrite_or_ignore'
+        )
+        exported += table.num_rows
+        print(f'📦 Exported {table.num_rows} results from {source}')
+
+    return exported
+
+
+def read_price_history(output_dir, hotel_name, since=None, until=None):
+    """
+    Read the exported history of one hotel, touching only its partitions
+
+    Args:
+        output_dir (str): Root folder of the Parquet dataset
+        hotel_name (str): Hotel name
+        since (date or str, optional): First scrape date to include
+        until (date or str, optional): Last scrape date to include
+
+    Returns:
+        pyarrow.Table or None: Matching rows, or None if pyarrow is missing
+    """
+    pa, ds = _import_pyarrow()
+    if pa is None:
+        return None
+
+    dataset = ds.dataset(output_dir, format='parquet', partitioning=_partitioning(pa, ds))
+    condition = ds.field('hotel') == clean_filename(hotel_name)
+    if since is not None:
+        condition = condition & (ds.field('scrape_date') >= pa.scalar(_to_date(since), type=pa.date32()))
+    if until is not None:
+        condition = condition & (ds.field('scrape_date') <= pa.scalar(_to_date(until), type=pa.date32()))
+    return dataset.to_table(filter=condition)
@@ -0,0 +1,136 @@
+"""
+Streaming JSON reading and writing for large result files
+"""
+
+import json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def walk_json(f, descend):
+    """
+    Walk a JSON document piece by piece
+
+    Containers for which descend(path) is true are walked into; every other
+    value is built and yielded whole. With ijson installed only the value
+    being built is kept in memory, otherwise the document is loaded first.
+
+    Args:
+        f: File object opened for reading (binary mode is fastest with ijson)
+        descend (callable): Called with the path tuple of a container (keys and
+            list indexes from the root), True to walk into it
+
+    Yields:
+        tuple: ('start', path, 'map' or 'array'), ('value', path, value) or ('end', path, kind)
+    """
+    if ijson is None:
+        yield from _walk_value(json.load(f), (), descend)
+    else:
+        yield from _walk_events(ijson.basic_parse(f, use_float=True), descend)
+
+
+def _walk_value(value, path, descend):
+    if isinstance(value, (dict, list)) and descend(path):
+        kind = 'map' if isinstance(value, dict) else 'array'
+        yield ('start', path, kind)
+        items = value.items() if kind == 'map' else enumerate(value)
+        for key, item in items:
+            yield from _walk_value(item, path + (key,), descend)
+        yield ('end', path, kind)
+    else:
+        yield ('value', path, value)
+
+
+def _walk_events(events, descend):
+    # Frames of the containers being walked: [path, kind, key of the next child]
+    stack = []
+    for event, value in events:
+        if event == 'map_key':
+            stack[-1][2] = value
+            continue
+
+        if event in ('end_map', 'end_array'):
+            path, kind, _ = stack.pop()
+            yield ('end', path, kind)
+            _advance(stack)
+            continue
+
+        path = stack[-1][0] + (stack[-1][2],) if stack else ()
+        if event in ('start_map', 'start_array'):
+            kind = 'map' if event == 'start_map' else 'array'
+            if descend(path):
+                yield ('start', path, kind)
+                stack.append([path, kind, 0 if kind == 'array' else None])
+                continue
+            value = _build_value(event, events)
+
+        yield ('value', path, value)
+        _advance(stack)
+
+
+def _advance(stack):
+    """Move an array frame to the index of its next item"""
+    if stack and stack[-1][1] == 'array':
+        stack[-1][2] += 1
+
+
+def _build_value(first_event, events):
+    """Consume the events of one container and return it as a Python object"""
+    builder = ijson.common.ObjectBuilder()
+    builder.event(first_event, None)
+    depth = 1
+    for event, value in events:
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+            if depth == 0:
+                break
+    return builder.value
+
+
+class IndentedJsonWriter:
+    """
+    Write a JSON document piece by piece
+
+    The output is formatted exactly like json.dump(..., indent=2,
+    ensure_ascii=False), so streamed files look the same as before.
+    """
+
+    def __init__(self, f, indent=2):
+        self._file = f
+        self._indent = ' ' * indent
+        # One [kind, is_empty] entry per open container
+        self._stack = []
+
+    def _begin_item(self, key):
+        if self._stack:
+            frame = self._stack[-1]
+            self._file.write('\n' if frame[1] else ',\n')
+            frame[1] = False
+            self._file.write(self._indent * len(self._stack))
+            if frame[0] == 'map':
+                self._file.write(json.dumps(key, ensure_ascii=False) + ': ')
+
+    def start(self, key, kind):
+        """Open a map or array (key is ignored inside arrays and at the root)"""
+        self._begin_item(key)
+        self._file.write('{' if kind == 'map' else '[')
+        self._stack.append([kind, True])
+
+    def value(self, key, value):
+        """Write a complete value"""
+        self._begin_item(key)
+        text = json.dumps(value, indent=len(self._indent), ensure_ascii=False)
+        self._file.write(text.replace('\n', '\n' + self._indent * len(self._stack)))
+
+    def end(self):
+        """Close the innermost open container"""
+        kind, is_empty = self._stack.pop()
+        if not is_empty:
+            self._file.write('\n' + self._indent * len(self._stack))
+        self._file.write('}' if kind == 'map' else ']')
@@ -3,66 +3,98 @@ Retry functionality for failed hotel price searches
 """
 
 import os
-import json
 from datetime import datetime
 
 from ..scraper.core import scrape_single_hotel
+from ..scraper.errors import classify_result, is_failed_result
+from ..utils.prices import result_price
+from .json_stream import walk_json, IndentedJsonWriter
+from .stats import PriceStats
+
+
+_SUMMARY_COUNTERS = ('successful_prices', 'not_available', 'errors')
+
+
+def _is_result_container(path):
+    """Containers walked into when streaming a result file: everything down to single searches"""
+    return (
+        path == () or
+        path == ('hotels',) or
+        (len(path) == 2 and path[0] == 'hotels') or
+        path[-1:] == ('searches',)
+    )
+
+
+def _hotel_key(path):
+    """Key of the hotel a path belongs to (None in the single hotel structure)"""
+    return path[1] if path[0] == 'hotels' else None
+
+
+def _search_key(hotel_name, search):
+    return (hotel_name, search['checkin_date'], search['checkout_date'])
 
 
 def load_failed_searches_from_json(json_file_path):
     """
     Load failed searches from existing JSON file
     
+    The file is stream-parsed: only the failed searches, the metadata and a
+    running summary per hotel are kept, never the full list of searches.
+    
     Args:
         json_file_path (str): Path to the JSON file
         
     Returns:
-        tuple: (original_json_data, failed_searches)
+        tuple: (retry_index, failed_searches), the retry index being what
+            update_json_with_results needs to merge the retry results
     """
     try:
         if not os.path.exists(json_file_path):
             print(f'❌ JSON file not found: {json_file_path}')
             return None, []
         
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        failed_searches = []
-        hotel_name = None
+        retry_index = {
+            'metadata': {},
+            'hotels': {},
+            'failed': {}
+        }
         
-        # Check if it's single hotel or multiple hotels structure
-        if 'hotel_name' in data:
-            # Single hotel structure
-            hotel_name = data['hotel_name']
-            searches = data.get('searches', [])
-            
-            for search in searches:
-                if _is_search_failed(search):
-                    failed_searches.append({
-                        'hotel_name': hotel_name,
-                        'checkin_date': search['checkin_date'],
-                        'checkout_date': search['checkout_date'],
-                        'original_error': search.get('error'),
-                        'original_availability': search.get('availability')
-                    })
-        
-        elif 'hotels' in data:
-            # Multiple hotels structure
-            hotels = data.get('hotels', {})
-            
-            for hotel_key, hotel_data in hotels.items():
-                hotel_name = hotel_data.get('hotel_name', hotel_key)
-                searches = hotel_data.get('searches', [])
+        with open(json_file_path, 'rb') as f:
+            for event, path, value in walk_json(f, _is_result_container):
+                if event != 'value':
+                    continue
+                if path == ('metadata',):
+                    retry_index['metadata'] = value
+                    continue
+                
+                hotel = retry_index['hotels'].setdefault(_hotel_key(path), {
+                    'hotel_name': _hotel_key(path),
+                    'summary': {},
+                    'counts': dict.fromkeys(_SUMMARY_COUNTERS, 0),
+                    'stats': PriceStats()
+                })
+                field = path[-1] if path[-2:-1] != ('searches',) else 'search'
                 
-                for search in searches:
-                    if _is_search_failed(search):
-                        failed_searches.append({
-                            'hotel_name': hotel_name,
-                            'checkin_date': search['checkin_date'],
-                            'checkout_date': search['checkout_date'],
-                            'original_error': search.get('error'),
-                            'original_availability': search.get('availability')
-                        })
+                if field == 'hotel_name':
+                    hotel['hotel_name'] = value
+                elif field == 'summary':
+                    hotel['summary'] = value
+                elif field == 'search':
+                    if is_failed_result(value):
+                        key = _search_key(hotel['hotel_name'], value)
+                        retry_index['failed'][key] = (_hotel_key(path), value)
+                    else:
+                        # Searches that will not be retried form the base of the new summary
+                        _count_search(hotel, value)
+        
+        failed_searches = [{
+            'hotel_name': hotel_name,
+            'checkin_date': checkin_date,
+            'checkout_date': checkout_date,
+            'original_error': search.get('error'),
+            'original_error_class': classify_result(search),
+            'original_availability': search.get('availability')
+        } for (hotel_name, checkin_date, checkout_date), (_, search) in retry_index['failed'].items()]
         
         print(f'📖 Loaded JSON file: {json_file_path}')
         print(f'🔍 Found {len(failed_searches)} failed searches to retry')
@@ -73,173 +105,146 @@ def load_failed_searches_from_json(json_file_path):
                 print(f'   {i}. {search["hotel_name"]} - {search["checkin_date"]} → {search["checkout_date"]} '
                       f'(was: {search["original_availability"]})')
         
-        return data, failed_searches
+        return retry_index, failed_searches
         
     except Exception as e:
         print(f'❌ Error loading JSON file: {str(e)}')
         return None, []
 
 
-def _is_search_failed(search):
-    """
-    Determine if a search is considered failed and should be retried
-    
-    Args:
-        search (dict): Search result dictionary
-        
-    Returns:
-        bool: True if search failed, False otherwise
-    """
-    # Consider a search failed if:
-    # 1. It has an error (technical failure)
-    # 2. Price is None and availability indicates failure (not just "Not available")
-    return (
-        search.get('error') is not None or
-        (search.get('price') is None and 
-         search.get('availability') in ['Search failed', 'Date selection failed', 'Price extraction failed', 'Error'])
-    )
+def _summary_category(search):
+    """Summary counter a search is counted in, as in the JSON summary builder"""
+    if search.get('price') and 'Not available' not in str(search.get('price')):
+        return 'successful_prices'
+    if search.get('availability') == 'Not available':
+        return 'not_available'
+    return 'errors'
+
+
+def _count_search(hotel, search):
+    """Add a search to the running counters and price statistics of a hotel"""
+    category = _summary_category(search)
+    hotel['counts'][category] += 1
+    if category == 'successful_prices':
+        price_num = result_price(search)
+        if price_num is not None:
+            hotel['stats'].add(price_num)
+
+
+def _updated_search(search, retry_result):
+    """Copy of a search entry with the outcome of its retry"""
+    search = dict(search)
+    search['price'] = retry_result['price']
+    search['price_amount'] = retry_result.get('price_amount')
+    search['price_currency'] = retry_result.get('price_currency')
+    search['taxes_amount'] = retry_result.get('taxes_amount')
+    search['availability'] = retry_result['availability']
+    search['error'] = retry_result['error']
+    search['error_class'] = retry_result.get('error_class')
+    search['timestamp'] = datetime.now().isoformat()
+    return search
+
+
+def _updated_summary(hotel):
+    """New summary of a hotel from its counters and price statistics"""
+    summary = dict(hotel['summary'])
+    summary.pop('prices', None)
+    summary.update(hotel['counts'])
+    if summary.get('total_searches', 0) > 0:
+        summary['success_rate'] = (summary['successful_prices'] / summary['total_searches']) * 100
+    summary.update(hotel['stats'].summary_fields())
+    return summary
 
 
 def update_json_with_results(original_json_data, retry_results, json_file_path):
     """
     Update the original JSON file with retry results
     
+    The file is streamed into a temporary file next to it, replacing the
+    retried searches, the summaries and the metadata, and then renamed over
+    the original, so an interrupted update never leaves a half-written file.
+    
     Args:
-        original_json_data (dict): Original JSON data
+        original_json_data (dict): Retry index returned by load_failed_searches_from_json
         retry_results (list): List of retry results
         json_file_path (str): Path to the JSON file
         
     Returns:
         bool: True if update successful, False otherwise
     """
+    tmp_path = f'{json_file_path}.tmp'
     try:
         if not retry_results:
             print('❌ No retry results to update')
             return False
         
-        # Create a lookup dictionary for quick access to retry results
-        retry_lookup = {}
-        for result in retry_results:
-            key = f"{result['hotel_name']}_{result['checkin']}_{result['checkout']}"
-            retry_lookup[key] = result
+        retry_lookup = {
+            (result['hotel_name'], result['checkin'], result['checkout']): result
+            for result in retry_results
+        }
+        
+        # Every failed search ends up in the summary, retried or not
+        updated_searches = {}
+        for key, (hotel_key, search) in original_json_data['failed'].items():
+            if key in retry_lookup:
+                search = _updated_search(search, retry_lookup[key])
+                updated_searches[key] = search
+            _count_search(original_json_data['hotels'][hotel_key], search)
         
-        updated_count = 0
+        summaries = {hotel_key: _updated_summary(hotel) for hotel_key, hotel in original_json_data['hotels'].items()}
+        metadata = _updated_metadata(original_json_data['metadata'], summaries)
         
-        # Update the JSON data structure
-        if 'hotel_name' in original_json_data:
-            updated_count = _update_single_hotel_json(original_json_data, retry_lookup)
-        elif 'hotels' in original_json_data:
-            updated_count = _update_multiple_hotels_json(original_json_data, retry_lookup)
+        with open(json_file_path, 'rb') as source, open(tmp_path, 'w', encoding='utf-8') as target:
+            writer = IndentedJsonWriter(target)
+            for event, path, value in walk_json(source, _is_result_container):
+                key = path[-1] if path else None
+                if event == 'start':
+                    writer.start(key, value)
+                    continue
+                if event == 'end':
+                    writer.end()
+                    continue
+                
+                if path == ('metadata',):
+                    value = metadata
+                elif key == 'summary':
+                    value = summaries[_hotel_key(path)]
+                elif path[-2:-1] == ('searches',):
+                    hotel_name = original_json_data['hotels'][_hotel_key(path)]['hotel_name']
+                    value = updated_searches.get(_search_key(hotel_name, value), value)
+                writer.value(key, value)
         
-        # Save the updated JSON file
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump(original_json_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, json_file_path)
         
-        print(f'✅ Updated {updated_count} searches in {json_file_path}')
+        print(f'✅ Updated {len(updated_searches)} searches in {json_file_path}')
         return True
         
     except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         print(f'❌ Error updating JSON file: {str(e)}')
         return False
 
 
-def _update_single_hotel_json(json_data, retry_lookup):
-    """Update single hotel JSON structure with retry results"""
-    updated_count = 0
-    searches = json_data.get('searches', [])
-    
-    for search in searches:
-        key = f"{json_data['hotel_name']}_{search['checkin_date']}_{search['checkout_date']}"
-        
-        if key in retry_lookup:
-            retry_result = retry_lookup[key]
-            # Update the search entry
-            search['price'] = retry_result['price']
-            search['availability'] = retry_result['availability']
-            search['error'] = retry_result['error']
-            search['timestamp'] = datetime.now().isoformat()
-            updated_count += 1
-    
-    # Recalculate summary statistics
-    _recalculate_summary_stats(json_data, searches)
-    
-    return updated_count
+def _updated_metadata(metadata, summaries):
+    """Metadata with the overall counters recomputed from the hotel summaries"""
+    metadata = dict(metadata)
+    total_successful = sum(summary['successful_prices'] for summary in summaries.values())
+    total_searches = metadata.get('total_searches', 0)
+    metadata['total_successful'] = total_successful
+    metadata['overall_success_rate'] = (total_successful / total_searches * 100) if total_searches > 0 else 0
+    metadata['last_updated'] = datetime.now().isoformat()
+    return metadata
 
 
-def _update_multiple_hotels_json(json_data, retry_lookup):
-    """Update multiple hotels JSON structure with retry results"""
-    updated_count = 0
-    hotels = json_data.get('hotels', {})
-    
-    for hotel_key, hotel_data in hotels.items():
-        searches = hotel_data.get('searches', [])
-        
-        for search in searches:
-            key = f"{hotel_data['hotel_name']}_{search['checkin_date']}_{search['checkout_date']}"
-            
-            if key in retry_lookup:
-                retry_result = retry_lookup[key]
-                # Update the search entry
-                search['price'] = retry_result['price']
-                search['availability'] = retry_result['availability']
-                search['error'] = retry_result['error']
-                search['timestamp'] = datetime.now().isoformat()
-                updated_count += 1
-        
-        # Recalculate summary for this hotel
-        _recalculate_summary_stats(hotel_data, searches)
-    
-    # Update overall metadata
-    total_successful = sum(h['summary']['successful_prices'] for h in hotels.values())
-    total_searches = json_data['metadata']['total_searches']
-    json_data['metadata']['total_successful'] = total_successful
-    json_data['metadata']['overall_success_rate'] = (total_successful / total_searches * 100) if total_searches > 0 else 0
-    json_data['metadata']['last_updated'] = datetime.now().isoformat()
-    
-    return updated_count
-
-
-def _recalculate_summary_stats(data_container, searches):
-    """Recalculate summary statistics for a hotel"""
-    summary = data_container.get('summary', {})
-    summary['successful_prices'] = len([s for s in searches if s.get('price') and 'Not available' not in str(s.get('price'))])
-    summary['not_available'] = len([s for s in searches if s.get('availability') == 'Not available'])
-    summary['errors'] = len([s for s in searches if s.get('error') is not None])
-    
-    if summary.get('total_searches', 0) > 0:
-        summary['success_rate'] = (summary['successful_prices'] / summary['total_searches']) * 100
-    
-    # Recalculate price statistics
-    prices = []
-    for search in searches:
-        if search.get('price') and 'Not available' not in str(search.get('price')):
-            try:
-                price_str = str(search['price']).replace('COP', '').replace(',', '').strip()
-                price_num = float(''.join(filter(str.isdigit, price_str)))
-                prices.append(price_num)
-            except:
-                pass
-    
-    summary['prices'] = prices
-    if prices:
-        summary['min_price'] = min(prices)
-        summary['max_price'] = max(prices)
-        summary['avg_price'] = sum(prices) / len(prices)
-    
-    # Update metadata if it exists
-    if 'metadata' in data_container:
-        data_container['metadata']['total_successful'] = summary['successful_prices']
-        data_container['metadata']['overall_success_rate'] = summary['success_rate']
-        data_container['metadata']['last_updated'] = datetime.now().isoformat()
-
-
-def scrape_specific_dates(hotel_name, failed_searches):
+def scrape_specific_dates(hotel_name, failed_searches, on_result=None):
     """
     Scrape specific hotel and date combinations for retry
     
     Args:
         hotel_name (str): Name of the hotel
         failed_searches (list): List of failed search dictionaries
+        on_result (callable, optional): Called with each result as soon as it is produced
         
     Returns:
         list: List of retry results
@@ -271,4 +276,14 @@ def scrape_specific_dates(hotel_name, failed_searches):
         return []
     
     # Use the existing single hotel scraper
-    return scrape_single_hotel(hotel_name, dates_list) 
\ No newline at end of file
+    if on_result is None:
+        return scrape_single_hotel(hotel_name, dates_list)
+    
+    results = []
+    
+    def record_result(result):
+        results.append(result)
+        on_result(result)
+    
+    scrape_single_hotel(hotel_name, dates_list, on_result=record_result)
+    return results 
\ No newline at end of file
@@ -0,0 +1,245 @@
+"""
+SQLite price store for hotel price scraper
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from ..scraper.errors import is_failed_result
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT,
+    hotel_name TEXT NOT NULL,
+    checkin TEXT NOT NULL,
+    checkout TEXT NOT NULL,
+    price TEXT,
+    price_amount INTEGER,
+    price_currency TEXT,
+    taxes_amount INTEGER,
+    availability TEXT,
+    error TEXT,
+    error_class TEXT,
+    failed INTEGER NOT NULL,
+    scraped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_searches_hotel_stay_time
+    ON searches (hotel_name, checkin, checkout, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_searches_failed
+    ON searches (hotel_name, checkin, checkout) WHERE failed = 1;
+"""
+
+_COLUMNS = (
+    'run_id', 'hotel_name', 'checkin', 'checkout', 'price', 'price_amount', 'price_currency',
+    'taxes_amount', 'availability', 'error', 'error_class', 'failed', 'scraped_at'
+)
+
+# Columns added after the first version of the schema, created on open when missing
+_ADDED_COLUMNS = {
+    'price_amount': 'INTEGER',
+    'price_currency': 'TEXT',
+    'error_class': 'TEXT',
+    'taxes_amount': 'INTEGER'
+}
+
+
+def is_sqlite_path(path):
+    """Check if a path points to a SQLite price store"""
+    return os.path.splitext(path)[1].lower() in ('.db', '.sqlite', '.sqlite3')
+
+
+class PriceStore:
+    """
+    History of every search result, kept in a SQLite database
+
+    Results are buffered and inserted in one transaction per flush (every
+    `batch_size` results and on close). Rows are never updated: each search,
+    including retries, adds a row, so the history of a stay is the set of
+    rows for (hotel, checkin, checkout) ordered by scrape time.
+    """
+
+    def __init__(self, path, run_id=None, batch_size=50):
+        self.path = path
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending = []
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # Writes come from worker threads, all of them serialized by self._lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self):
+        existing = {row['name'] for row in self._conn.execute('PRAGMA table_info(searches)')}
+        with self._conn:
+            for name, column_type in _ADDED_COLUMNS.items():
+                if name not in existing:
+                    self._conn.execute(f'ALTER TABLE searches ADD COLUMN {name} {column_type}')
+
+    def write(self, result):
+        """
+        Queue one result for insertion
+
+        Args:
+            result (dict): Result of a single search
+        """
+        row = (
+            self.run_id,
+            result['hotel_name'],
+            str(result['checkin']),
+            str(result['checkout']),
+            result['price'],
+            result.get('price_amount'),
+            result.get('price_currency'),
+            result.get('taxes_amount'),
+            result['availability'],
+            result['error'],
+            result.get('error_class'),
+            int(is_failed_result(result)),
+            result.get('timestamp') or datetime.now().isoformat()
+        )
+        with self._lock:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def flush(self):
+        """Insert all queued results in a single transaction"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                f'INSERT INTO searches ({", ".join(_COLUMNS)}) VALUES ({", ".join("?" * len(_COLUMNS))})',
+                self._pending
+            )
+        self._pending = []
+
+    def close(self):
+        """Flush queued results and close the database"""
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            self._flush()
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def hotels(self):
+        """
+        Hotels with at least one stored search
+
+        Returns:
+            list: Hotel names in alphabetical order
+        """
+        return [row['hotel_name'] for row in self._query(
+            'SELECT DISTINCT hotel_name FROM searches ORDER BY hotel_name'
+        )]
+
+    def price_history(self, hotel_name, checkin, checkout):
+        """
+        Every result stored for one stay, oldest first
+
+        Args:
+            hotel_name (str): Hotel name
+            checkin (str): Check-in date (YYYY-MM-DD)
+            checkout (str): Check-out date (YYYY-MM-DD)
+
+        Returns:
+            list: Row dictionaries ordered by scraped_at
+        """
+        return self._query(
+            'SELECT * FROM searches WHERE hotel_name = ? AND checkin = ? AND checkout = ? '
+            'ORDER BY scraped_at',
+            (hotel_name, str(checkin), str(checkout))
+        )
+
+    def latest_results(self, hotel_name, checkin_from=None, checkin_to=None):
+        """
+        Most recent result of each stay of a hotel
+
+        Args:
+            hotel_name (str): Hotel name
+            checkin_from (str, optional): First check-in date to include (YYYY-MM-DD)
+            checkin_to (str, optional): Last check-in date to include (YYYY-MM-DD)
+
+        Returns:
+            list: Row dictionaries ordered by check-in date
+        """
+        return self._query(
+            'SELECT s.* FROM searches s WHERE s.hotel_name = ? '
+            'AND s.checkin >= ? AND s.checkin <= ? '
+            'AND s.scraped_at = (SELECT MAX(scraped_at) FROM searches '
+            '    WHERE hotel_name = s.hotel_name AND checkin = s.checkin AND checkout = s.checkout) '
+            'ORDER BY s.checkin, s.checkout',
+            (hotel_name, str(checkin_from or ''), str(checkin_to or '9999-12-31'))
+        )
+
+    def iter_results(self):
+        """
+        Every stored search as a result dictionary, oldest first
+
+        Yields:
+            dict: hotel_name, checkin, checkout, price, price_amount, price_currency,
+                taxes_amount, availability, error, error_class and timestamp
+        """
+        for row in self._query('SELECT * FROM searches ORDER BY scraped_at'):
+            yield {
+                'hotel_name': row['hotel_name'],
+                'checkin': row['checkin'],
+                'checkout': row['checkout'],
+                'price': row['price'],
+                'price_amount': row['price_amount'],
+                'price_currency': row['price_currency'],
+                'taxes_amount': row['taxes_amount'],
+                'availability': row['availability'],
+                'error': row['error'],
+                'error_class': row['error_class'],
+                'timestamp': row['scraped_at']
+            }
+
+    def failed_searches(self, hotel_name=None):
+        """
+        Stays whose most recent result failed and should be retried
+
+        Args:
+            hotel_name (str, optional): Only return failures of this hotel
+
+        Returns:
+            list: Failed search dictionaries in the format used by the retry mode
+        """
+        sql = (
+            'SELECT s.hotel_name, s.checkin, s.checkout, s.error, s.error_class, s.availability FROM searches s '
+            'WHERE s.failed = 1 '
+            'AND s.scraped_at = (SELECT MAX(scraped_at) FROM searches '
+            '    WHERE hotel_name = s.hotel_name AND checkin = s.checkin AND checkout = s.checkout)'
+        )
+        params = ()
+        if hotel_name:
+            sql += ' AND s.hotel_name = ?'
+            params = (hotel_name,)
+        sql += ' ORDER BY s.hotel_name, s.checkin, s.checkout'
+
+        return [{
+            'hotel_name': row['hotel_name'],
+            'checkin_date': row['checkin'],
+            'checkout_date': row['checkout'],
+            'original_error': row['error'],
+            'original_error_class': row['error_class'],
+            'original_availability': row['availability']
+        } for row in self._query(sql, params)]
@@ -0,0 +1,165 @@
+"""
+Incremental price statistics for hotel price scraper
+"""
+
+import math
+
+
+class PriceStats:
+    """
+    Running price statistics that never keep the individual prices
+
+    count, min, max, mean and variance are updated in constant time per price
+    (Welford's algorithm). Percentiles come from a log-bucket sketch: each
+    price is counted in the bucket of its logarithm, so a percentile is within
+    `relative_accuracy` of the exact value while the sketch stays a few dozen
+    buckets for any realistic price range. Two PriceStats (e.g. two hotels or
+    two runs) merge into the statistics of the combined prices.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._buckets = {}
+        self._zeros = 0
+
+    def add(self, value):
+        """
+        Add one price
+
+        Args:
+            value (float): Price in major units
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        if value <= 0:
+            self._zeros += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def merge(self, other):
+        """
+        Add all prices summarized by another PriceStats
+
+        Args:
+            other (PriceStats): Statistics with the same relative accuracy
+        """
+        if other.count == 0:
+            return
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError('Cannot merge price statistics with different accuracies')
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._zeros += other._zeros
+        for index, bucket_count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + bucket_count
+
+    @property
+    def variance(self):
+        """Sample variance, or None with fewer than two prices"""
+        return self._m2 / (self.count - 1) if self.count > 1 else None
+
+    @property
+    def stddev(self):
+        """Sample standard deviation, or None with fewer than two prices"""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    def quantile(self, q):
+        """
+        Approximate price at a quantile
+
+        Args:
+            q (float): Quantile between 0 and 1 (0.5 for the median)
+
+        Returns:
+            float or None: Price, or None if there are no prices
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Middle of the bucket, clamped to the prices actually seen
+                value = 2 * self._gamma ** index / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def to_dict(self):
+        """
+        Serializable state, restored with from_dict
+
+        Returns:
+            dict: Counters and sketch buckets
+        """
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean,
+            'm2': self._m2,
+            'zeros': self._zeros,
+            'buckets': {str(index): bucket_count for index, bucket_count in sorted(self._buckets.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Rebuild statistics saved with to_dict
+
+        Args:
+            state (dict): Output of to_dict
+
+        Returns:
+            PriceStats: Restored statistics
+        """
+        stats = cls(state.get('relative_accuracy', 0.01))
+        stats.count = state['count']
+        stats.min = state['min']
+        stats.max = state['max']
+        stats.mean = state['mean']
+        stats._m2 = state['m2']
+        stats._zeros = state.get('zeros', 0)
+        stats._buckets = {int(index): bucket_count for index, bucket_count in state['buckets'].items()}
+        return stats
+
+    def summary_fields(self):
+        """
+        Price fields shown in the JSON summaries
+
+        Returns:
+            dict: min_price, max_price, avg_price, price_stddev, p50_price, p90_price and price_stats
+        """
+        return {
+            'min_price': self.min,
+            'max_price': self.max,
+            'avg_price': self.mean if self.count else None,
+            'price_stddev': self.stddev,
+            'p50_price': self.quantile(0.5),
+            'p90_price': self.quantile(0.9),
+            'price_stats': self.to_dict()
+        }
@@ -0,0 +1,212 @@
+"""
+Streaming result storage for hotel price scraper
+"""
+
+import os
+import json
+import time
+import threading
+
+from .json_stream import IndentedJsonWriter
+from .stats import PriceStats
+from .storage import (
+    build_search_entry,
+    new_hotel_summary,
+    count_search,
+    finish_hotel_summary,
+    build_metadata,
+    print_json_summary
+)
+
+
+class JsonlResultWriter:
+    """
+    Append-only JSON Lines file that receives each result as soon as it is produced
+
+    Every result is written and flushed immediately, so a crash of the
+    scraper loses nothing that was already handed to the OS. fsync calls are
+    batched (every `fsync_every` results or `fsync_interval` seconds) so the
+    run is durable against power loss without paying a disk sync per search.
+    """
+
+    def __init__(self, path, fsync_every=20, fsync_interval=5.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._closed = False
+
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, result):
+        """
+        Append one result dictionary to the stream
+
+        Args:
+            result (dict): Result of a single search
+        """
+        line = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            if self._closed:
+                return
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.count += 1
+            self._unsynced += 1
+            if (self._unsynced >= self.fsync_every or
+                    time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the stream; later writes are ignored"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._file.flush()
+            self._sync()
+            self._file.close()
+
+
+def read_results_stream(path):
+    """
+    Iterate over the results stored in a JSON Lines file
+
+    A truncated last line (e.g. from a crash mid-write) is skipped.
+
+    Args:
+        path (str): Path to the .jsonl file
+
+    Yields:
+        dict: One result dictionary per search
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f'⚠️ Skipping unreadable line {line_num} in {path}')
+
+
+def _index_results_stream(path):
+    """
+    Summaries of every hotel and the position of each of its results, in one pass over a stream
+
+    Returns:
+        dict: Hotel name -> {'summary', 'stats', 'searches': [(checkin, checkout, offset)]},
+            in first-seen order
+    """
+    hotels = {}
+    with open(path, 'rb') as f:
+        offset = 0
+        for line_num, line in enumerate(f, 1):
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                result = json.loads(line)
+            except ValueError:
+                print(f'⚠️ Skipping unreadable line {line_num} in {path}')
+                continue
+
+            hotel = hotels.get(result['hotel_name'])
+            if hotel is None:
+                hotel = hotels[result['hotel_name']] = {
+                    'summary': new_hotel_summary(), 'stats': PriceStats(), 'searches': []
+                }
+            count_search(hotel['summary'], hotel['stats'], result)
+            hotel['searches'].append((result['checkin'], result['checkout'], line_offset))
+    return hotels
+
+
+def _write_searches(writer, source, searches):
+    """Write the search entries of one hotel, dates sorted, reading each result back from the stream"""
+    writer.start('searches', 'array')
+    for _, _, offset in sorted(searches):
+        source.seek(offset)
+        writer.value(None, build_search_entry(json.loads(source.readline())))
+    writer.end()
+
+
+def finalize_results_stream(jsonl_path, hotel_name=None, json_path=None):
+    """
+    Build the single or multiple hotels summary JSON from a results stream
+
+    The stream is read once to build the per-hotel summaries and an index of
+    where each result is; the JSON is then written piece by piece, reading
+    the results back in hotel and date order, so memory does not grow with
+    the number of searches.
+
+    Args:
+        jsonl_path (str): Path to the .jsonl results stream
+        hotel_name (str, optional): Hotel name for single hotel mode
+        json_path (str, optional): Output path, defaults to the stream path with .json
+
+    Returns:
+        str or None: Path to saved JSON file or None if failed
+    """
+    try:
+        hotels = _index_results_stream(jsonl_path)
+    except FileNotFoundError:
+        print(f'❌ Results stream not found: {jsonl_path}')
+        return None
+    if not hotels:
+        print('❌ No results to save to JSON')
+        return None
+
+    if json_path is None:
+        json_path = os.path.splitext(jsonl_path)[0] + '.json'
+
+    # Workers finish out of order; keep hotels in first-seen order and dates sorted
+    summaries = [finish_hotel_summary(hotel['summary'], hotel['stats']) for hotel in hotels.values()]
+    is_single_hotel = len(hotels) == 1
+    if is_single_hotel:
+        single_name = next(iter(hotels))
+        json_data = {'metadata': build_metadata(summaries, single_name), 'hotel_name': single_name}
+    else:
+        json_data = {'metadata': build_metadata(summaries)}
+
+    tmp_path = f'{json_path}.tmp'
+    try:
+        with open(jsonl_path, 'rb') as source, open(tmp_path, 'w', encoding='utf-8') as f:
+            writer = IndentedJsonWriter(f)
+            writer.start(None, 'map')
+            writer.value('metadata', json_data['metadata'])
+            if is_single_hotel:
+                hotel = hotels[single_name]
+                writer.value('hotel_name', single_name)
+                _write_searches(writer, source, hotel['searches'])
+                writer.value('summary', hotel['summary'])
+            else:
+                writer.start('hotels', 'map')
+                for name, hotel in hotels.items():
+                    writer.start(name, 'map')
+                    writer.value('hotel_name', name)
+                    _write_searches(writer, source, hotel['searches'])
+                    writer.value('summary', hotel['summary'])
+                    writer.end()
+                writer.end()
+            writer.end()
+        os.replace(tmp_path, json_path)
+    except Exception as e:
+        print(f'❌ Error saving JSON: {str(e)}')
+        return None
+
+    print(f'💾 JSON saved: {json_path}')
+    print_json_summary(json_data, is_single_hotel)
+    return json_path
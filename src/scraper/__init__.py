@@ -2,19 +2,51 @@
 Web scraping modules for hotel price scraper
 """
 
-from .driver import create_driver_session, wait_for_page_load, ensure_no_blocking_modals
+from .waits import SearchDeadline, wait_until
+from .driver import (
+    create_driver_session,
+    start_booking_session,
+    is_session_alive,
+    wait_for_page_load,
+    ensure_no_blocking_modals
+)
 from .booking import (
+    build_search_results_url,
+    navigate_to_search_results,
     search_and_click_on_hotel, 
     select_checkin_and_checkout_dates, 
     click_on_search_button,
+    extract_page_data,
     extract_price, 
-    check_hotel_availability
+    check_hotel_availability,
+    is_blocked_page
+)
+from .errors import classify_exception, classify_result, is_failed_result, recovery_action
+from .resolution import HotelResolutionCache, get_resolution_cache, normalize_hotel_name
+from .sessions import PooledSession, SessionPool, get_session_pool, close_session_pool
+from .fetcher import HttpFetcher, get_http_fetcher, close_http_fetcher
+from .scheduler import ScrapeTask, TaskQueue, build_tasks
+from .core import (
+    scrape_search,
+    run_tasks,
+    scrape_single_hotel,
+    scrape_hotels,
+    sweep_destination,
+    scrape_hotels_with_args
 )
-from .core import scrape_single_hotel, scrape_hotels_with_args
 
 __all__ = [
-    'create_driver_session', 'wait_for_page_load', 'ensure_no_blocking_modals',
+    'SearchDeadline', 'wait_until',
+    'create_driver_session', 'start_booking_session', 'is_session_alive', 'wait_for_page_load', 'ensure_no_blocking_modals',
+    'build_search_results_url', 'navigate_to_search_results',
     'search_and_click_on_hotel', 'select_checkin_and_checkout_dates', 
-    'click_on_search_button', 'extract_price', 'check_hotel_availability',
-    'scrape_single_hotel', 'scrape_hotels_with_args'
+    'click_on_search_button', 'extract_page_data', 'extract_price', 'check_hotel_availability',
+    'is_blocked_page',
+    'classify_exception', 'classify_result', 'is_failed_result', 'recovery_action',
+    'HotelResolutionCache', 'get_resolution_cache', 'normalize_hotel_name',
+    'PooledSession', 'SessionPool', 'get_session_pool', 'close_session_pool',
+    'HttpFetcher', 'get_http_fetcher', 'close_http_fetcher',
+    'ScrapeTask', 'TaskQueue', 'build_tasks',
+    'scrape_search', 'run_tasks', 'scrape_single_hotel', 'scrape_hotels', 'sweep_destination',
+    'scrape_hotels_with_args'
 ] 
\ No newline at end of file
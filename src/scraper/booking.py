@@ -2,21 +2,190 @@
 Booking.com specific interactions for hotel price scraper
 """
 
-import time
+import re
+import json
+from urllib.parse import urlencode, urlparse, parse_qs
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from .driver import ensure_no_blocking_modals
+from .driver import ensure_no_blocking_modals, wait_for_page_load, NetworkCapture
+from .waits import wait_until, input_has_value, autocomplete_populated, calendar_open, element_visible, results_rendered
+from ..utils.config import get_scraper_settings
 
 
-def search_and_click_on_hotel(driver, hotel_name):
+# Booking.com uses different price selectors depending on the page variant
+PRICE_SELECTORS = [
+    "span[data-testid='price-and-discounted-price']",
+    "[data-testid='price-and-discounted-price']",
+    ".prco-valign-middle-helper",
+    "[data-testid='price']",
+    ".bui-price-display__value",
+    ".prco-text-nowrap-helper",
+    "span[aria-label*='COP']",
+    # New selectors for available properties
+    ".bui-price-display__value .sr-only",
+    "[data-testid='price-availability-row'] span"
+]
+
+UNAVAILABLE_MESSAGE_SELECTOR = "p.b99b6ef58f.c8075b5e6a"
+
+SEARCH_RESULTS_URL = 'https://www.booking.com/searchresults.html'
+
+# Property cards per results page; later pages are reached with the offset parameter
+RESULTS_PAGE_SIZE = 25
+
+# Starts a navigation without waiting for it: the flag set on the current
+# document disappears with it, so a check can tell the new page from the old one
+START_NAVIGATION_SCRIPT = """
+window.__hpsLeaving = true;
+window.location.href = arguments[0];
+"""
+
+# Loading state of a tab: 'loading' until the new document is complete,
+# then 'loaded', or 'rendered' once property cards (or the alternative dates
+# carousel) are on the page
+TAB_STATE_SCRIPT = """
+if (window.__hpsLeaving || document.readyState !== 'complete') return 'loading';
+if (document.querySelector("[data-testid='property-card']")
+    || document.querySelector("[data-testid='next-available-dates-carousel']")) return 'rendered';
+return 'loaded';
+"""
+
+# Signs of a captcha, bot challenge or proxy error page instead of Booking.com content
+BLOCKED_PAGE_SCRIPT = """
+const title = (document.title || '').toLowerCase();
+if (/captcha|access denied|attention required|are you a robot|blocked/.test(title)) return true;
+return !!document.querySelector(
+    "iframe[src*='captcha'], #px-captcha, .g-recaptcha, .h-captcha, #challenge-form, #challenge-container"
+);
+"""
+
+# Evaluates every availability and price selector inside the page and
+# returns the findings as one JSON string, so the whole check costs a single
+# WebDriver round-trip and never hits the implicit wait on missing elements.
+PAGE_EXTRACTION_SCRIPT = """
+const priceSelectors = arguments[0];
+const currency = arguments[1];
+const unavailableSelector = arguments[2];
+const textOf = (el) => ((el && (el.innerText || el.textContent)) || '').trim();
+const isPrice = (text) => text.includes(currency) && /\\d/.test(text);
+
+const data = {
+    card_found: false,
+    soldout: false,
+    title: null,
+    hotel_url: null,
+    unavailable_message: null,
+    alternative_dates: false,
+    price: null,
+    price_selector: null
+};
+
+const card = document.querySelector("[data-testid='property-card']");
+if (card) {
+    data.card_found = true;
+    data.soldout = card.getAttribute('data-soldout') === '1';
+    const title = card.querySelector("[data-testid='title']");
+    data.title = title ? textOf(title) : null;
+    const link = card.querySelector("a[data-testid='title-link']");
+    data.hotel_url = link ? link.href : null;
+}
+
+const message = document.querySelector(unavailableSelector);
+data.unavailable_message = message ? textOf(message) : null;
+data.alternative_dates = !!document.querySelector("[data-testid='next-available-dates-carousel']");
+
+for (const selector of priceSelectors) {
+    const text = textOf(document.querySelector(selector));
+    if (text && isPrice(text)) {
+        data.price = text;
+        data.price_selector = selector;
+        break;
+    }
+}
+
+if (!data.price) {
+    const matches = document.evaluate(
+        "//*[contains(text(), '" + currency + "')]", document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (let i = 0; i < matches.snapshotLength; i++) {
+        const text = textOf(matches.snapshotItem(i));
+        // Avoid alternative date suggestions
+        if (isPrice(text) && !text.includes('From') && !text.includes('night')) {
+            data.price = text;
+            data.price_selector = 'xpath';
+            break;
+        }
+    }
+}
+
+return JSON.stringify(data);
+"""
+
+
+# Responses that carry the data of the results cards: the results document,
+# whose server-rendered state is embedded as JSON, and later GraphQL calls
+NETWORK_URL_PATTERNS = ('booking.com/searchresults', 'booking.com/dml/graphql')
+
+# Statuses and page markers of bot challenges served instead of a results page
+CHALLENGE_STATUSES = frozenset({202, 403, 405, 429})
+_CHALLENGE_TITLE = re.compile(r'<title>[^<]*(captcha|access denied|attention required|are you a robot|blocked)',
+                              re.IGNORECASE)
+_CHALLENGE_MARKERS = ('px-captcha', 'g-recaptcha', 'h-captcha', 'challenge-form', 'challenge-container',
+                      'awswaf', 'challenge.js')
+
+_EMBEDDED_JSON = re.compile(r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', re.DOTALL)
+
+
+# Reads every property card of a results page in one call, as a JSON list of
+# page data entries (one per card, same fields as PAGE_EXTRACTION_SCRIPT)
+PROPERTY_CARDS_SCRIPT = """
+const priceSelectors = arguments[0];
+const currency = arguments[1];
+const textOf = (el) => ((el && (el.innerText || el.textContent)) || '').trim();
+const isPrice = (text) => text.includes(currency) && /\\d/.test(text);
+
+const cards = [];
+for (const card of document.querySelectorAll("[data-testid='property-card']")) {
+    const title = card.querySelector("[data-testid='title']");
+    const link = card.querySelector("a[data-testid='title-link']");
+    const taxes = card.querySelector("[data-testid='taxes-and-charges']");
+    const data = {
+        card_found: true,
+        soldout: card.getAttribute('data-soldout') === '1',
+        title: title ? textOf(title) : null,
+        hotel_url: link ? link.href : null,
+        unavailable_message: null,
+        alternative_dates: false,
+        price: null,
+        price_selector: null,
+        taxes: taxes ? textOf(taxes) || null : null
+    };
+    for (const selector of priceSelectors) {
+        const text = textOf(card.querySelector(selector));
+        if (text && isPrice(text)) {
+            data.price = text;
+            data.price_selector = selector;
+            break;
+        }
+    }
+    cards.push(data);
+}
+return JSON.stringify(cards);
+"""
+
+
+def search_and_click_on_hotel(driver, hotel_name, resolution=None, deadline=None):
     """
     Search for a hotel and click on it from autocomplete results
     
     Args:
         driver: WebDriver instance
         hotel_name (str): Name of the hotel to search for
+        resolution (dict, optional): Filled with the 'title' and 'location' of the selected option
+        deadline (SearchDeadline, optional): Time budget of the current search
         
     Returns:
         bool: True if hotel was found and selected, False otherwise
@@ -25,7 +194,7 @@ def search_and_click_on_hotel(driver, hotel_name):
         ensure_no_blocking_modals(driver)
 
         print('🔍 Looking for search input...')
-        wait = WebDriverWait(driver, 15)
+        wait = WebDriverWait(driver, deadline.cap(15) if deadline else 15)
 
         # Find the search input
         search_input = wait.until(
@@ -37,15 +206,13 @@ def search_and_click_on_hotel(driver, hotel_name):
         
         # Clear the field completely using multiple methods
         search_input.clear()
-        time.sleep(0.5)
         
         # Use JavaScript to clear and set the value to ensure it's completely clean
         driver.execute_script("arguments[0].value = '';", search_input)
-        time.sleep(0.5)
         
         # Now enter the text
         search_input.send_keys(search_text)
-        time.sleep(1)
+        wait_until(driver, input_has_value(search_input, search_text), 2, deadline)
         
         # Verify text entry
         actual_value = search_input.get_attribute('value')
@@ -56,20 +223,16 @@ def search_and_click_on_hotel(driver, hotel_name):
             print(f'⚠️ Text mismatch! Expected: "{search_text}", Got: "{actual_value}"')
             # Try to clear and re-enter
             driver.execute_script("arguments[0].value = '';", search_input)
-            time.sleep(0.5)
             search_input.send_keys(search_text)
-            time.sleep(1)
+            wait_until(driver, input_has_value(search_input, search_text), 2, deadline)
             actual_value = search_input.get_attribute('value')
             print(f'📝 After retry, text in input field: {actual_value}')
         
         print('🔄 Waiting for autocomplete results...')
-        # Wait for autocomplete list to appear
-        autocomplete_list = wait.until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "ul[role='group']"))
-        )
-        
-        # Give a short time for the list to populate
-        time.sleep(2)
+        # Wait for the autocomplete list to appear and finish populating
+        if not wait_until(driver, autocomplete_populated(), 15, deadline):
+            print('❌ Autocomplete results did not appear')
+            return False
         
         # Re-find the list to avoid stale element
         autocomplete_list = driver.find_element(By.CSS_SELECTOR, "ul[role='group']")
@@ -108,6 +271,9 @@ def search_and_click_on_hotel(driver, hotel_name):
                         clickable_button = option.find_element(By.CSS_SELECTOR, "div[role='button']")
                         clickable_button.click()
                         
+                        if resolution is not None:
+                            resolution.update({'title': hotel_text, 'location': location_text})
+                        
                         print('🏨 Selected hotel from autocomplete')
                         return True
                         
@@ -125,6 +291,7 @@ def search_and_click_on_hotel(driver, hotel_name):
                 
                 if text_lines:
                     hotel_text = text_lines[0]
+                    location_text = text_lines[1] if len(text_lines) > 1 else ""
                     
                     # Check if the hotel name is contained within the option text (case-insensitive)
                     if hotel_name.lower() in hotel_text.lower() or hotel_text.lower() in hotel_name.lower():
@@ -133,6 +300,9 @@ def search_and_click_on_hotel(driver, hotel_name):
                         clickable_button = option.find_element(By.CSS_SELECTOR, "div[role='button']")
                         clickable_button.click()
                         
+                        if resolution is not None:
+                            resolution.update({'title': hotel_text, 'location': location_text})
+                        
                         print('🏨 Selected hotel from autocomplete (partial match)')
                         return True
                         
@@ -162,12 +332,180 @@ def search_and_click_on_hotel(driver, hotel_name):
         return False
 
 
-def open_date_picker(driver):
+def hotel_name_matches(hotel_name, candidate):
+    """
+    Check if a hotel title shown by Booking.com corresponds to the hotel we look for
+    
+    Args:
+        hotel_name (str): Name of the hotel we search for
+        candidate (str): Hotel title found on the page
+        
+    Returns:
+        bool: True on exact or partial (case-insensitive) match
+    """
+    if not candidate:
+        return False
+    if candidate == hotel_name:
+        return True
+    return hotel_name.lower() in candidate.lower() or candidate.lower() in hotel_name.lower()
+
+
+def build_search_results_url(hotel_name, checkin_date, checkout_date, dest_id=None, dest_type=None, offset=0):
+    """
+    Build a Booking.com search results URL for a hotel and date pair
+    
+    Args:
+        hotel_name (str): Name of the hotel (or of a city or district to sweep)
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        dest_id (str, optional): Booking.com destination id of the hotel
+        dest_type (str, optional): Destination type that goes with dest_id (e.g. "hotel")
+        offset (int): Index of the first result, for the pages after the first
+        
+    Returns:
+        str: Search results URL
+    """
+    settings = get_scraper_settings()
+    params = {'ss': hotel_name}
+    if dest_id:
+        params['dest_id'] = dest_id
+        params['dest_type'] = dest_type or 'hotel'
+    params.update({
+        'checkin': str(checkin_date),
+        'checkout': str(checkout_date),
+        'group_adults': 2,
+        'no_rooms': 1,
+        'group_children': 0,
+        'selected_currency': settings['currency'],
+        'cc1': settings['country']
+    })
+    if offset:
+        params['offset'] = offset
+    return f'{SEARCH_RESULTS_URL}?{urlencode(params)}'
+
+
+def parse_destination_from_url(url):
+    """
+    Read the destination Booking.com resolved a search to from a results URL
+    
+    Args:
+        url (str): Current URL of a search results page
+        
+    Returns:
+        dict or None: {'dest_id': ..., 'dest_type': ...} or None if not present
+    """
+    try:
+        query = parse_qs(urlparse(url).query)
+        dest_id = query.get('dest_id', [None])[0]
+        if not dest_id:
+            return None
+        return {
+            'dest_id': dest_id,
+            'dest_type': query.get('dest_type', ['hotel'])[0]
+        }
+    except Exception:
+        return None
+
+
+def navigate_to_search_results(driver, hotel_name, checkin_date, checkout_date, destination=None, deadline=None,
+                               offset=0):
+    """
+    Load the search results for a hotel and date pair directly by URL
+    
+    Skips the autocomplete and date picker UI. Without a known destination
+    Booking.com runs a free-text search, so the caller must check that the
+    first property card is the right hotel.
+    
+    Args:
+        driver: WebDriver instance
+        hotel_name (str): Name of the hotel
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        destination (dict, optional): {'dest_id': ..., 'dest_type': ...} of the hotel
+        deadline (SearchDeadline, optional): Time budget of the current search
+        offset (int): Index of the first result, for the pages after the first
+        
+    Returns:
+        bool: True if the results page loaded, False otherwise
+    """
+    try:
+        destination = destination or {}
+        url = build_search_results_url(
+            hotel_name, checkin_date, checkout_date,
+            destination.get('dest_id'), destination.get('dest_type'), offset
+        )
+        print(f'🧭 Loading search results directly: {url}')
+        page_load_timeout = get_scraper_settings()['page_load_timeout']
+        if deadline is None:
+            driver.get(url)
+            return wait_for_page_load(driver)
+        
+        # Keep the page load itself inside the search budget
+        driver.set_page_load_timeout(max(1, deadline.cap(page_load_timeout)))
+        try:
+            driver.get(url)
+        finally:
+            driver.set_page_load_timeout(page_load_timeout)
+        return wait_for_page_load(driver, deadline=deadline)
+    except Exception as e:
+        print(f'❌ Direct navigation failed: {e}')
+        return False
+
+
+def start_search_results_navigation(driver, hotel_name, checkin_date, checkout_date, destination=None):
+    """
+    Start loading the search results for a hotel and date pair without waiting for the page
+    
+    Used to load several tabs at once; poll the tab with read_tab_state.
+    
+    Args:
+        driver: WebDriver instance, switched to the tab to load
+        hotel_name (str): Name of the hotel
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        destination (dict, optional): {'dest_id': ..., 'dest_type': ...} of the hotel
+        
+    Returns:
+        bool: True if the navigation started, False otherwise
+    """
+    try:
+        destination = destination or {}
+        url = build_search_results_url(
+            hotel_name, checkin_date, checkout_date,
+            destination.get('dest_id'), destination.get('dest_type')
+        )
+        print(f'🧭 Loading search results in background tab: {url}')
+        driver.execute_script(START_NAVIGATION_SCRIPT, url)
+        return True
+    except Exception as e:
+        print(f'❌ Direct navigation failed: {e}')
+        return False
+
+
+def read_tab_state(driver):
+    """
+    Loading state of the current tab after start_search_results_navigation
+    
+    Args:
+        driver: WebDriver instance, switched to the tab
+        
+    Returns:
+        str: 'loading', 'loaded' or 'rendered'
+    """
+    try:
+        return driver.execute_script(TAB_STATE_SCRIPT) or 'loading'
+    except Exception:
+        # Scripts can fail while the old document is being torn down
+        return 'loading'
+
+
+def open_date_picker(driver, deadline=None):
     """
     Open the date picker
     
     Args:
         driver: WebDriver instance
+        deadline (SearchDeadline, optional): Time budget of the current search
         
     Returns:
         bool: True if date picker opened successfully, False otherwise
@@ -176,40 +514,67 @@ def open_date_picker(driver):
         print('🔍 Opening date picker...')
         date_picker_button = driver.find_element(By.CSS_SELECTOR, "[data-testid='searchbox-dates-container']")
         date_picker_button.click()
-        time.sleep(1)
-        return True
+        return bool(wait_until(driver, calendar_open(), 5, deadline))
     except Exception as e:  
         print(f"Error: {e}")
         return False
 
 
-def is_date_picker_open(driver):
+def is_blocked_page(driver):
     """
-    Check if the date picker is open and visible
+    Check if the page is a captcha, bot challenge or access denied page
     
     Args:
         driver: WebDriver instance
         
     Returns:
-        bool: True if date picker is open, False otherwise
+        bool: True if the session is being blocked, False otherwise
     """
     try:
-        print('🔍 Checking if date picker is open...')
+        return bool(driver.execute_script(BLOCKED_PAGE_SCRIPT))
+    except Exception:
+        return False
+
+
+def count_autocomplete_options(driver):
+    """
+    Count the options currently shown in the search box autocomplete
+    
+    Args:
+        driver: WebDriver instance
         
-        date_picker = driver.find_element(By.CSS_SELECTOR, "[data-testid='searchbox-datepicker-calendar']")
+    Returns:
+        int: Number of options (0 if the list is not there)
+    """
+    try:
+        return driver.execute_script(
+            "return document.querySelectorAll(\"ul[role='group'] li[role='option']\").length;"
+        ) or 0
+    except Exception:
+        return 0
+
+
+def is_date_picker_open(driver):
+    """
+    Check if the date picker is open and visible
+    
+    Args:
+        driver: WebDriver instance
         
-        if date_picker.is_displayed():
-            print('👍🏾 Date picker is open')
-            return True
-        else:
-            print('❌ Date picker is not visible')
-            return False
-            
-    except:
-        return False
+    Returns:
+        bool: True if date picker is open, False otherwise
+    """
+    print('🔍 Checking if date picker is open...')
+    
+    if calendar_open()(driver):
+        print('👍🏾 Date picker is open')
+        return True
+    
+    print('❌ Date picker is not visible')
+    return False
 
 
-def select_checkin_and_checkout_dates(driver, checkin_date, checkout_date):
+def select_checkin_and_checkout_dates(driver, checkin_date, checkout_date, deadline=None):
     """
     Select check-in and check-out dates
     
@@ -217,6 +582,7 @@ def select_checkin_and_checkout_dates(driver, checkin_date, checkout_date):
         driver: WebDriver instance
         checkin_date: Check-in date
         checkout_date: Check-out date
+        deadline (SearchDeadline, optional): Time budget of the current search
         
     Returns:
         bool: True if dates selected successfully, False otherwise
@@ -226,14 +592,15 @@ def select_checkin_and_checkout_dates(driver, checkin_date, checkout_date):
         # check if date picker is open
         if not is_date_picker_open(driver):
             print('👎🏾 Date picker is not open')
-            if not open_date_picker(driver):
+            if not open_date_picker(driver, deadline):
                 print('👎🏾 Could not open date picker')
                 return False
             else:
                 print('👍🏾 Date picker opened')
-                time.sleep(1)
-        else:
-            time.sleep(1)
+        # Wait until the month with the check-in date is rendered
+        if not wait_until(driver, element_visible(f"span[data-date='{checkin_date}']"), 5, deadline):
+            print(f'👎🏾 Date {checkin_date} not shown in date picker')
+            return False
         # select checkin date
         checkin_date_element = driver.find_element(By.CSS_SELECTOR, f"span[data-date='{checkin_date}']")
         checkin_date_element.click()
@@ -246,42 +613,385 @@ def select_checkin_and_checkout_dates(driver, checkin_date, checkout_date):
         return False
 
 
-def click_on_search_button(driver):
+def click_on_search_button(driver, deadline=None):
     """
     Click on the search button
     
     Args:
         driver: WebDriver instance
+        deadline (SearchDeadline, optional): Time budget of the current search
         
     Returns:
         bool: True if search button clicked successfully, False otherwise
     """
     try:
         print('🔍 Clicking on search button...')
+        settings = get_scraper_settings()
+        previous_url = driver.current_url
         search_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
         search_button.click()
 
-        # wait for the page to load
-        time.sleep(10)
+        # wait for the results to render
+        if not wait_until(driver, results_rendered(previous_url), settings['results_timeout'], deadline):
+            print('⚠️ Results did not render in time, reading the page as it is')
         return True
     except Exception as e:
         print(f"Error: {e}")
         return False
 
 
-def extract_price(driver):
+def extract_page_data(driver):
+    """
+    Read availability and price information from the results page in one call
+    
+    Args:
+        driver: WebDriver instance
+        
+    Returns:
+        dict or None: Page findings (card_found, soldout, title, hotel_url,
+            unavailable_message, alternative_dates, price, price_selector)
+            or None if the extraction script could not run
+    """
+    try:
+        settings = get_scraper_settings()
+        raw = driver.execute_script(
+            PAGE_EXTRACTION_SCRIPT,
+            PRICE_SELECTORS,
+            settings['currency'],
+            UNAVAILABLE_MESSAGE_SELECTOR
+        )
+        return json.loads(raw)
+    except Exception as e:
+        print(f'⚠️ Page extraction script failed: {e}')
+        return None
+
+
+def extract_property_cards(driver):
+    """
+    Read every property card of the results page in one call
+    
+    Args:
+        driver: WebDriver instance
+        
+    Returns:
+        list or None: Page data of each card in page order (card_found, soldout,
+            title, hotel_url, price, price_selector, taxes, ...), or None if
+            the extraction script could not run
+    """
+    try:
+        raw = driver.execute_script(PROPERTY_CARDS_SCRIPT, PRICE_SELECTORS, get_scraper_settings()['currency'])
+        return json.loads(raw)
+    except Exception as e:
+        print(f'⚠️ Property cards script failed: {e}')
+        return None
+
+
+def start_network_capture(driver):
+    """
+    Start watching the browser's network responses for results card data
+    
+    Args:
+        driver: WebDriver instance of a session created for network extraction
+        
+    Returns:
+        NetworkCapture or None: Capture to pass to read_network_page_data,
+            None if the session does not provide network events
+    """
+    try:
+        return NetworkCapture(driver, NETWORK_URL_PATTERNS)
+    except Exception as e:
+        print(f'⚠️ Network capture not available: {e}')
+        return None
+
+
+def read_network_page_data(capture, hotel_name, timeout, deadline=None):
+    """
+    Wait for the results card of a hotel to arrive in a network response
+    
+    Returns as soon as a response with property results has been received,
+    without waiting for the page to render.
+    
+    Args:
+        capture (NetworkCapture): Capture started before the navigation
+        hotel_name (str): Name of the hotel
+        timeout (float): Maximum wait in seconds
+        deadline (SearchDeadline, optional): Search budget capping the timeout
+        
+    Returns:
+        dict or None: Page data in the format of extract_page_data, plus the
+            structured 'amount', 'taxes' and 'currency' of the stay, or None
+            if no response had a usable card
+    """
+    properties = []
+    
+    def card_received(driver):
+        for url, mime_type, body in capture.poll():
+            properties.extend(_network_properties(url, mime_type, body))
+        return _page_data_from_properties(properties, hotel_name)
+    
+    try:
+        return wait_until(capture.driver, card_received, timeout, deadline, poll_frequency=0.25) or None
+    except Exception as e:
+        print(f'⚠️ Network capture failed: {e}')
+        return None
+
+
+def _network_properties(url, mime_type, body):
+    """Property results found in one response body"""
+    if 'json' in mime_type:
+        documents = [body]
+    else:
+        # The results document embeds its initial data as JSON scripts
+        documents = _EMBEDDED_JSON.findall(body)
+    
+    properties = []
+    for document in documents:
+        try:
+            payload = json.loads(document)
+        except ValueError:
+            continue
+        properties.extend(_find_properties(payload))
+    if properties:
+        print(f'📡 {len(properties)} properties in {url[:80]}')
+    return properties
+
+
+def _find_properties(node):
+    """Search result objects (named properties with price or sold out info) in a payload, in order"""
+    if isinstance(node, list):
+        for item in node:
+            yield from _find_properties(item)
+    elif isinstance(node, dict):
+        if isinstance(node.get('displayName'), dict) and (
+                'priceDisplayInfoIrene' in node or 'soldOutInfo' in node):
+            yield node
+            return
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _find_properties(value)
+
+
+def _nested(node, *keys):
+    for key in keys:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _nested_dict(node, *keys):
+    """Like _nested, but an empty dict unless the value found is a dict"""
+    value = _nested(node, *keys)
+    return value if isinstance(value, dict) else {}
+
+
+def _page_data_from_properties(properties, hotel_name):
+    """Page data of the hotel's card (or the first card, like the page) among network results"""
+    properties = [prop for prop in properties or [] if isinstance(prop, dict)]
+    if not properties:
+        return None
+    titles = [_nested(prop, 'displayName', 'text') for prop in properties]
+    matches = [prop for prop, title in zip(properties, titles) if hotel_name_matches(hotel_name, title)]
+    prop = matches[0] if matches else properties[0]
+    
+    price_info = _nested_dict(prop, 'priceDisplayInfoIrene')
+    stay_price = _nested_dict(price_info, 'displayPrice', 'amountPerStay')
+    taxes = _nested_dict(price_info, 'excludedCharges', 'excludeChargesAggregated', 'amountPerStay')
+    soldout = bool(_nested(prop, 'soldOutInfo', 'isSoldOut'))
+    price = stay_price.get('amount')
+    if not price and stay_price.get('amountUnformatted') is not None:
+        price = f"{stay_price.get('currency') or ''} {stay_price['amountUnformatted']}".strip()
+    if not price and not soldout:
+        # No price and no sold out flag: let the page tell (e.g. alternative dates)
+        return None
+    
+    page_name = _nested(prop, 'basicPropertyData', 'pageName')
+    country_code = _nested(prop, 'basicPropertyData', 'location', 'countryCode')
+    return {
+        'card_found': True,
+        'soldout': soldout,
+        'title': _nested(prop, 'displayName', 'text'),
+        'hotel_url': f'https://www.booking.com/hotel/{country_code}/{page_name}.html'
+                     if page_name and country_code else None,
+        'unavailable_message': None,
+        'alternative_dates': False,
+        'price': price,
+        'price_selector': 'network',
+        'amount': stay_price.get('amountUnformatted'),
+        'taxes': taxes.get('amount'),
+        'currency': stay_price.get('currency')
+    }
+
+
+def is_challenge_html(status, html):
+    """
+    Check if an HTTP response is a captcha or bot challenge instead of Booking.com content
+    
+    Args:
+        status (int): HTTP status code
+        html (str): Response body
+        
+    Returns:
+        bool: True if the response is a challenge or access check
+    """
+    if status in CHALLENGE_STATUSES:
+        return True
+    head = html[:20000]
+    return bool(_CHALLENGE_TITLE.search(head)) or any(marker in head for marker in _CHALLENGE_MARKERS)
+
+
+def parse_results_html(html, hotel_name, currency):
+    """
+    Read availability and price information from server-rendered results HTML
+    
+    Uses the JSON state embedded in the page when it has the property
+    results, otherwise the property card markup (parsed with lxml).
+    
+    Args:
+        html (str): Results page HTML
+        hotel_name (str): Name of the hotel
+        currency (str): Currency code prices are shown in
+        
+    Returns:
+        dict or None: Page data in the format of extract_page_data, or None
+            if the HTML could not be read
+    """
+    page_data = _page_data_from_properties(_network_properties('results page', 'text/html', html), hotel_name)
+    if page_data is not None:
+        return page_data
+    return _page_data_from_cards(html, currency)
+
+
+def _page_data_from_cards(html, currency):
+    """Page data of the first property card, read from the markup like PAGE_EXTRACTION_SCRIPT does"""
+    try:
+        from lxml import html as lxml_html
+    except ImportError:
+        return None
+    
+    try:
+        tree = lxml_html.fromstring(html)
+    except Exception:
+        return None
+    
+    def text_of(nodes):
+        return ' '.join(nodes[0].text_content().split()) if nodes else None
+    
+    data = {
+        'card_found': False,
+        'soldout': False,
+        'title': None,
+        'hotel_url': None,
+        'unavailable_message': None,
+        'alternative_dates': bool(tree.xpath("//*[@data-testid='next-available-dates-carousel']")),
+        'price': None,
+        'price_selector': None,
+        'taxes': None
+    }
+    
+    cards = tree.xpath("//*[@data-testid='property-card']")
+    if not cards:
+        return data
+    card = cards[0]
+    data['card_found'] = True
+    data['soldout'] = card.get('data-soldout') == '1'
+    data['title'] = text_of(card.xpath(".//*[@data-testid='title']"))
+    links = card.xpath(".//a[@data-testid='title-link']/@href")
+    data['hotel_url'] = links[0] if links else None
+    data['taxes'] = text_of(card.xpath(".//*[@data-testid='taxes-and-charges']"))
+    for test_id in ('price-and-discounted-price', 'price'):
+        price = text_of(card.xpath(f".//*[@data-testid='{test_id}']"))
+        if price and currency in price and re.search(r'\d', price):
+            data['price'] = price
+            data['price_selector'] = f"[data-testid='{test_id}']"
+            break
+    return data
+
+
+def extract_price(driver, page_data=None):
     """
     Enhanced price extraction with availability check
     
     Args:
         driver: WebDriver instance
+        page_data (dict, optional): Result of extract_page_data, read from the page if omitted
         
     Returns:
         str or None: Extracted price string or None if not found
     """
-    try:
-        print('🔍 Extracting price...')
+    print('🔍 Extracting price...')
+    
+    if page_data is None:
+        page_data = extract_page_data(driver)
+    if page_data is None:
+        return _extract_price_with_selectors(driver)
+    
+    # First, check if the hotel is available for the selected dates
+    if page_data['soldout']:
+        print('❌ Hotel not available for this date')
+        if page_data['unavailable_message']:
+            print(f'📋 Availability message: {page_data["unavailable_message"]}')
+            return f"Not available - {page_data['unavailable_message']}"
+        return "Not available for selected dates"
+    
+    if page_data['price']:
+        print(f"💰 Price found: {page_data['price']} (via {page_data['price_selector']})")
+        return page_data['price']
+    
+    # Check if we're on a page showing alternative dates instead of no availability
+    if page_data['alternative_dates']:
+        print('📅 Hotel showing alternative dates - not available for selected dates')
+        return "Not available for selected dates - alternative dates suggested"
+    
+    print("❌ No price found with any method")
+    return None
+
+
+def check_hotel_availability(driver, page_data=None):
+    """
+    Separate function to explicitly check hotel availability
+    
+    Args:
+        driver: WebDriver instance
+        page_data (dict, optional): Result of extract_page_data, read from the page if omitted
         
+    Returns:
+        tuple: (is_available: bool, message: str)
+    """
+    if page_data is None:
+        page_data = extract_page_data(driver)
+    if page_data is None:
+        return _check_hotel_availability_with_selectors(driver)
+    
+    if not page_data['card_found']:
+        print("⚠️ Error checking availability: property card not found")
+        return True, "Could not determine availability"
+    
+    if page_data['soldout']:
+        return False, "Hotel not available for selected dates"
+    
+    message = page_data['unavailable_message']
+    if message and "no availability" in message.lower():
+        return False, message
+    
+    # Alternative dates carousel indicates unavailability
+    if page_data['alternative_dates']:
+        return False, "Not available for selected dates - alternative dates suggested"
+    
+    return True, "Available"
+
+
+def _extract_price_with_selectors(driver):
+    """
+    Element-by-element price extraction, used when the page script cannot run
+    
+    Args:
+        driver: WebDriver instance
+        
+    Returns:
+        str or None: Extracted price string or None if not found
+    """
+    try:
         # First, check if the hotel is available for the selected dates
         try:
             # Look for the property card and check if it's sold out
@@ -295,7 +1005,7 @@ def extract_price(driver):
                 try:
                     unavailable_message = driver.find_element(
                         By.CSS_SELECTOR, 
-                        "p.b99b6ef58f.c8075b5e6a"
+                        UNAVAILABLE_MESSAGE_SELECTOR
                     ).text
                     print(f'📋 Availability message: {unavailable_message}')
                     return f"Not available - {unavailable_message}"
@@ -306,21 +1016,7 @@ def extract_price(driver):
             # If we can't find the property card or soldout attribute, continue with price extraction
             pass
         
-        # Try multiple price selectors as Booking.com uses different ones
-        price_selectors = [
-            "span[data-testid='price-and-discounted-price']",
-            "[data-testid='price-and-discounted-price']",
-            ".prco-valign-middle-helper",
-            "[data-testid='price']",
-            ".bui-price-display__value",
-            ".prco-text-nowrap-helper",
-            "span[aria-label*='COP']",
-            # New selectors for available properties
-            ".bui-price-display__value .sr-only",
-            "[data-testid='price-availability-row'] span"
-        ]
-        
-        for selector in price_selectors:
+        for selector in PRICE_SELECTORS:
             try:
                 price_element = driver.find_element(By.CSS_SELECTOR, selector)
                 if price_element and price_element.text.strip():
@@ -365,9 +1061,9 @@ def extract_price(driver):
         return None
 
 
-def check_hotel_availability(driver):
+def _check_hotel_availability_with_selectors(driver):
     """
-    Separate function to explicitly check hotel availability
+    Element-by-element availability check, used when the page script cannot run
     
     Args:
         driver: WebDriver instance
@@ -387,7 +1083,7 @@ def check_hotel_availability(driver):
         try:
             unavailable_message = driver.find_element(
                 By.CSS_SELECTOR, 
-                "p.b99b6ef58f.c8075b5e6a"
+                UNAVAILABLE_MESSAGE_SELECTOR
             )
             if "no availability" in unavailable_message.text.lower():
                 return False, unavailable_message.text
@@ -409,4 +1105,4 @@ def check_hotel_availability(driver):
         
     except Exception as e:
         print(f"⚠️ Error checking availability: {e}")
-        return True, "Could not determine availability" 
\ No newline at end of file
+        return True, "Could not determine availability"
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""
+Per-hotel circuit breaker for hotel price scraper
+"""
+
+import time
+import threading
+
+from .errors import SESSION_LOST, BLOCKED, UNAVAILABLE
+
+
+# Decisions for a task about to run
+RUN = 'run'      # Run the search
+HOLD = 'hold'    # Put the task back and try again after the returned delay (a probe is running)
+SKIP = 'skip'    # Do not run it: the hotel keeps failing the same way
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Failures that say something about the session rather than the hotel
+_SESSION_CLASSES = frozenset({SESSION_LOST, BLOCKED})
+
+# How often tasks held behind a running probe check the circuit again (seconds)
+PROBE_WAIT = 5
+
+
+class _Circuit:
+    """Failure streak and state of one hotel"""
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failure_class = None
+        self.streak = 0
+        self.opened_at = None
+        self.probing = False
+        self.failed_probes = 0
+        self.tripped = False
+
+
+class CircuitBreaker:
+    """
+    Stops searching a hotel that keeps failing with the same error class
+
+    After `threshold` consecutive failures of one class (e.g. the hotel is
+    never found in the autocomplete) the hotel's circuit opens and its
+    remaining tasks are skipped right away, to be picked up later with
+    --retry. Once `cooldown` seconds have passed the circuit is half-open:
+    the next task of the hotel runs as a single probe while the others
+    wait for it. If the probe succeeds the circuit closes and the hotel is
+    searched normally again; if it fails the circuit opens for another
+    cooldown, and after `max_probes` failed probes it stays open for the
+    rest of the run. Only final outcomes count: attempts that will be
+    retried, session losses and blocks (the session's fault, not the
+    hotel's) do not.
+    """
+
+    def __init__(self, threshold=3, cooldown=120, max_probes=1):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_probes = max_probes
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def check(self, hotel_name):
+        """
+        Decide what to do with the next task of a hotel
+
+        Args:
+            hotel_name (str): Hotel of the task
+
+        Returns:
+            tuple: (RUN, 0), (HOLD, seconds to wait) or (SKIP, 0)
+        """
+        with self._lock:
+            circuit = self._circuits.get(hotel_name)
+            if circuit is None or circuit.state == CLOSED:
+                return RUN, 0
+            if circuit.tripped:
+                return SKIP, 0
+
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    return SKIP, 0
+                circuit.state = HALF_OPEN
+
+            if circuit.probing:
+                return HOLD, PROBE_WAIT
+            circuit.probing = True
+            print(f'🔎 [{hotel_name}] Circuit half-open, probing with one search')
+            return RUN, 0
+
+    def record(self, hotel_name, error_class, final=True):
+        """
+        Count the outcome of a search
+
+        Args:
+            hotel_name (str): Hotel of the search
+            error_class (str or None): Error class of the result, None for a price
+            final (bool): False for a failed attempt that will be retried
+        """
+        if error_class in _SESSION_CLASSES or (error_class is not None and not final):
+            with self._lock:
+                # Not the hotel's answer yet: let another probe try if this was one
+                circuit = self._circuits.get(hotel_name)
+                if circuit is not None:
+                    circuit.probing = False
+            return
+
+        with self._lock:
+            circuit = self._circuits.setdefault(hotel_name, _Circuit())
+            if error_class is None or error_class == UNAVAILABLE:
+                if circuit.state != CLOSED:
+                    print(f'✅ [{hotel_name}] Circuit closed, hotel answers again')
+                self._circuits[hotel_name] = _Circuit()
+                return
+
+            if error_class == circuit.failure_class:
+                circuit.streak += 1
+            else:
+                circuit.failure_class = error_class
+                circuit.streak = 1
+
+            if circuit.state == HALF_OPEN and circuit.probing:
+                circuit.probing = False
+                circuit.failed_probes += 1
+                if circuit.failed_probes >= self.max_probes:
+                    circuit.tripped = True
+                    print(f'⛔ [{hotel_name}] Probe failed ({error_class}), skipping the rest of this hotel')
+                else:
+                    circuit.state = OPEN
+                    circuit.opened_at = time.monotonic()
+                    print(f'⛔ [{hotel_name}] Probe failed ({error_class}), skipping its searches '
+                          f'for another {self.cooldown}s')
+            elif circuit.state == CLOSED and circuit.streak >= self.threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                print(f'⛔ [{hotel_name}] Circuit open after {circuit.streak} {error_class} failures '
+                      f'in a row, skipping its searches for {self.cooldown}s')
+
+    def skip_reason(self, hotel_name):
+        """Error message for tasks skipped because the hotel's circuit is open"""
+        with self._lock:
+            circuit = self._circuits.get(hotel_name)
+            failure_class = circuit.failure_class if circuit else None
+        return f'Circuit open: repeated {failure_class} failures'
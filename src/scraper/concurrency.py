@@ -0,0 +1,119 @@
+"""
+Adaptive concurrency for hotel price scraper
+"""
+
+import threading
+
+from .errors import BLOCKED, CIRCUIT_OPEN, FAILED_CLASSES, classify_result
+
+
+class ConcurrencyController:
+    """
+    AIMD controller for the number of active workers and the session rotation
+
+    Search outcomes are collected in windows of `window` results. A healthy
+    window (success rate of at least `min_success_rate`, p90 latency under
+    `max_p90_latency` and no blocks) adds one active worker and one search
+    per session. An unhealthy window halves the active workers, and when
+    it saw blocks it also halves the searches per session, so flagged
+    sessions are replaced sooner. Workers above the limit give back their
+    session and wait until the limit grows again.
+    """
+
+    def __init__(self, pool, max_workers, min_workers=1, window=10, min_success_rate=0.8,
+                 max_p90_latency=60, min_rotation=2, max_rotation=12):
+        self.pool = pool
+        self.max_workers = max_workers
+        self.min_workers = max(1, min(min_workers, max_workers))
+        self.window = window
+        self.min_success_rate = min_success_rate
+        self.max_p90_latency = max_p90_latency
+        self.min_rotation = min_rotation
+        # Never below the searches per session the run was configured with
+        self.max_rotation = max(max_rotation, min_rotation, pool.max_searches)
+        self.limit = self.min_workers
+        self._condition = threading.Condition()
+        self._outcomes = []
+        self._finished = False
+        # Workers that crashed; the limit counts the workers still running
+        self._lost = set()
+        self.decisions = 0
+
+    def _rank(self, worker_index):
+        """Position of a worker among the workers still running"""
+        return worker_index - sum(1 for lost in self._lost if lost < worker_index)
+
+    def wait_for_turn(self, worker_index):
+        """
+        Block while a worker is above the active worker limit
+
+        Args:
+            worker_index (int): Position of the worker, from 0
+        """
+        with self._condition:
+            while self._rank(worker_index) >= self.limit and not self._finished:
+                self._condition.wait()
+
+    def is_active(self, worker_index):
+        """Check if a worker is within the active worker limit"""
+        with self._condition:
+            return self._rank(worker_index) < self.limit or self._finished
+
+    def worker_lost(self, worker_index):
+        """Let the next paused worker take the place of one that crashed, keeping the limit"""
+        with self._condition:
+            self._lost.add(worker_index)
+            self._condition.notify_all()
+
+    def finish(self):
+        """Release every waiting worker, e.g. once the queue is done"""
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def record(self, result, latency):
+        """
+        Count one search outcome and adjust the limits at the end of a window
+
+        Args:
+            result (dict): Result of the search
+            latency (float): Seconds the search took
+        """
+        error_class = classify_result(result)
+        if error_class == CIRCUIT_OPEN:
+            return
+
+        with self._condition:
+            self._outcomes.append((error_class, latency))
+            if len(self._outcomes) >= self.window:
+                outcomes = self._outcomes
+                self._outcomes = []
+                self._adjust(outcomes)
+
+    def _adjust(self, outcomes):
+        count = len(outcomes)
+        blocked = sum(1 for error_class, _ in outcomes if error_class == BLOCKED)
+        failed = sum(1 for error_class, _ in outcomes if error_class in FAILED_CLASSES)
+        success_rate = 1 - failed / count
+        latencies = sorted(latency for _, latency in outcomes)
+        p50 = latencies[int(0.5 * (count - 1))]
+        p90 = latencies[int(0.9 * (count - 1))]
+
+        limit = self.limit
+        rotation = self.pool.max_searches
+        healthy = not blocked and success_rate >= self.min_success_rate and p90 <= self.max_p90_latency
+        if healthy:
+            limit = min(self.max_workers, limit + 1)
+            rotation = min(self.max_rotation, rotation + 1)
+        else:
+            limit = max(self.min_workers, limit // 2)
+            if blocked:
+                rotation = max(self.min_rotation, rotation // 2)
+
+        print(f'🎛️ Concurrency {self.limit} → {limit} workers, {self.pool.max_searches} → {rotation} searches '
+              f'per session (success {success_rate:.0%}, p50 {p50:.0f}s, p90 {p90:.0f}s, '
+              f'blocked {blocked}/{count})')
+        self.decisions += 1
+        self.limit = limit
+        self.pool.max_searches = rotation
+        self._condition.notify_all()
@@ -3,212 +3,1158 @@ Core scraping orchestration for hotel price scraper
 """
 
 import time
+import random
+import threading
+from datetime import datetime
 
-from .driver import create_driver_session, wait_for_page_load, ensure_no_blocking_modals
 from .booking import (
+    hotel_name_matches,
+    navigate_to_search_results,
+    parse_destination_from_url,
     search_and_click_on_hotel, 
     select_checkin_and_checkout_dates, 
     click_on_search_button,
+    extract_page_data,
     extract_price, 
-    check_hotel_availability
+    check_hotel_availability,
+    is_blocked_page,
+    count_autocomplete_options,
+    start_search_results_navigation,
+    read_tab_state,
+    start_network_capture,
+    read_network_page_data,
+    build_search_results_url,
+    is_challenge_html,
+    parse_results_html,
+    extract_property_cards,
+    RESULTS_PAGE_SIZE
 )
+from .errors import (
+    BLOCKED, DOM_CHANGED, NOT_FOUND, TIMEOUT, UNAVAILABLE, CIRCUIT_OPEN, UNKNOWN,
+    REBUILD_SESSION, BACK_OFF, RETRY,
+    classify_exception, recovery_action
+)
+from .scheduler import TaskQueue, build_tasks
+from .breaker import CircuitBreaker, RUN, HOLD, SKIP
+from .ratelimit import get_rate_limiter, search_keys, host_key
+from .fetcher import get_http_fetcher
+from .concurrency import ConcurrencyController
+from .resolution import get_resolution_cache, normalize_hotel_name
+from .sessions import get_session_pool
+from .driver import open_tabs, implicit_wait_disabled
+from .waits import SearchDeadline, wait_until, results_rendered
 from ..utils.config import get_scraper_settings
 from ..utils.dates import calculate_dates
 from ..utils.files import load_hotel_names_from_args
+from ..utils.console import worker_output, set_worker_label
+from ..utils.prices import parse_price
+
+
+def _build_result(hotel_name, checkin_date, checkout_date, price=None, error=None, availability='Available',
+                  error_class=None, taxes=None):
+    """Build a result dictionary for a single search"""
+    currency = get_scraper_settings()['currency']
+    parsed = parse_price(price, currency)
+    parsed_taxes = parse_price(taxes, currency)
+    return {
+        'hotel_name': hotel_name,
+        'checkin': str(checkin_date),
+        'checkout': str(checkout_date),
+        'price': price,
+        'price_amount': parsed.amount if parsed else None,
+        'price_currency': parsed.currency if parsed else None,
+        'taxes_amount': parsed_taxes.amount if parsed_taxes else None,
+        'error': error,
+        'error_class': error_class,
+        'availability': availability,
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def _retry_delay(attempt, settings, base=None):
+    """Exponential backoff with jitter before retry number `attempt + 1`"""
+    base = settings['retry_backoff'] if base is None else base
+    delay = min(settings['retry_backoff_max'], base * (2 ** attempt))
+    return delay / 2 + random.uniform(0, delay / 2)
 
 
-def scrape_single_hotel(hotel_name, dates_list):
+def _load_results_directly(driver, hotel_name, checkin_date, checkout_date, deadline):
     """
-    Scrape prices for a single hotel across all provided dates
+    Try to open the results page by URL and read it
     
     Args:
-        hotel_name (str): Name of the hotel to scrape
-        dates_list (list): List of (checkin_date, checkout_date) tuples
+        driver: WebDriver instance
+        hotel_name (str): Name of the hotel
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        deadline (SearchDeadline): Time budget of this search
         
     Returns:
-        list: List of result dictionaries
+        dict or None: Page data if the page shows the right hotel, None to fall back to the UI
     """
-    print(f'🚀 Starting hotel: {hotel_name} with {len(dates_list)} dates')
+    settings = get_scraper_settings()
+    destination = _cached_destination(hotel_name)
+    capture = start_network_capture(driver) if settings['price_extraction'] == 'network' else None
+    if capture is not None:
+        return _load_results_from_network(driver, capture, hotel_name, checkin_date, checkout_date,
+                                          destination, deadline)
     
+    if not navigate_to_search_results(driver, hotel_name, checkin_date, checkout_date, destination, deadline):
+        return None
+    
+    # The URL load is complete, but cards may still be rendering client-side
+    wait_until(driver, results_rendered(), settings['results_timeout'], deadline)
+    return _check_direct_results(hotel_name, destination, extract_page_data(driver))
+
+
+def _load_results_from_network(driver, capture, hotel_name, checkin_date, checkout_date, destination, deadline):
+    """
+    Open the results page by URL and read the hotel's card from the network responses
+    
+    The card data is taken from the first response that carries it, before
+    the page has rendered. When no response has it, the page is read as usual.
+    
+    Returns:
+        dict or None: Page data if the page shows the right hotel, None to fall back to the UI
+    """
     settings = get_scraper_settings()
-    hotel_results = []
-    driver = None
-    search_count = 0
+    if not start_search_results_navigation(driver, hotel_name, checkin_date, checkout_date, destination):
+        return None
+    
+    page_data = read_network_page_data(capture, hotel_name, settings['results_timeout'], deadline)
+    if page_data is None:
+        print(f'⚠️ [{hotel_name}] No results card in the network responses, reading the page')
+        # The old document may still show cards, so wait for the new one to render
+        wait_until(driver, lambda d: read_tab_state(d) == 'rendered', settings['results_timeout'], deadline)
+        return _check_direct_results(hotel_name, destination, extract_page_data(driver))
+    
+    checked = _check_direct_results(hotel_name, destination, page_data)
+    if checked is None:
+        # The search form fallback needs the page it is going to type into
+        wait_until(driver, lambda d: read_tab_state(d) != 'loading', settings['page_load_timeout'], deadline)
+    return checked
+
+
+def _cached_destination(hotel_name):
+    """Destination of a hotel from the resolution cache, or None"""
+    destination = get_resolution_cache().get(hotel_name, get_scraper_settings()['country'])
+    if destination:
+        print(f'📇 [{hotel_name}] Using cached destination {destination["dest_id"]} ({destination.get("title")})')
+    return destination
+
+
+def _check_direct_results(hotel_name, destination, page_data):
+    """
+    Check that a results page loaded by URL shows the hotel
+    
+    Args:
+        hotel_name (str): Name of the hotel
+        destination (dict or None): Cached destination the URL was built with
+        page_data (dict or None): Result of extract_page_data on that page
+        
+    Returns:
+        dict or None: Page data if the page shows the right hotel, None to fall back to the UI
+    """
+    if not page_data or not page_data['card_found']:
+        print(f'⚠️ [{hotel_name}] No property card on direct results page, using search UI')
+        if destination:
+            get_resolution_cache().invalidate(hotel_name, get_scraper_settings()['country'])
+        return None
+    
+    if not destination and not hotel_name_matches(hotel_name, page_data['title']):
+        print(f'⚠️ [{hotel_name}] First result is "{page_data["title"]}", using search UI')
+        return None
+    
+    return page_data
+
+
+def _search_through_ui(driver, hotel_name, checkin_date, checkout_date, resolution, deadline):
+    """
+    Run the search through the autocomplete, date picker and search button
+    
+    Args:
+        driver: WebDriver instance
+        hotel_name (str): Name of the hotel
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        resolution (dict): Filled with the selected autocomplete option
+        deadline (SearchDeadline): Time budget of this search
+        
+    Returns:
+        dict or None: Failure result dictionary, or None if the results page is ready
+    """
+    # Step 1: Search for hotel
+    if not search_and_click_on_hotel(driver, hotel_name, resolution, deadline):
+        print(f'❌ [{hotel_name}] Hotel search failed')
+        # Options that did not match mean the hotel is not there; no options mean the list never loaded
+        error_class = NOT_FOUND if count_autocomplete_options(driver) else TIMEOUT
+        return _build_result(hotel_name, checkin_date, checkout_date,
+                             error='Hotel search failed', availability='Search failed', error_class=error_class)
+    
+    # Step 2: Select dates
+    if not select_checkin_and_checkout_dates(driver, checkin_date, checkout_date, deadline):
+        print(f'❌ [{hotel_name}] Date selection failed')
+        return _build_result(hotel_name, checkin_date, checkout_date,
+                             error='Date selection failed', availability='Date selection failed',
+                             error_class=DOM_CHANGED)
+    
+    # Step 3: Click search
+    if not click_on_search_button(driver, deadline):
+        print(f'❌ [{hotel_name}] Search execution failed')
+        return _build_result(hotel_name, checkin_date, checkout_date,
+                             error='Search execution failed', availability='Search failed',
+                             error_class=TIMEOUT)
+    
+    return None
+
+
+def _remember_resolution(driver, hotel_name, resolution, page_data):
+    """
+    Cache where the search form took us so later searches can go there directly
+    
+    Args:
+        driver: WebDriver instance on the results page
+        hotel_name (str): Name of the hotel
+        resolution (dict): Title and location of the selected autocomplete option
+        page_data (dict or None): Result of extract_page_data for this page
+    """
+    destination = parse_destination_from_url(driver.current_url)
+    if not destination or destination['dest_type'] != 'hotel':
+        return
+    
+    resolution.update(destination)
+    hotel_url = page_data.get('hotel_url') if page_data else None
+    resolution['url'] = hotel_url.split('?')[0] if hotel_url else None
+    get_resolution_cache().put(hotel_name, get_scraper_settings()['country'], resolution)
+
+
+def scrape_search(driver, hotel_name, checkin_date, checkout_date, deadline=None, try_direct=True):
+    """
+    Run one search (hotel + date pair) on an open browser session
+    
+    Args:
+        driver: WebDriver instance with Booking.com loaded
+        hotel_name (str): Name of the hotel to search for
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        deadline (SearchDeadline, optional): Time budget already running for this search
+        try_direct (bool): False to go straight to the search form, e.g. after a failed direct load
+        
+    Returns:
+        dict: Result dictionary for this search
+    """
+    # Element lookups must not wait past the search budget
+    with implicit_wait_disabled(driver):
+        result = _run_search(driver, hotel_name, checkin_date, checkout_date, deadline, try_direct)
+        return _check_blocked(driver, hotel_name, result)
+
+
+def _check_blocked(driver, hotel_name, result):
+    """Reclassify a failure as a block when the page is a captcha or access check"""
+    # A missing element or a slow page may really be a captcha or a proxy error page
+    if result['error_class'] in (TIMEOUT, DOM_CHANGED, NOT_FOUND) and is_blocked_page(driver):
+        print(f'🚫 [{hotel_name}] Blocked by a captcha or access check')
+        result.update(error='Blocked by captcha or access check', error_class=BLOCKED)
+    return result
+
+
+def _run_search(driver, hotel_name, checkin_date, checkout_date, deadline=None, try_direct=True):
+    """Steps of scrape_search, returning the result before block detection"""
+    settings = get_scraper_settings()
+    deadline = deadline or SearchDeadline(settings['search_budget'])
+    page_data = None
+    
+    if try_direct and settings['navigation_mode'] == 'direct':
+        page_data = _load_results_directly(driver, hotel_name, checkin_date, checkout_date, deadline)
+    
+    if page_data is None:
+        if deadline.expired():
+            print(f'⌛ [{hotel_name}] Search budget of {deadline.budget}s used up')
+            return _build_result(hotel_name, checkin_date, checkout_date,
+                                 error='Search budget exceeded', availability='Search failed',
+                                 error_class=TIMEOUT)
+        
+        resolution = {}
+        failed_result = _search_through_ui(driver, hotel_name, checkin_date, checkout_date, resolution, deadline)
+        if failed_result:
+            if deadline.expired():
+                print(f'⌛ [{hotel_name}] Search budget of {deadline.budget}s used up')
+            return failed_result
+        page_data = extract_page_data(driver)
+        _remember_resolution(driver, hotel_name, resolution, page_data)
+    
+    return _result_from_page(driver, hotel_name, checkin_date, checkout_date, page_data)
+
+
+def _result_from_page(driver, hotel_name, checkin_date, checkout_date, page_data):
+    """Build the result of a search from the results page data"""
+    # Step 4: Check availability and extract price from a single page read
+    is_available, availability_message = check_hotel_availability(driver, page_data)
+    
+    if not is_available:
+        print(f'❌ [{hotel_name}] Not available: {availability_message}')
+        # No error - just unavailable
+        return _build_result(hotel_name, checkin_date, checkout_date, availability='Not available',
+                             error_class=UNAVAILABLE)
+    
+    # Extract price
+    price = extract_price(driver, page_data)
+    if price and 'Not available' not in str(price):
+        taxes = page_data.get('taxes') if page_data else None
+        print(f'✅ [{hotel_name}] Completed: {price}' + (f' (+ {taxes} taxes and charges)' if taxes else ''))
+        return _build_result(hotel_name, checkin_date, checkout_date, price=price, taxes=taxes)
+    
+    print(f'❌ [{hotel_name}] Price extraction failed')
+    return _build_result(hotel_name, checkin_date, checkout_date,
+                         error='Price extraction failed', availability='Price extraction failed',
+                         error_class=DOM_CHANGED)
+
+
+def fetch_search_over_http(fetcher, hotel_name, checkin_date, checkout_date):
+    """
+    Answer a search from the server-rendered results page, without a browser
+    
+    Only final answers are returned: a price, or the hotel being unavailable
+    for the dates. Challenge pages, failed requests and pages that do not
+    show the hotel's price or availability are left to the browser.
+    
+    Args:
+        fetcher (HttpFetcher): Shared HTTP fetcher
+        hotel_name (str): Name of the hotel
+        checkin_date: Check-in date
+        checkout_date: Check-out date
+        
+    Returns:
+        dict or None: Result dictionary, or None if the search needs the browser
+    """
+    destination = _cached_destination(hotel_name) or {}
+    url = build_search_results_url(hotel_name, checkin_date, checkout_date,
+                                   destination.get('dest_id'), destination.get('dest_type'))
+    print(f'⚡ Fetching search results over HTTP: {url}')
+    response = fetcher.get(url)
+    if response is None:
+        return None
+    
+    status, html = response
+    if is_challenge_html(status, html):
+        print(f'🛡️ [{hotel_name}] Challenge page over HTTP (status {status}), using the browser')
+        return None
+    
+    page_data = parse_results_html(html, hotel_name, get_scraper_settings()['currency'])
+    if not page_data or not page_data['card_found']:
+        print(f'⚠️ [{hotel_name}] No property card in the HTTP response, using the browser')
+        return None
+    if not destination and not hotel_name_matches(hotel_name, page_data['title']):
+        print(f'⚠️ [{hotel_name}] First result over HTTP is "{page_data["title"]}", using the browser')
+        return None
+    if not (page_data['price'] or page_data['soldout'] or page_data['alternative_dates']):
+        print(f'⚠️ [{hotel_name}] No price in the HTTP response, using the browser')
+        return None
+    
+    result = _result_from_page(None, hotel_name, checkin_date, checkout_date, page_data)
+    return result if result['error_class'] in (None, UNAVAILABLE) else None
+
+
+def _start_tab_search(driver, handle, task):
+    """Start loading the results page of a task in a tab, without waiting for it"""
+    settings = get_scraper_settings()
+    direct = settings['navigation_mode'] == 'direct'
+    destination = _cached_destination(task.hotel_name) if direct else None
+    deadline = SearchDeadline(settings['search_budget'])
+    driver.switch_to.window(handle)
+    loading = direct and start_search_results_navigation(
+        driver, task.hotel_name, task.checkin_date, task.checkout_date, destination
+    )
+    return {'task': task, 'handle': handle, 'deadline': deadline, 'destination': destination,
+            'loading': loading, 'started_at': time.monotonic(), 'loaded_at': None, 'result': None}
+
+
+def _poll_tab_search(driver, search):
+    """
+    Check a loading tab once and read its results if they rendered (or it timed out)
+    
+    Returns:
+        bool: True once the tab is no longer loading
+    """
+    settings = get_scraper_settings()
+    task = search['task']
+    driver.switch_to.window(search['handle'])
+    state = read_tab_state(driver)
+    now = time.monotonic()
+    if state == 'loaded' and search['loaded_at'] is None:
+        search['loaded_at'] = now
+    
+    load_timed_out = search['loaded_at'] is None and (
+        now - search['started_at'] >= settings['page_load_timeout'] or search['deadline'].expired())
+    render_timed_out = (search['loaded_at'] is not None
+                        and now - search['loaded_at'] >= search['deadline'].cap(settings['results_timeout']))
+    if state != 'rendered' and not load_timed_out and not render_timed_out:
+        return False
+    
+    search['loading'] = False
+    page_data = _check_direct_results(task.hotel_name, search['destination'], extract_page_data(driver))
+    if page_data is not None:
+        result = _result_from_page(driver, task.hotel_name, task.checkin_date, task.checkout_date, page_data)
+        search['result'] = _check_blocked(driver, task.hotel_name, result)
+    return True
+
+
+def _finish_tab_search(driver, search):
+    """Result of a tab search, going through the search form in its tab if the direct load failed"""
+    if search['result'] is None:
+        task = search['task']
+        driver.switch_to.window(search['handle'])
+        search['result'] = scrape_search(driver, task.hotel_name, task.checkin_date, task.checkout_date,
+                                         search['deadline'], try_direct=False)
+    return search['result']
+
+
+def scrape_searches_in_tabs(driver, tasks):
+    """
+    Run several searches at once, one per tab of the same browser session
+    
+    Every tab starts loading its results URL without waiting for the page,
+    then the driver cycles through the tabs and reads each one as soon as
+    its cards have rendered, so one tab loads while another is being read.
+    Tabs whose direct load does not show the hotel fall back to the search
+    form afterwards, one at a time in their own tab.
+    
+    Args:
+        driver: WebDriver instance with Booking.com loaded
+        tasks (list): ScrapeTask list, one per tab
+        
+    Returns:
+        list: Result dictionaries in task order
+    """
+    handles = open_tabs(driver, len(tasks))
+    searches = [_start_tab_search(driver, handle, task) for task, handle in zip(tasks, handles)]
+    
+    # Read the tabs in the order they finish rendering
+    pending = [search for search in searches if search['loading']]
+    while pending:
+        pending = [search for search in pending if not _poll_tab_search(driver, search)]
+        if pending:
+            time.sleep(0.1)
+    
+    results = [_finish_tab_search(driver, search) for search in searches]
+    driver.switch_to.window(handles[0])
+    return results
+
+
+def scrape_search_with_prefetch(driver, task, prefetched=None, next_task=None):
+    """
+    Run one search while the results page of the next one loads in a second tab
+    
+    Pipelines a hotel's dates: date d+1 renders in the background while
+    date d is being read and recorded, so the next call usually finds its
+    page ready.
+    
+    Args:
+        driver: WebDriver instance with Booking.com loaded
+        task (ScrapeTask): Search to run now
+        prefetched (dict, optional): Tab search of `task` returned by the previous call
+        next_task (ScrapeTask, optional): Search to start loading in the background
+        
+    Returns:
+        tuple: (result of `task`, tab search of next_task to pass to the next call or None)
+    """
+    handles = open_tabs(driver, 2)
+    if prefetched is not None and prefetched['task'] == task:
+        search = prefetched
+    else:
+        search = _start_tab_search(driver, handles[0], task)
+    
+    next_search = None
+    if next_task is not None:
+        other = handles[1] if search['handle'] == handles[0] else handles[0]
+        next_search = _start_tab_search(driver, other, next_task)
+    
+    while search['loading'] and not _poll_tab_search(driver, search):
+        time.sleep(0.1)
+    return _finish_tab_search(driver, search), next_search
+
+
+def _run_worker(queue, record_result, pool, breaker, controller=None, worker_index=0):
+    """
+    Pull tasks from the queue until it is empty, on sessions leased from the pool
+    
+    Every failure is classified (see errors.py) and handled by the recovery
+    action of its class: lost sessions are rebuilt and the search runs again
+    right away, blocked sessions are dropped and the search waits for
+    blocked_backoff, other transient failures go back to the queue with an
+    exponential backoff and run again on another session. Searches are tried
+    up to max_attempts times and only the final outcome is recorded.
+    
+    Tasks of a hotel whose circuit is open are skipped, or held while a probe runs (see
+    breaker.py) without touching a browser session. With tabs_per_session
+    above 1 the worker takes that many tasks at once and runs them in
+    parallel tabs of its session. With prefetch_next_search it loads the
+    next date of the same hotel in a second tab while the current one runs.
+    With fetch_mode 'http' every search is first tried over plain HTTP and
+    only goes to a browser session when that does not answer it.
+    
+    Args:
+        queue (TaskQueue): Shared task queue
+        record_result (callable): Called with (task, result) for every finished task
+        pool (SessionPool): Pool the worker borrows browser sessions from
+        breaker (CircuitBreaker): Circuit breaker shared by all workers
+        controller (ConcurrencyController, optional): Adaptive limit on active workers
+        worker_index (int): Position of this worker, compared with the controller's limit
+    """
+    settings = get_scraper_settings()
+    limiter = get_rate_limiter()
+    tabs = max(1, settings['tabs_per_session'])
+    prefetch = settings['prefetch_next_search'] and tabs == 1
+    fetcher = get_http_fetcher() if settings['fetch_mode'] == 'http' else None
+    session = None
+    current_hotel = None
+    # (task, tab search, session id) of the search prefetched during the previous one
+    carry = None
+    # Tasks taken from the queue and not finished yet
+    held = []
+    
+    def release(task):
+        held.remove(task)
+        queue.task_done()
     
     try:
-        # Process each date for this hotel
-        for date_idx, (checkin_date, checkout_date) in enumerate(dates_list):
+        while True:
+            if controller is not None and not controller.is_active(worker_index):
+                if carry is not None:
+                    # Hand the prefetched search back, other workers wait for it to be done
+                    queue.defer(carry[0], 0)
+                    release(carry[0])
+                    carry = None
+                # Above the current limit: stop paying for a session until the limit grows
+                if session is not None:
+                    print('💤 Pausing worker, closing its session')
+                    pool.give_back(session, retire=True)
+                    session = None
+                controller.wait_for_turn(worker_index)
+            
+            prefetched = None
+            if carry is not None:
+                batch = [carry[0]]
+                prefetched = carry
+                carry = None
+            else:
+                batch = queue.get_batch(current_hotel, tabs)
+                held.extend(batch)
+            if not batch:
+                if controller is not None:
+                    controller.finish()
+                break
+            current_hotel = batch[-1].hotel_name
+            
+            tasks = []
+            for task in batch:
+                # A prefetched task passed the breaker when its page load was started
+                decision, wait = (RUN, 0) if prefetched is not None else breaker.check(task.hotel_name)
+                if decision == HOLD:
+                    queue.defer(task, wait)
+                    release(task)
+                elif decision == SKIP:
+                    try:
+                        record_result(task, _build_result(task.hotel_name, task.checkin_date, task.checkout_date,
+                                                          error=breaker.skip_reason(task.hotel_name),
+                                                          availability='Skipped', error_class=CIRCUIT_OPEN))
+                    finally:
+                        release(task)
+                else:
+                    tasks.append(task)
+            if fetcher is not None and prefetched is None:
+                # Searches the server-rendered page answers never touch a browser session
+                tasks = [task for task in tasks if not _serve_over_http(fetcher, limiter, breaker, record_result, release, task)]
+            if not tasks:
+                continue
+            
+            hotel_name = tasks[0].hotel_name
+            session_id = None
+            started = None
+            next_task = None
+            
             try:
-                # Create new session if needed
-                if search_count % settings['max_searches_per_session'] == 0 or driver is None:
-                    if driver:
-                        print(f'🔄 [{hotel_name}] Restarting browser session...')
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        time.sleep(settings['session_restart_delay'])
-                    
-                    print(f'🚀 [{hotel_name}] Starting new browser session...')
-                    driver = create_driver_session()
-                    print(f'🔗 [{hotel_name}] Connected to Bright Data')
-                    
-                    # Load Booking.com
-                    print(f'🌐 [{hotel_name}] Loading Booking.com...')
-                    driver.get(f'https://www.booking.com/?cc1={settings["country"]}&selected_currency={settings["currency"]}')
-                    
-                    if not wait_for_page_load(driver):
-                        raise Exception("Page failed to load")
-                    
-                    time.sleep(5)
-                    ensure_no_blocking_modals(driver)
-                    print(f'✅ [{hotel_name}] Page ready')
-                
-                print(f'📅 [{hotel_name}] Date {date_idx + 1}/{len(dates_list)}: {checkin_date} → {checkout_date}')
-                
-                # Check WebSocket connection
-                try:
-                    driver.current_url
-                except Exception as e:
-                    if "cdp_ws_error" in str(e) or "WebSocket" in str(e):
-                        print(f'🔌 [{hotel_name}] WebSocket lost, restarting...')
-                        driver = None
-                        continue
-                    else:
-                        raise e
+                # A retried task runs on a different session than the one it failed on
+                avoid_sessions = [task.avoid_session for task in tasks if task.avoid_session is not None]
+                if session is not None and session.id in avoid_sessions:
+                    pool.give_back(session)
+                    session = None
+                if session is None:
+                    session = pool.lease(exclude=avoid_sessions[0] if avoid_sessions else None)
+                session_id = session.id
                 
-                # Step 1: Search for hotel
-                if not search_and_click_on_hotel(driver, hotel_name):
-                    print(f'❌ [{hotel_name}] Hotel search failed')
-                    hotel_results.append({
-                        'hotel_name': hotel_name,
-                        'checkin': str(checkin_date),
-                        'checkout': str(checkout_date),
-                        'price': None,
-                        'error': 'Hotel search failed',
-                        'availability': 'Search failed'
-                    })
-                    continue
+                # Warm up the next session while this one does its last searches
+                if session.searches + len(tasks) >= pool.max_searches and queue.remaining() > 0:
+                    pool.prefetch()
                 
-                # Step 2: Select dates
-                if not select_checkin_and_checkout_dates(driver, checkin_date, checkout_date):
-                    print(f'❌ [{hotel_name}] Date selection failed')
-                    hotel_results.append({
-                        'hotel_name': hotel_name,
-                        'checkin': str(checkin_date),
-                        'checkout': str(checkout_date),
-                        'price': None,
-                        'error': 'Date selection failed',
-                        'availability': 'Date selection failed'
-                    })
-                    continue
+                # A prefetched page is only there if the search still runs on the same session
+                search = prefetched[1] if prefetched is not None and prefetched[2] == session.id else None
                 
-                # Step 3: Click search
-                if not click_on_search_button(driver):
-                    print(f'❌ [{hotel_name}] Search execution failed')
-                    hotel_results.append({
-                        'hotel_name': hotel_name,
-                        'checkin': str(checkin_date),
-                        'checkout': str(checkout_date),
-                        'price': None,
-                        'error': 'Search execution failed',
-                        'availability': 'Search failed'
-                    })
-                    continue
+                # Stay under the request rate of Booking.com and the proxy zone, across all workers
+                # (a prefetched search paid for its page load when it was started)
+                for task in tasks if search is None else []:
+                    waited = limiter.acquire(search_keys())
+                    if waited >= 1:
+                        print(f'⏸️ [{task.hotel_name}] Waited {waited:.0f}s for the rate limit')
                 
-                # Step 4: Check availability and extract price
-                is_available, availability_message = check_hotel_availability(driver)
+                for task in tasks:
+                    attempt_note = f', attempt {task.attempt + 1}' if task.attempt else ''
+                    print(f'📅 [{task.hotel_name}] {task.checkin_date} → {task.checkout_date} '
+                          f'(session {session.id}{attempt_note}, {queue.remaining()} tasks left in queue)')
                 
-                if not is_available:
-                    print(f'❌ [{hotel_name}] Not available: {availability_message}')
-                    hotel_results.append({
-                        'hotel_name': hotel_name,
-                        'checkin': str(checkin_date),
-                        'checkout': str(checkout_date),
-                        'price': None,
-                        'error': None,  # No error - just unavailable
-                        'availability': 'Not available'
-                    })
+                started = time.monotonic()
+                if prefetch:
+                    # No prefetch on the last search of a session, its tabs are about to go
+                    if session.searches + 1 < pool.max_searches:
+                        next_task = _take_prefetch_task(queue, breaker, limiter, hotel_name)
+                        if next_task is not None:
+                            held.append(next_task)
+                    result, next_search = scrape_search_with_prefetch(session.driver, tasks[0], search, next_task)
+                    results = [result]
+                    if next_task is not None:
+                        carry = (next_task, next_search, session.id)
+                        next_task = None
+                elif len(tasks) == 1:
+                    results = [scrape_search(session.driver, hotel_name, tasks[0].checkin_date, tasks[0].checkout_date)]
                 else:
-                    # Extract price
-                    price = extract_price(driver)
-                    if price and 'Not available' not in str(price):
-                        print(f'✅ [{hotel_name}] Completed: {price}')
-                        hotel_results.append({
-                            'hotel_name': hotel_name,
-                            'checkin': str(checkin_date),
-                            'checkout': str(checkout_date),
-                            'price': price,
-                            'error': None,
-                            'availability': 'Available'
-                        })
-                    else:
-                        print(f'❌ [{hotel_name}] Price extraction failed')
-                        hotel_results.append({
-                            'hotel_name': hotel_name,
-                            'checkin': str(checkin_date),
-                            'checkout': str(checkout_date),
-                            'price': None,
-                            'error': 'Price extraction failed',
-                            'availability': 'Price extraction failed'
-                        })
-                
-                search_count += 1
+                    results = scrape_searches_in_tabs(session.driver, tasks)
+                session.searches += len(tasks)
                 
-                # Wait between searches
-                if date_idx < len(dates_list) - 1:
-                    print('⏸️ Waiting...')
-                    print('\n')
-                    time.sleep(settings['search_delay'])
+                # Hand back sessions that reached their search limit so they get retired
+                if session.searches >= pool.max_searches:
+                    print(f'🔄 [{hotel_name}] Rotating browser session...')
+                    pool.give_back(session)
+                    session = None
             
             except Exception as e:
                 error_msg = str(e)
                 print(f'❌ [{hotel_name}] Error: {error_msg}')
-                
-                if "cdp_ws_error" in error_msg or "WebSocket" in error_msg:
-                    driver = None
-                
-                hotel_results.append({
-                    'hotel_name': hotel_name,
-                    'checkin': str(checkin_date),
-                    'checkout': str(checkout_date),
-                    'price': None,
-                    'error': f'Exception: {error_msg}',
-                    'availability': 'Error'
-                })
-        
-        # Print summary for this hotel
-        successful = len([r for r in hotel_results if r['price'] is not None])
-        print(f'\n📊 Summary for {hotel_name}:')
-        print(f'   ✅ Successful: {successful}/{len(hotel_results)}')
-        print(f'   ❌ Failed: {len(hotel_results) - successful}/{len(hotel_results)}')
+                if next_task is not None:
+                    # The prefetch never got going: put the next search back in line
+                    queue.defer(next_task, 0)
+                    release(next_task)
+                results = [
+                    _build_result(task.hotel_name, task.checkin_date, task.checkout_date,
+                                  error=f'Exception: {error_msg}', availability='Error',
+                                  error_class=classify_exception(e))
+                    for task in tasks
+                ]
+            
+            latency = time.monotonic() - started if started is not None else None
+            actions = [recovery_action(result['error_class']) for result in results]
+            for action, result in zip(actions, results):
+                if action in (REBUILD_SESSION, BACK_OFF) and session is not None:
+                    # Lost sessions are useless and blocked ones carry a flagged proxy IP
+                    print(f'🔌 [{hotel_name}] Dropping session ({result["error_class"]}), restarting...')
+                    pool.give_back(session, lost=True)
+                    session = None
+                    pool.prefetch()
+            
+            for task, result, action in zip(tasks, results, actions):
+                # Attempts that will be retried are not the hotel's final answer
+                breaker.record(task.hotel_name, result['error_class'],
+                               final=not _will_retry(task, action, settings))
+                if controller is not None and latency is not None:
+                    controller.record(result, latency)
+                try:
+                    _finish_task(queue, record_result, task, result, action, session_id, settings)
+                finally:
+                    release(task)
+    
+    except Exception as e:
+        # Record whatever the worker still holds so the queue drains and the other workers finish
+        for task in list(held):
+            try:
+                record_result(task, _build_result(task.hotel_name, task.checkin_date, task.checkout_date,
+                                                  error=f'Exception: {str(e)}', availability='Error',
+                                                  error_class=UNKNOWN))
+            finally:
+                release(task)
+        raise
+    
+    finally:
+        if session is not None:
+            pool.give_back(session)
+
+
+def _serve_over_http(fetcher, limiter, breaker, record_result, release, task):
+    """Record a task answered over HTTP; False when it has to go to the browser"""
+    # Through a proxy the request also counts against the proxy zone
+    limiter.acquire(search_keys() if fetcher.proxy_url else (host_key(),))
+    try:
+        result = fetch_search_over_http(fetcher, task.hotel_name, task.checkin_date, task.checkout_date)
+    except Exception as e:
+        # Whatever breaks on the fast path, the browser can still answer the search
+        print(f'⚠️ [{task.hotel_name}] HTTP search failed ({type(e).__name__}: {e}), using the browser')
+        result = None
+    if result is None:
+        fetcher.count('escalated')
+        return False
+    
+    fetcher.count('served')
+    breaker.record(task.hotel_name, result['error_class'])
+    try:
+        record_result(task, result)
+    finally:
+        release(task)
+    return True
+
+
+def _take_prefetch_task(queue, breaker, limiter, hotel_name):
+    """Take the next search of a hotel to load in the background, if it may run now"""
+    task = queue.take_next(hotel_name)
+    if task is None:
+        return None
+    
+    decision, wait = breaker.check(hotel_name)
+    if decision != RUN:
+        # Let the normal flow hold or skip it
+        queue.defer(task, wait)
+        queue.task_done()
+        return None
+    
+    limiter.acquire(search_keys())
+    return task
+
+
+def _will_retry(task, action, settings):
+    """Whether a task that ended with this recovery action goes back to the queue"""
+    return action in (REBUILD_SESSION, BACK_OFF, RETRY) and task.attempt + 1 < settings['max_attempts']
+
+
+def _finish_task(queue, record_result, task, result, action, session_id, settings):
+    """Record the result of a task, or hand the task back for a retry"""
+    if _will_retry(task, action, settings):
+        if action == REBUILD_SESSION:
+            delay = 0
+        elif action == BACK_OFF:
+            delay = _retry_delay(task.attempt, settings, base=settings['blocked_backoff'])
+        else:
+            delay = _retry_delay(task.attempt, settings)
+        print(f'🔁 [{task.hotel_name}] {result["error"]} ({result["error_class"]}) - retrying in {delay:.0f}s '
+              f'on another session (attempt {task.attempt + 2}/{settings["max_attempts"]})')
+        queue.retry(task._replace(attempt=task.attempt + 1, avoid_session=session_id), delay)
+    else:
+        record_result(task, result)
+
+
+def _run_worker_thread(queue, record_result, pool, breaker, controller, worker_index):
+    """Worker thread entry point with labelled console output"""
+    set_worker_label(threading.current_thread().name)
+    try:
+        _run_worker(queue, record_result, pool, breaker, controller, worker_index)
+    except Exception as e:
+        print(f'❌ Worker crashed: {str(e)}')
+        if controller is not None:
+            # A paused worker takes its place under the same limit
+            controller.worker_lost(worker_index)
+    finally:
+        set_worker_label(None)
+
+
+def run_tasks(tasks, workers=1, on_result=None):
+    """
+    Run search tasks through a shared queue with one or more workers
+    
+    Every worker leases its own browser session from the shared session
+    pool. Idle workers take over remaining dates of other hotels, so a slow
+    hotel does not hold up the end of the run.
+    
+    Args:
+        tasks (list): List of ScrapeTask
+        workers (int): Number of concurrent workers
+        on_result (callable, optional): Called with each result as soon as it is
+            produced. When given, results are handed over instead of kept in memory.
         
-        return hotel_results
+    Returns:
+        list: Result dictionaries in task order (empty when on_result is given)
+    """
+    queue = TaskQueue(tasks)
+    results = [None] * len(tasks) if on_result is None else []
+    result_lock = threading.Lock()
+    workers = max(1, min(workers, len(tasks)))
+    pool = get_session_pool(workers)
+    settings = get_scraper_settings()
+    breaker = CircuitBreaker(settings['circuit_breaker_threshold'], settings['circuit_breaker_cooldown'],
+                             settings['circuit_breaker_max_probes'])
+    counts = {'skipped': 0}
+    controller = None
+    if settings['adaptive_concurrency'] and workers > 1:
+        controller = ConcurrencyController(
+            pool, workers,
+            min_workers=settings['adaptive_min_workers'],
+            window=settings['adaptive_window'],
+            min_success_rate=settings['adaptive_min_success_rate'],
+            max_p90_latency=settings['adaptive_max_p90_latency'],
+            min_rotation=settings['adaptive_min_searches_per_session'],
+            max_rotation=settings['adaptive_max_searches_per_session']
+        )
+    
+    def record_result(task, result):
+        with result_lock:
+            if result['error_class'] == CIRCUIT_OPEN:
+                counts['skipped'] += 1
+            if on_result is None:
+                results[task.index] = result
+            else:
+                on_result(result)
+    
+    if workers == 1:
+        _run_worker(queue, record_result, pool, breaker)
+    else:
+        if controller is not None:
+            print(f'👷 Running up to {workers} workers on a shared queue of {len(tasks)} searches, '
+                  f'starting with {controller.limit}')
+        else:
+            print(f'👷 Running {workers} workers on a shared queue of {len(tasks)} searches')
+        with worker_output():
+            threads = [
+                threading.Thread(target=_run_worker_thread, args=(queue, record_result, pool, breaker, controller, i),
+                                 name=f'W{i + 1}', daemon=True)
+                for i in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    
+    if queue.retried:
+        print(f'🔁 {queue.retried} failed searches were retried during the run')
+    if controller is not None and controller.decisions:
+        print(f'🎛️ Finished with {controller.limit} active workers and {pool.max_searches} searches per session')
+    if counts['skipped']:
+        print(f'⛔ {counts["skipped"]} searches were skipped by open circuits (use --retry to run them later)')
+    
+    return [result for result in results if result is not None]
+
+
+def scrape_single_hotel(hotel_name, dates_list, on_result=None):
+    """
+    Scrape prices for a single hotel across all provided dates
+    
+    Args:
+        hotel_name (str): Name of the hotel to scrape
+        dates_list (list): List of (checkin_date, checkout_date) tuples
+        on_result (callable, optional): Called with each result as soon as it is produced
         
+    Returns:
+        list: List of result dictionaries (empty when on_result is given)
+    """
+    print(f'🚀 Starting hotel: {hotel_name} with {len(dates_list)} dates')
+    
+    hotel_results = []
+    counts = {'total': 0, 'successful': 0}
+    
+    def count_result(result):
+        counts['total'] += 1
+        if result['price'] is not None:
+            counts['successful'] += 1
+        if on_result is None:
+            hotel_results.append(result)
+        else:
+            on_result(result)
+    
+    try:
+        run_tasks(build_tasks([hotel_name], dates_list), on_result=count_result)
     except Exception as e:
         print(f'❌ Critical error for {hotel_name}: {str(e)}')
-        return hotel_results
+        return []
     
-    finally:
-        if driver:
+    # Print summary for this hotel
+    print(f'\n📊 Summary for {hotel_name}:')
+    print(f'   ✅ Successful: {counts["successful"]}/{counts["total"]}')
+    print(f'   ❌ Failed: {counts["total"] - counts["successful"]}/{counts["total"]}')
+    
+    return hotel_results
+
+
+def scrape_hotels(hotel_names, dates_list, workers=1, on_result=None, completed=None):
+    """
+    Scrape every hotel for every date pair
+    
+    Args:
+        hotel_names (list): Hotel names to process
+        dates_list (list): List of (checkin_date, checkout_date) tuples
+        workers (int): Number of concurrent workers
+        on_result (callable, optional): Called with each result as soon as it is
+            produced. When given, results are not accumulated in memory.
+        completed (set, optional): (hotel_name, checkin, checkout) string tuples
+            that already have a result and must be skipped
+        
+    Returns:
+        list: List of all scraping results (empty when on_result is given)
+    """
+    completed = completed or set()
+    
+    tasks = [
+        task for task in build_tasks(hotel_names, dates_list)
+        if (task.hotel_name, str(task.checkin_date), str(task.checkout_date)) not in completed
+    ]
+    
+    if completed:
+        print(f'⏭️ Skipping {len(hotel_names) * len(dates_list) - len(tasks)} searches that already have a result')
+    if not tasks:
+        print('✅ Nothing left to scrape')
+        return []
+    
+    print(f'\n🚀 Starting scraper for {len(hotel_names)} hotels × {len(dates_list)} dates = {len(tasks)} searches to run')
+    
+    if workers > 1:
+        return run_tasks(tasks, workers, on_result)
+    
+    # Remaining dates per hotel, in hotel order
+    hotel_dates = {}
+    for task in tasks:
+        hotel_dates.setdefault(task.hotel_name, []).append((task.checkin_date, task.checkout_date))
+    
+    all_results = []
+    
+    # Sequential processing
+    for hotel_idx, (hotel_name, remaining_dates) in enumerate(hotel_dates.items()):
+        print(f'\n{"="*60}')
+        print(f'🏨 HOTEL {hotel_idx + 1}/{len(hotel_dates)}: {hotel_name}')
+        print(f'{"="*60}')
+        
+        hotel_results = scrape_single_hotel(hotel_name, remaining_dates, on_result)
+        all_results.extend(hotel_results)
+    
+    return all_results
+
+
+def _match_property_cards(hotel_names, cards, matched):
+    """
+    Assign the property cards of a results page to the hotels they show
+    
+    Exact (normalized) name matches are assigned first, then partial ones;
+    a card is assigned to at most one hotel.
+    
+    Args:
+        hotel_names (list): Hotels looked for
+        cards (list): Page data of each card, from extract_property_cards
+        matched (dict): Card by hotel name found so far, updated in place
+    """
+    titles = [normalize_hotel_name(card.get('title') or '') for card in cards]
+    used = set()
+    for exact in (True, False):
+        for hotel_name in hotel_names:
+            if hotel_name in matched:
+                continue
+            wanted = normalize_hotel_name(hotel_name)
+            for index, title in enumerate(titles):
+                if index in used or not title:
+                    continue
+                if title == wanted if exact else hotel_name_matches(wanted, title):
+                    matched[hotel_name] = cards[index]
+                    used.add(index)
+                    break
+
+
+def _sweep_dates(driver, destination, hotel_names, checkin_date, checkout_date):
+    """
+    Search a destination once for a date pair and read every hotel from its results pages
+    
+    Pages are loaded by offset until every hotel was found, a page comes back
+    short (the last one) or sweep_max_pages pages were read.
+    
+    Returns:
+        tuple: (results in hotel_names order, pages loaded, error class of a
+            sweep that did not load any results or None)
+    """
+    settings = get_scraper_settings()
+    limiter = get_rate_limiter()
+    matched = {}
+    pages = 0
+    cards_seen = 0
+    
+    for page in range(settings['sweep_max_pages']):
+        waited = limiter.acquire(search_keys())
+        if waited >= 1:
+            print(f'⏸️ [{destination}] Waited {waited:.0f}s for the rate limit')
+        deadline = SearchDeadline(settings['search_budget'])
+        pages += 1
+        if not navigate_to_search_results(driver, destination, checkin_date, checkout_date,
+                                          deadline=deadline, offset=page * RESULTS_PAGE_SIZE):
+            break
+        wait_until(driver, results_rendered(), settings['results_timeout'], deadline)
+        cards = extract_property_cards(driver) or []
+        cards_seen += len(cards)
+        _match_property_cards(hotel_names, cards, matched)
+        print(f'🗺️ [{destination}] {checkin_date} → {checkout_date} page {page + 1}: {len(cards)} properties, '
+              f'{len(matched)}/{len(hotel_names)} hotels found')
+        if len(matched) == len(hotel_names) or len(cards) < RESULTS_PAGE_SIZE:
+            break
+    
+    if not cards_seen:
+        blocked = is_blocked_page(driver)
+        error_class = BLOCKED if blocked else TIMEOUT
+        error = 'Blocked by captcha or access check' if blocked else 'Destination results did not load'
+        print(f'❌ [{destination}] No results loaded for {checkin_date} → {checkout_date} ({error_class})')
+        return [
+            _build_result(hotel_name, checkin_date, checkout_date, error=error,
+                          availability='Search failed', error_class=error_class)
+            for hotel_name in hotel_names
+        ], pages, error_class
+    
+    results = []
+    for hotel_name in hotel_names:
+        card = matched.get(hotel_name)
+        if card is None:
+            print(f'❌ [{hotel_name}] Not in the results for {destination}')
+            results.append(_build_result(hotel_name, checkin_date, checkout_date,
+                                         error='Hotel not in destination results',
+                                         availability='Search failed', error_class=NOT_FOUND))
+        else:
+            results.append(_result_from_page(None, hotel_name, checkin_date, checkout_date, card))
+    return results, pages, None
+
+
+def _run_sweep_worker(queue, destination, hotel_names, record_results, pool):
+    """Sweep date pairs from the queue until it is drained, on sessions leased from the pool"""
+    settings = get_scraper_settings()
+    session = None
+    
+    try:
+        while True:
+            task = queue.get(destination)
+            if task is None:
+                break
+            
             try:
-                driver.quit()
-            except:
-                pass
+                try:
+                    if session is None:
+                        session = pool.lease()
+                    results, pages, error_class = _sweep_dates(session.driver, destination, hotel_names,
+                                                               task.checkin_date, task.checkout_date)
+                    session.searches += pages
+                except Exception as e:
+                    error_class = classify_exception(e)
+                    print(f'❌ [{destination}] Error: {str(e)}')
+                    results = [
+                        _build_result(hotel_name, task.checkin_date, task.checkout_date,
+                                      error=f'Exception: {str(e)}', availability='Error', error_class=error_class)
+                        for hotel_name in hotel_names
+                    ]
+                
+                action = recovery_action(error_class)
+                if session is not None and (action in (REBUILD_SESSION, BACK_OFF)
+                                            or session.searches >= pool.max_searches):
+                    pool.give_back(session, lost=action in (REBUILD_SESSION, BACK_OFF))
+                    session = None
+                
+                if _will_retry(task, action, settings):
+                    base = settings['blocked_backoff'] if action == BACK_OFF else None
+                    delay = 0 if action == REBUILD_SESSION else _retry_delay(task.attempt, settings, base=base)
+                    print(f'🔁 [{destination}] {task.checkin_date} → {task.checkout_date} failed ({error_class}) - '
+                          f'retrying in {delay:.0f}s (attempt {task.attempt + 2}/{settings["max_attempts"]})')
+                    # Back in the queue with a ready time: the other date pairs go on meanwhile
+                    queue.retry(task._replace(attempt=task.attempt + 1), delay)
+                else:
+                    record_results(results)
+            finally:
+                queue.task_done()
+    
+    finally:
+        if session is not None:
+            pool.give_back(session)
+
 
+def _run_sweep_worker_thread(*args):
+    """Sweep worker thread entry point with labelled console output"""
+    set_worker_label(threading.current_thread().name)
+    try:
+        _run_sweep_worker(*args)
+    except Exception as e:
+        print(f'❌ Worker crashed: {str(e)}')
+    finally:
+        set_worker_label(None)
 
-def scrape_hotels_with_args(args):
+
+def sweep_destination(destination, hotel_names, dates_list, workers=1, on_result=None, completed=None):
+    """
+    Scrape every hotel for every date pair from one destination search per date pair
+    
+    Instead of a search per hotel, the city or district is searched once for
+    each date pair and every property card of its results pages is read in
+    one script call per page, then matched to the hotel names. A run costs
+    about pages × dates page loads instead of hotels × dates. Hotels that
+    are not among the results are recorded as not found, so --retry can
+    search them one by one. Failed date pairs are retried through a
+    TaskQueue; the per-hotel circuit breaker and adaptive concurrency do not
+    apply, since a failure belongs to the whole date pair.
+    
+    Args:
+        destination (str): City or district to search, e.g. "Bogotá"
+        hotel_names (list): Hotels to report
+        dates_list (list): List of (checkin_date, checkout_date) tuples
+        workers (int): Number of date pairs swept at once, each on its own session
+        on_result (callable, optional): Called with each result as soon as it is
+            produced. When given, results are not accumulated in memory.
+        completed (set, optional): (hotel_name, checkin, checkout) string tuples
+            that already have a result and must be skipped
+        
+    Returns:
+        list: Result dictionaries (empty when on_result is given)
+    """
+    completed = completed or set()
+    pending = [
+        (checkin_date, checkout_date) for checkin_date, checkout_date in dates_list
+        if any((hotel_name, str(checkin_date), str(checkout_date)) not in completed for hotel_name in hotel_names)
+    ]
+    if not pending:
+        print('✅ Nothing left to scrape')
+        return []
+    
+    print(f'\n🗺️ Sweeping {destination} for {len(hotel_names)} hotels × {len(pending)} dates')
+    # One task per date pair, all under the destination's name
+    queue = TaskQueue(build_tasks([destination], pending))
+    results = []
+    lock = threading.Lock()
+    workers = max(1, min(workers, len(pending)))
+    pool = get_session_pool(workers)
+    
+    def record_results(date_results):
+        with lock:
+            for result in date_results:
+                if (result['hotel_name'], result['checkin'], result['checkout']) in completed:
+                    continue
+                if on_result is None:
+                    results.append(result)
+                else:
+                    on_result(result)
+    
+    if workers == 1:
+        _run_sweep_worker(queue, destination, hotel_names, record_results, pool)
+    else:
+        print(f'👷 Running {workers} workers over {len(pending)} date pairs')
+        with worker_output():
+            threads = [
+                threading.Thread(target=_run_sweep_worker_thread,
+                                 args=(queue, destination, hotel_names, record_results, pool),
+                                 name=f'W{i + 1}', daemon=True)
+                for i in range(workers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    
+    return results
+
+
+def scrape_hotels_with_args(args, on_result=None, on_plan=None):
     """
     Main scraping function that uses command line arguments
     
     Args:
         args: Parsed command line arguments
+        on_result (callable, optional): Called with each result as soon as it is
+            produced. When given, results are not accumulated in memory.
+        on_plan (callable, optional): Called with (hotel_names, dates_list) before
+            scraping starts, e.g. to checkpoint the run
         
     Returns:
-        list: List of all scraping results
+        list: List of all scraping results (empty when on_result is given)
     """
-    settings = get_scraper_settings()
-    
     # Load hotels and dates
     hotel_names = load_hotel_names_from_args(args)
     if not hotel_names:
@@ -220,22 +1166,11 @@ def scrape_hotels_with_args(args):
         print('❌ No dates to process')
         return []
     
-    print(f'\n🚀 Starting scraper for {len(hotel_names)} hotels × {len(dates_list)} dates = {len(hotel_names) * len(dates_list)} total searches')
-    
-    all_results = []
-    
-    # Sequential processing
-    for hotel_idx, hotel_name in enumerate(hotel_names):
-        print(f'\n{"="*60}')
-        print(f'🏨 HOTEL {hotel_idx + 1}/{len(hotel_names)}: {hotel_name}')
-        print(f'{"="*60}')
-        
-        hotel_results = scrape_single_hotel(hotel_name, dates_list)
-        all_results.extend(hotel_results)
-        
-        # Wait between hotels (if multiple)
-        if hotel_idx < len(hotel_names) - 1:
-            print(f'\n⏸️ Waiting before next hotel...')
-            time.sleep(settings['hotel_delay'])
+    if on_plan is not None:
+        on_plan(hotel_names, dates_list)
     
-    return all_results 
\ No newline at end of file
+    workers = getattr(args, 'workers', 1) or 1
+    destination = getattr(args, 'destination', None)
+    if destination:
+        return sweep_destination(destination, hotel_names, dates_list, workers, on_result)
+    return scrape_hotels(hotel_names, dates_list, workers, on_result)
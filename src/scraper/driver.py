@@ -2,16 +2,23 @@
 WebDriver management for hotel price scraper
 """
 
+import json
 import time
+import base64
+from contextlib import contextmanager
 from selenium.webdriver import Remote, ChromeOptions
 from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from .waits import wait_until, document_ready, element_visible, element_gone
 from ..utils.config import get_webdriver_url, get_scraper_settings
 
 
+SIGN_IN_MODAL_SELECTOR = "button[aria-label='Dismiss sign-in info.']"
+
+
 def create_driver_session():
     """
     Create a new WebDriver session with Bright Data proxy
@@ -30,6 +37,10 @@ def create_driver_session():
         'timeout': 60000
     })
 
+    if settings['price_extraction'] == 'network':
+        # Chrome DevTools network events, read back through the performance log
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
     options.add_argument(f"--lang={settings['language']}")
     options.add_argument(f"--accept-language={settings['language']},es,en")
     
@@ -47,26 +58,195 @@ def create_driver_session():
     return driver
 
 
-def wait_for_page_load(driver, timeout=30):
+def start_booking_session():
+    """
+    Open a new browser session with Booking.com loaded and ready to search
+    
+    Returns:
+        WebDriver: Ready to use WebDriver instance
+    """
+    settings = get_scraper_settings()
+    
+    print('🚀 Starting new browser session...')
+    driver = create_driver_session()
+    print('🔗 Connected to Bright Data')
+    
+    try:
+        # Load Booking.com
+        print('🌐 Loading Booking.com...')
+        driver.get(f'https://www.booking.com/?cc1={settings["country"]}&selected_currency={settings["currency"]}')
+        
+        if not wait_for_page_load(driver):
+            raise Exception("Page failed to load")
+        
+        wait_until(driver, element_visible("input[name='ss']"), 10)
+        ensure_no_blocking_modals(driver)
+    except Exception:
+        try:
+            driver.quit()
+        except:
+            pass
+        raise
+    
+    print('✅ Page ready')
+    return driver
+
+
+@contextmanager
+def implicit_wait_disabled(driver):
+    """
+    Turn the session's implicit wait off for a block of code
+    
+    A missing element then fails at once instead of waiting up to
+    `implicit_wait` seconds, which no SearchDeadline could cap; waits that
+    matter go through wait_until with the search budget.
+    
+    Args:
+        driver: WebDriver instance
+    """
+    driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        try:
+            driver.implicitly_wait(get_scraper_settings()['implicit_wait'])
+        except Exception:
+            # A lost session is reported by the search itself
+            pass
+
+
+def is_session_alive(driver):
+    """
+    Cheap liveness probe for a remote browser session
+    
+    Args:
+        driver: WebDriver instance
+        
+    Returns:
+        bool: True if the browser still answers commands
+    """
+    try:
+        return driver.execute_script('return 1;') == 1
+    except Exception:
+        return False
+
+
+def open_tabs(driver, count):
+    """
+    Make sure the browser has at least `count` tabs
+    
+    Args:
+        driver: WebDriver instance
+        count (int): Number of tabs needed
+        
+    Returns:
+        list: Window handles of the first `count` tabs
+    """
+    handles = driver.window_handles
+    if len(handles) < count:
+        current = driver.current_window_handle
+        for _ in range(count - len(handles)):
+            driver.switch_to.new_window('tab')
+        driver.switch_to.window(current)
+        handles = driver.window_handles
+    return handles[:count]
+
+
+def execute_cdp(driver, command, params=None):
+    """
+    Run a Chrome DevTools Protocol command in the remote browser
+    
+    Args:
+        driver: WebDriver instance
+        command (str): CDP method, e.g. 'Network.getResponseBody'
+        params (dict, optional): Parameters of the method
+        
+    Returns:
+        dict: Result of the command
+    """
+    return driver.execute('executeCdpCommand', {'cmd': command, 'params': params or {}})['value']
+
+
+class NetworkCapture:
+    """
+    Responses received by the browser, read from the DevTools performance log
+    
+    Needs a session created with price_extraction set to 'network'. Creating
+    a capture discards the events logged so far, so create it right before
+    starting the navigation to watch. Only responses whose URL contains one
+    of `url_patterns` are kept, and their body is fetched over CDP once the
+    browser has finished loading them.
+    """
+    
+    def __init__(self, driver, url_patterns):
+        self.driver = driver
+        self.url_patterns = tuple(url_patterns)
+        # Request id -> (url, mime type) of matching responses still loading
+        self._loading = {}
+        self._events()
+    
+    def _events(self):
+        events = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            events.append((message.get('method'), message.get('params') or {}))
+        return events
+    
+    def poll(self):
+        """
+        Bodies of the matching responses that finished loading since the last poll
+        
+        Returns:
+            list: (url, mime type, body text) of each response, in arrival order
+        """
+        responses = []
+        for method, params in self._events():
+            request_id = params.get('requestId')
+            if method == 'Network.responseReceived':
+                response = params.get('response') or {}
+                url = response.get('url', '')
+                if any(pattern in url for pattern in self.url_patterns):
+                    self._loading[request_id] = (url, response.get('mimeType', ''))
+            elif method == 'Network.loadingFinished' and request_id in self._loading:
+                url, mime_type = self._loading.pop(request_id)
+                body = self._response_body(request_id)
+                if body is not None:
+                    responses.append((url, mime_type, body))
+            elif method == 'Network.loadingFailed':
+                self._loading.pop(request_id, None)
+        return responses
+    
+    def _response_body(self, request_id):
+        try:
+            response = execute_cdp(self.driver, 'Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            print(f'⚠️ Could not read response body: {e}')
+            return None
+        body = response.get('body', '')
+        if response.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        return body
+
+
+def wait_for_page_load(driver, timeout=30, deadline=None):
     """
     Wait for page to load completely
     
     Args:
         driver: WebDriver instance
         timeout (int): Maximum wait time in seconds
+        deadline (SearchDeadline, optional): Search budget capping the timeout
         
     Returns:
         bool: True if page loaded successfully, False otherwise
     """
-    try:
-        wait = WebDriverWait(driver, timeout)
-        wait.until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
-        )
+    if wait_until(driver, document_ready(), timeout, deadline):
         return True
-    except Exception as e:
-        print(f'⚠️ Page load wait error: {str(e)}')
-        return False
+    print('⚠️ Page load wait timed out')
+    return False
 
 
 def close_modal(driver):
@@ -85,20 +265,14 @@ def close_modal(driver):
         
         # Check if modal exists and is visible
         modal = wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Dismiss sign-in info.']"))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, SIGN_IN_MODAL_SELECTOR))
         )
         
         print('🎯 Modal found, attempting to close...')
         driver.execute_script("arguments[0].click();", modal)
-        time.sleep(2)
         
         # Verify modal is closed
-        try:
-            modal = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Dismiss sign-in info.']")
-            if not modal.is_displayed():
-                return True
-        except:
-            return True
+        return bool(wait_until(driver, element_gone(SIGN_IN_MODAL_SELECTOR), 2))
             
     except Exception as e:
         print(f'⚠️ Modal close attempt failed: {str(e)}')
@@ -113,15 +287,12 @@ def ensure_no_blocking_modals(driver):
         driver: WebDriver instance
     """
     print('🔍 Checking if modal is present...')
-    try:
-        modal = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Dismiss sign-in info.']")
-        if modal.is_displayed():
-            print('🎯 Modal found, attempting to close...')
-            if close_modal(driver):
-                print('🎉 Modal closed successfully!')
-            else:
-                print('⚠️ Failed to close modal')
+    # Checked inside the page so a missing modal does not cost the implicit wait
+    if element_visible(SIGN_IN_MODAL_SELECTOR)(driver):
+        print('🎯 Modal found, attempting to close...')
+        if close_modal(driver):
+            print('🎉 Modal closed successfully!')
         else:
-            print('ℹ️ Modal exists but not visible, continuing...')
-    except:
+            print('⚠️ Failed to close modal')
+    else:
         print('👍🏾 No modal present, continuing...') 
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+Error classification for hotel price scraper
+
+Every failed search gets an error class, and every error class maps to the
+recovery action the scheduler takes for it.
+"""
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSessionIdException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException
+)
+
+
+# Error classes
+SESSION_LOST = 'session_lost'      # Browser session or connection to it is gone
+BLOCKED = 'blocked'                # Captcha, bot challenge or proxy refusing the request
+DOM_CHANGED = 'dom_changed'        # Expected elements missing or not interactable
+NOT_FOUND = 'not_found'            # Hotel not found in the autocomplete
+TIMEOUT = 'timeout'                # Page or step did not finish in time
+UNAVAILABLE = 'unavailable'        # No rooms for the dates: an answer, not a failure
+CIRCUIT_OPEN = 'circuit_open'      # Not searched: the hotel kept failing the same way
+UNKNOWN = 'unknown'                # Anything else
+
+# Recovery actions
+REBUILD_SESSION = 'rebuild_session'    # Drop the session and run the search again right away
+BACK_OFF = 'back_off'                  # Drop the session (and its proxy IP), retry after a long pause
+RETRY = 'retry'                        # Retry after a short pause on another session
+SKIP_HOTEL = 'skip_hotel'              # Retrying now will not help, keep the failure for later
+NO_ACTION = 'no_action'                # Final outcome
+
+RECOVERY_ACTIONS = {
+    SESSION_LOST: REBUILD_SESSION,
+    BLOCKED: BACK_OFF,
+    DOM_CHANGED: RETRY,
+    NOT_FOUND: SKIP_HOTEL,
+    TIMEOUT: RETRY,
+    UNAVAILABLE: NO_ACTION,
+    CIRCUIT_OPEN: SKIP_HOTEL,
+    UNKNOWN: RETRY
+}
+
+# Classes of searches that did not get an answer and are picked up by --retry
+FAILED_CLASSES = frozenset({SESSION_LOST, BLOCKED, DOM_CHANGED, NOT_FOUND, TIMEOUT, CIRCUIT_OPEN, UNKNOWN})
+
+# Error messages of results saved without an error class
+ERROR_CLASS_BY_MESSAGE = {
+    'Hotel search failed': NOT_FOUND,
+    'Date selection failed': DOM_CHANGED,
+    'Search execution failed': TIMEOUT,
+    'Search budget exceeded': TIMEOUT,
+    'Price extraction failed': DOM_CHANGED,
+    'Blocked by captcha or access check': BLOCKED,
+    'Destination results did not load': TIMEOUT,
+    'Hotel not in destination results': NOT_FOUND
+}
+
+FAILED_AVAILABILITY = frozenset({'Search failed', 'Date selection failed', 'Price extraction failed', 'Skipped', 'Error'})
+
+_EXCEPTION_CLASSES = (
+    ((InvalidSessionIdException, NoSuchWindowException, ConnectionError), SESSION_LOST),
+    ((TimeoutException,), TIMEOUT),
+    ((NoSuchElementException, StaleElementReferenceException,
+      ElementNotInteractableException, ElementClickInterceptedException), DOM_CHANGED)
+)
+
+# Generic WebDriverException messages, lowercase
+_MESSAGE_PATTERNS = (
+    (('cdp_ws_error', 'websocket', 'invalid session id', 'disconnected', 'session deleted',
+      'connection refused', 'connection reset', 'max retries exceeded'), SESSION_LOST),
+    (('err_proxy', 'err_tunnel', 'proxy error', 'captcha'), BLOCKED),
+    (('timed out', 'timeout'), TIMEOUT)
+)
+
+
+def _classify_message(message):
+    message = message.lower()
+    for patterns, error_class in _MESSAGE_PATTERNS:
+        if any(pattern in message for pattern in patterns):
+            return error_class
+    return UNKNOWN
+
+
+def classify_exception(exception):
+    """
+    Error class of an exception raised during a search
+
+    Args:
+        exception (Exception): Exception raised by Selenium or the scraper
+
+    Returns:
+        str: Error class
+    """
+    for exception_types, error_class in _EXCEPTION_CLASSES:
+        if isinstance(exception, exception_types):
+            return error_class
+    return _classify_message(str(exception))
+
+
+def classify_result(result):
+    """
+    Error class of a result or search dictionary
+
+    Results from this version carry an 'error_class'; older ones are
+    classified from their error message and availability.
+
+    Args:
+        result (dict): Result or search dictionary
+
+    Returns:
+        str or None: Error class, or None for a search that found a price
+    """
+    if result.get('error_class'):
+        return result['error_class']
+
+    error = result.get('error')
+    if error is None:
+        if result.get('availability') == 'Not available':
+            return UNAVAILABLE
+        if result.get('price') is None and result.get('availability') in FAILED_AVAILABILITY:
+            return UNKNOWN
+        return None
+
+    if error.startswith('Circuit open'):
+        return CIRCUIT_OPEN
+    if error.startswith('Exception:'):
+        return _classify_message(error)
+    return ERROR_CLASS_BY_MESSAGE.get(error, UNKNOWN)
+
+
+def is_failed_result(result):
+    """
+    Whether a result or search dictionary ended without an answer and should be retried
+
+    "Not available" is an answer; prices and unavailable dates are not failures.
+
+    Args:
+        result (dict): Result or search dictionary
+
+    Returns:
+        bool: True if the search failed
+    """
+    return classify_result(result) in FAILED_CLASSES
+
+
+def recovery_action(error_class):
+    """
+    Recovery action for an error class
+
+    Args:
+        error_class (str or None): Error class from classify_result or classify_exception
+
+    Returns:
+        str: Recovery action (NO_ACTION for successful searches)
+    """
+    return RECOVERY_ACTIONS.get(error_class, NO_ACTION)
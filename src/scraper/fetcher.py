@@ -0,0 +1,162 @@
+"""
+HTTP-only fetching for hotel price scraper
+
+Booking.com renders its results pages on the server, so many searches can
+be answered from the HTML alone, without paying for a browser session.
+"""
+
+import os
+import json
+import threading
+import importlib.util
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.config import get_scraper_settings, get_http_proxy_url
+
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36')
+
+
+class HttpFetcher:
+    """
+    Keep-alive HTTP client shared by every worker
+
+    A single requests session with a connection pool of `pool_size`
+    connections, so concurrent workers reuse open TLS connections to
+    Booking.com instead of opening one per search. Requests go through
+    `proxy_url` when given. Cookies set by Booking.com are kept for the run
+    and saved to `cookie_file`, so the next run starts with them.
+    """
+
+    def __init__(self, pool_size=10, timeout=20, proxy_url=None, cookie_file=None, language='en'):
+        self.timeout = timeout
+        self.proxy_url = proxy_url
+        self.cookie_file = cookie_file
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': f'{language},{language.split("-")[0]};q=0.9,en;q=0.8'
+        })
+        if proxy_url:
+            self.session.proxies = {'http': proxy_url, 'https': proxy_url}
+        self._lock = threading.Lock()
+        self._metrics = {'requests': 0, 'failures': 0, 'served': 0, 'escalated': 0}
+        self._load_cookies()
+
+    def get(self, url):
+        """
+        Fetch a page
+
+        Args:
+            url (str): Page URL
+
+        Returns:
+            tuple or None: (status code, body text), or None if the request failed
+        """
+        self.count('requests')
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            return response.status_code, response.text
+        except requests.RequestException as e:
+            self.count('failures')
+            print(f'⚠️ HTTP request failed: {e}')
+            return None
+
+    def count(self, name):
+        """Add one to a metric ('requests', 'failures', 'served' or 'escalated')"""
+        with self._lock:
+            self._metrics[name] += 1
+
+    def metrics(self):
+        """Counters of the fetcher"""
+        with self._lock:
+            return dict(self._metrics)
+
+    def _load_cookies(self):
+        if not self.cookie_file or not os.path.exists(self.cookie_file):
+            return
+        try:
+            with open(self.cookie_file, 'r', encoding='utf-8') as f:
+                cookies = json.load(f)
+            for cookie in cookies:
+                self.session.cookies.set(cookie['name'], cookie['value'],
+                                         domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        except Exception as e:
+            print(f'⚠️ Could not load HTTP cookies {self.cookie_file}: {e}')
+
+    def save_cookies(self):
+        """Write the session cookies to cookie_file"""
+        if not self.cookie_file:
+            return
+        try:
+            folder = os.path.dirname(self.cookie_file)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            cookies = [
+                {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+                for cookie in self.session.cookies
+                if not cookie.is_expired()
+            ]
+            tmp_path = f'{self.cookie_file}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cookies, f, indent=2)
+            os.replace(tmp_path, self.cookie_file)
+        except Exception as e:
+            print(f'⚠️ Could not save HTTP cookies {self.cookie_file}: {e}')
+
+    def close(self):
+        """Save the cookies and close the pooled connections"""
+        self.save_cookies()
+        self.session.close()
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher():
+    """
+    Get the HTTP fetcher shared by every scrape of this run
+
+    Returns:
+        HttpFetcher: Shared fetcher
+    """
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            settings = get_scraper_settings()
+            if importlib.util.find_spec('lxml') is None:
+                print('⚠️ lxml is not installed, only results pages with embedded data are read over HTTP '
+                      '(pip install lxml)')
+            _fetcher = HttpFetcher(
+                pool_size=settings['http_pool_size'],
+                timeout=settings['http_timeout'],
+                proxy_url=get_http_proxy_url(),
+                cookie_file=settings['http_cookie_file'],
+                language=settings['language']
+            )
+        return _fetcher
+
+
+def close_http_fetcher():
+    """Close the shared HTTP fetcher and print its metrics"""
+    global _fetcher
+    with _fetcher_lock:
+        fetcher = _fetcher
+        _fetcher = None
+    if fetcher is None:
+        return
+
+    fetcher.close()
+    metrics = fetcher.metrics()
+    print(f'\n⚡ HTTP FETCHER:')
+    print(f'   📨 Requests: {metrics["requests"]} ({metrics["failures"]} failed)')
+    print(f'   ✅ Searches answered without a browser: {metrics["served"]}')
+    print(f'   🌐 Searches handed to the browser: {metrics["escalated"]}')
@@ -0,0 +1,128 @@
+"""
+Request rate limiting for hotel price scraper
+"""
+
+import time
+import threading
+
+from ..utils.config import get_scraper_settings, get_proxy_zone
+
+
+TARGET_HOST = 'www.booking.com'
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate_per_minute` requests on average and bursts of `burst`
+
+    Tokens refill continuously, also while a request is running, so a slow
+    page load has already earned the next request its token and no idle
+    time is added on top of it.
+    """
+
+    def __init__(self, rate_per_minute, burst=1):
+        self.rate = rate_per_minute / 60
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, now):
+        """Seconds until a token is available (0 if one is available now)"""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        """Use one token (only after wait_time returned 0)"""
+        self.tokens -= 1
+
+
+class RateLimiter:
+    """
+    Set of token buckets shared by every worker thread
+
+    A request names the buckets it counts against (e.g. its target host and
+    its proxy zone) and only goes out once all of them have a token.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.waited = 0.0
+
+    def add_bucket(self, key, rate_per_minute, burst=1):
+        """
+        Add or replace a bucket
+
+        Args:
+            key (str): Bucket name, e.g. 'host:www.booking.com'
+            rate_per_minute (float): Average requests per minute
+            burst (int): Requests allowed back to back after an idle period
+        """
+        with self._lock:
+            self._buckets[key] = TokenBucket(rate_per_minute, burst)
+
+    def acquire(self, keys):
+        """
+        Block until every bucket in `keys` has a token, then take them
+
+        Args:
+            keys (iterable): Bucket names the request counts against
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                buckets = [self._buckets[key] for key in keys if key in self._buckets]
+                wait = max((bucket.wait_time(now) for bucket in buckets), default=0)
+                if wait == 0:
+                    for bucket in buckets:
+                        bucket.take()
+                    waited = now - started
+                    self.waited += waited
+                    return waited
+            time.sleep(wait)
+
+
+def host_key(host=TARGET_HOST):
+    """Bucket name of a target host"""
+    return f'host:{host}'
+
+
+def zone_key(zone=None):
+    """Bucket name of a proxy zone (the configured one by default)"""
+    return f'zone:{zone or get_proxy_zone()}'
+
+
+def search_keys():
+    """Buckets a Booking.com search counts against"""
+    return (host_key(), zone_key())
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Get the rate limiter shared by every scrape of this run
+
+    Returns:
+        RateLimiter: Limiter with buckets for Booking.com and the proxy zone
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            settings = get_scraper_settings()
+            _limiter = RateLimiter()
+            _limiter.add_bucket(host_key(), settings['host_requests_per_minute'], settings['host_burst'])
+            _limiter.add_bucket(zone_key(), settings['zone_requests_per_minute'], settings['zone_burst'])
+        return _limiter
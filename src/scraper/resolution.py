@@ -0,0 +1,151 @@
+"""
+Persistent cache of hotel name resolutions for hotel price scraper
+"""
+
+import os
+import json
+import re
+import threading
+import unicodedata
+from datetime import datetime, timedelta
+
+from ..utils.config import get_scraper_settings
+
+
+def normalize_hotel_name(hotel_name):
+    """
+    Normalize a hotel name for cache lookups
+
+    Args:
+        hotel_name (str): Hotel name as written by the user
+
+    Returns:
+        str: Lowercase name without accents, punctuation or repeated spaces
+    """
+    text = unicodedata.normalize('NFKD', hotel_name)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r'[^\w\s]', ' ', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class HotelResolutionCache:
+    """
+    On-disk cache of what the Booking.com autocomplete resolved a hotel name to
+
+    Entries are keyed by normalized hotel name plus country and hold the
+    hotel title, location, destination id/type and canonical hotel URL.
+    Entries older than the TTL are ignored and dropped on the next save.
+    With refresh enabled, entries from previous runs are ignored (but kept
+    on disk until overwritten) and only resolutions made in this run are used.
+    """
+
+    def __init__(self, path, ttl_days=30, refresh=False):
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._resolved_this_run = set()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            return {key: entry for key, entry in entries.items() if not self._is_expired(entry)}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f'⚠️ Could not read resolution cache {self.path}: {e}')
+            return {}
+
+    def _is_expired(self, entry):
+        try:
+            resolved_at = datetime.fromisoformat(entry['resolved_at'])
+        except Exception:
+            return True
+        return datetime.now() - resolved_at > self.ttl
+
+    @staticmethod
+    def _key(hotel_name, country):
+        return f'{normalize_hotel_name(hotel_name)}|{country}'
+
+    def get(self, hotel_name, country):
+        """
+        Look up a resolved hotel
+
+        Args:
+            hotel_name (str): Hotel name
+            country (str): Country code used for the search
+
+        Returns:
+            dict or None: Cached entry, or None if missing, expired or refreshing
+        """
+        key = self._key(hotel_name, country)
+        if self.refresh and key not in self._resolved_this_run:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                return None
+            return dict(entry)
+
+    def put(self, hotel_name, country, resolution):
+        """
+        Store a resolved hotel and persist the cache
+
+        Args:
+            hotel_name (str): Hotel name
+            country (str): Country code used for the search
+            resolution (dict): title, location, dest_id, dest_type and url
+        """
+        entry = dict(resolution)
+        entry['resolved_at'] = datetime.now().isoformat()
+        key = self._key(hotel_name, country)
+        with self._lock:
+            self._entries[key] = entry
+            self._resolved_this_run.add(key)
+            self._save()
+
+    def invalidate(self, hotel_name, country):
+        """Drop a hotel from the cache, e.g. when its destination stopped working"""
+        key = self._key(hotel_name, country)
+        with self._lock:
+            self._resolved_this_run.discard(key)
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+    def _save(self):
+        try:
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            entries = {key: entry for key, entry in self._entries.items() if not self._is_expired(entry)}
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f'⚠️ Could not save resolution cache {self.path}: {e}')
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_resolution_cache():
+    """
+    Get the resolution cache shared by all workers of this run
+
+    Returns:
+        HotelResolutionCache: Cache configured from the scraper settings
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = get_scraper_settings()
+            _cache = HotelResolutionCache(
+                settings['resolution_cache_file'],
+                ttl_days=settings['resolution_cache_ttl_days'],
+                refresh=settings['refresh_resolution']
+            )
+        return _cache
@@ -0,0 +1,211 @@
+"""
+Task scheduling for hotel price scraper
+"""
+
+import heapq
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+
+
+# One search: a hotel for a single check-in/check-out pair. `index` is the
+# position of the task in the original plan and is used to merge results
+# back in a deterministic order. `attempt` counts earlier failed tries and
+# `avoid_session` is the id of the session the last try failed on.
+ScrapeTask = namedtuple(
+    'ScrapeTask',
+    ['index', 'hotel_name', 'checkin_date', 'checkout_date', 'attempt', 'avoid_session'],
+    defaults=(0, None)
+)
+
+
+def build_tasks(hotel_names, dates_list):
+    """
+    Flatten hotels × dates into a list of search tasks
+
+    Args:
+        hotel_names (list): Hotel names to process
+        dates_list (list): List of (checkin_date, checkout_date) tuples
+
+    Returns:
+        list: List of ScrapeTask, hotel by hotel and date by date
+    """
+    tasks = []
+    for hotel_name in hotel_names:
+        for checkin_date, checkout_date in dates_list:
+            tasks.append(ScrapeTask(len(tasks), hotel_name, checkin_date, checkout_date))
+    return tasks
+
+
+class TaskQueue:
+    """
+    Thread-safe queue of search tasks shared by all workers
+
+    Tasks are grouped per hotel. A worker keeps pulling dates of the hotel it
+    is already working on (session affinity). When that hotel runs dry it
+    picks the next hotel nobody is working on, and once every hotel has an
+    owner it steals the latest dates of the hotel with the most work left,
+    so no worker sits idle while another one is still holding a long tail.
+    Failed tasks can be handed back with a delay and are run again, first in
+    line for their hotel, once the delay is over.
+    """
+
+    def __init__(self, tasks):
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()
+        self._owners = {}
+        # Failed tasks waiting for their backoff: (ready_at, index, task)
+        self._delayed = []
+        self._in_flight = 0
+        self.retried = 0
+        for task in tasks:
+            self._pending.setdefault(task.hotel_name, deque()).append(task)
+
+    def get(self, current_hotel=None):
+        """
+        Take the next task for a worker
+
+        Waits while the only work left is failed tasks in backoff or tasks
+        other workers are still running (they may be handed back for retry).
+        Every task returned must be finished with task_done().
+
+        Args:
+            current_hotel (str, optional): Hotel the worker processed last
+
+        Returns:
+            ScrapeTask or None: Next task, or None when all work is done
+        """
+        with self._condition:
+            while True:
+                self._release_ready()
+                task = self._next_task(current_hotel)
+                if task is not None:
+                    self._in_flight += 1
+                    return task
+                current_hotel = None
+
+                if not self._delayed and self._in_flight == 0:
+                    return None
+                timeout = self._delayed[0][0] - time.monotonic() if self._delayed else None
+                self._condition.wait(timeout)
+
+    def get_batch(self, current_hotel=None, count=1):
+        """
+        Take up to `count` tasks for a worker that runs several searches at once
+
+        Blocks like get() for the first task, then adds whatever else is
+        ready right away, dates of the same hotel first.
+
+        Args:
+            current_hotel (str, optional): Hotel the worker processed last
+            count (int): Maximum number of tasks
+
+        Returns:
+            list: Tasks, empty when all work is done
+        """
+        task = self.get(current_hotel)
+        if task is None:
+            return []
+
+        batch = [task]
+        with self._condition:
+            self._release_ready()
+            while len(batch) < count:
+                task = self._next_task(batch[-1].hotel_name)
+                if task is None:
+                    break
+                self._in_flight += 1
+                batch.append(task)
+        return batch
+
+    def take_next(self, hotel_name):
+        """
+        Take the next task of a hotel without waiting, e.g. to prefetch its page
+
+        Args:
+            hotel_name (str): Hotel the worker is processing
+
+        Returns:
+            ScrapeTask or None: Next task of that hotel, or None if it has none ready
+        """
+        with self._condition:
+            self._release_ready()
+            hotel_tasks = self._pending.get(hotel_name)
+            if not hotel_tasks:
+                return None
+            self._in_flight += 1
+            return hotel_tasks.popleft()
+
+    def _next_task(self, current_hotel):
+        if current_hotel is not None and self._pending.get(current_hotel):
+            return self._pending[current_hotel].popleft()
+
+        if current_hotel is not None:
+            self._release(current_hotel)
+
+        # Prefer a hotel no other worker is busy with
+        for hotel_name, hotel_tasks in self._pending.items():
+            if hotel_tasks and not self._owners.get(hotel_name):
+                self._owners[hotel_name] = 1
+                return hotel_tasks.popleft()
+
+        # Otherwise steal from the back of the largest backlog
+        busiest = max(self._pending.values(), key=len, default=None)
+        if not busiest:
+            return None
+
+        task = busiest.pop()
+        self._owners[task.hotel_name] = self._owners.get(task.hotel_name, 0) + 1
+        return task
+
+    def _release_ready(self):
+        """Move failed tasks whose backoff is over to the front of their hotel"""
+        now = time.monotonic()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, task = heapq.heappop(self._delayed)
+            self._pending.setdefault(task.hotel_name, deque()).appendleft(task)
+
+    def retry(self, task, delay):
+        """
+        Hand a failed task back to be run again after a delay
+
+        Args:
+            task (ScrapeTask): Task to run again, with its attempt counter updated
+            delay (float): Seconds to wait before the task can be taken again
+        """
+        with self._condition:
+            self._push_delayed(task, delay)
+            self.retried += 1
+
+    def defer(self, task, delay):
+        """
+        Put a task that was not run back in the queue for later, e.g. while its hotel is on hold
+
+        Args:
+            task (ScrapeTask): Task to run later, unchanged
+            delay (float): Seconds to wait before the task can be taken again
+        """
+        with self._condition:
+            self._push_delayed(task, delay)
+
+    def _push_delayed(self, task, delay):
+        heapq.heappush(self._delayed, (time.monotonic() + delay, task.index, task))
+        self._condition.notify_all()
+
+    def task_done(self):
+        """Mark a task returned by get() as finished (recorded or handed back with retry)"""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _release(self, hotel_name):
+        owners = self._owners.get(hotel_name, 0)
+        if owners > 1:
+            self._owners[hotel_name] = owners - 1
+        else:
+            self._owners.pop(hotel_name, None)
+
+    def remaining(self):
+        """Number of tasks not yet handed out, including tasks waiting to be retried"""
+        with self._condition:
+            return sum(len(hotel_tasks) for hotel_tasks in self._pending.values()) + len(self._delayed)
@@ -0,0 +1,284 @@
+"""
+Browser session management for hotel price scraper
+"""
+
+import time
+import threading
+
+from .driver import start_booking_session, is_session_alive
+from ..utils.config import get_scraper_settings
+from ..utils.console import set_worker_label
+
+
+def _quit_quietly(driver):
+    """Quit a driver, ignoring errors from sessions that are already gone"""
+    try:
+        driver.quit()
+    except:
+        pass
+
+
+class PooledSession:
+    """A browser session owned by the pool, with its usage counters"""
+
+    _next_id = 1
+    _id_lock = threading.Lock()
+
+    def __init__(self, driver):
+        with PooledSession._id_lock:
+            self.id = PooledSession._next_id
+            PooledSession._next_id += 1
+        self.driver = driver
+        self.searches = 0
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class SessionPool:
+    """
+    Bounded pool of warm browser sessions shared by all workers
+
+    Workers lease a session, run searches on it and give it back. Sessions
+    are retired after max_searches searches or when they are lost, and the
+    replacement can be warmed up in the background before it is needed.
+    Sessions that sat idle for a while get a cheap liveness probe before
+    being leased again.
+    """
+
+    def __init__(self, max_size, max_searches, probe_after_idle=30):
+        self.max_size = max_size
+        self.max_searches = max_searches
+        self.probe_after_idle = probe_after_idle
+        self._condition = threading.Condition()
+        self._idle = []
+        self._in_use = 0
+        self._building = 0
+        self._closed = False
+        self._metrics = {
+            'created': 0,
+            'create_failures': 0,
+            'leases': 0,
+            'reused': 0,
+            'retired': 0,
+            'lost': 0,
+            'probes': 0,
+            'probe_failures': 0,
+            'lease_wait_seconds': 0.0
+        }
+
+    def _total(self):
+        return len(self._idle) + self._in_use + self._building
+
+    def lease(self, exclude=None):
+        """
+        Borrow a ready session, waiting for one if the pool is at capacity
+
+        Args:
+            exclude (int, optional): Id of a session that must not be handed out,
+                e.g. the one a search just failed on
+
+        Returns:
+            PooledSession: Session with Booking.com loaded
+        """
+        started = time.monotonic()
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError('Session pool is closed')
+                    session = self._take_idle(exclude)
+                    if session is not None:
+                        self._in_use += 1
+                        break
+                    if self._total() < self.max_size:
+                        self._building += 1
+                        break
+                    if self._idle:
+                        # Only the excluded session is idle and the pool is full: replace it
+                        retired = self._idle.pop()
+                        self._metrics['retired'] += 1
+                        threading.Thread(target=_quit_quietly, args=(retired.driver,), daemon=True).start()
+                        self._building += 1
+                        break
+                    self._condition.wait()
+
+            if session is None:
+                session = self._build(in_use=True)
+            elif not self._is_healthy(session):
+                self.give_back(session, lost=True)
+                continue
+            else:
+                with self._condition:
+                    self._metrics['reused'] += 1
+
+            with self._condition:
+                self._metrics['leases'] += 1
+                self._metrics['lease_wait_seconds'] += time.monotonic() - started
+            return session
+
+    def _take_idle(self, exclude):
+        """Remove and return the most recently used idle session other than `exclude`"""
+        for position in range(len(self._idle) - 1, -1, -1):
+            if self._idle[position].id != exclude:
+                return self._idle.pop(position)
+        return None
+
+    def _is_healthy(self, session):
+        """Probe sessions that sat idle long enough to have timed out remotely"""
+        if time.monotonic() - session.last_used < self.probe_after_idle:
+            return True
+
+        alive = is_session_alive(session.driver)
+        with self._condition:
+            self._metrics['probes'] += 1
+            if not alive:
+                self._metrics['probe_failures'] += 1
+        if not alive:
+            print(f'🔌 Session {session.id} failed its liveness probe, retiring it')
+        return alive
+
+    def _build(self, in_use):
+        """Create a session for a slot already reserved in _building"""
+        try:
+            driver = start_booking_session()
+        except Exception:
+            with self._condition:
+                self._building -= 1
+                self._metrics['create_failures'] += 1
+                self._condition.notify()
+            raise
+
+        session = PooledSession(driver)
+        with self._condition:
+            self._building -= 1
+            self._metrics['created'] += 1
+            if self._closed:
+                _quit_quietly(driver)
+                raise RuntimeError('Session pool is closed')
+            if in_use:
+                self._in_use += 1
+            else:
+                self._idle.append(session)
+                self._condition.notify()
+        return session
+
+    def prefetch(self):
+        """Warm up one more session in the background if the pool has room"""
+        with self._condition:
+            if self._closed or self._total() >= self.max_size:
+                return
+            self._building += 1
+
+        def build_spare():
+            set_worker_label('spare')
+            try:
+                self._build(in_use=False)
+                print('♻️ Spare session warmed up')
+            except Exception as e:
+                print(f'⚠️ Could not prepare spare session: {str(e)}')
+            finally:
+                set_worker_label(None)
+
+        threading.Thread(target=build_spare, daemon=True).start()
+
+    def give_back(self, session, lost=False, retire=False):
+        """
+        Return a leased session to the pool
+
+        Args:
+            session (PooledSession): Session obtained from lease()
+            lost (bool): True if the session broke (e.g. WebSocket error)
+            retire (bool): True to quit the session instead of keeping it idle
+        """
+        session.last_used = time.monotonic()
+        retire = retire or lost or session.searches >= self.max_searches
+        with self._condition:
+            self._in_use -= 1
+            if retire or self._closed:
+                self._metrics['retired'] += 1
+                if lost:
+                    self._metrics['lost'] += 1
+            else:
+                self._idle.append(session)
+            self._condition.notify()
+
+        if retire or self._closed:
+            # Quitting a remote browser is slow, keep it off the critical path
+            threading.Thread(target=_quit_quietly, args=(session.driver,), daemon=True).start()
+
+    def metrics(self):
+        """
+        Snapshot of the pool counters
+
+        Returns:
+            dict: created, reused, retired, lost, probe counts, wait time and current sizes
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+            metrics.update({
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'building': self._building,
+                'max_size': self.max_size
+            })
+        return metrics
+
+    def close(self):
+        """Quit all idle sessions; sessions still leased are quit when given back"""
+        with self._condition:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._condition.notify_all()
+        for session in idle:
+            _quit_quietly(session.driver)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool(workers=1):
+    """
+    Get the session pool shared by every scrape of this run
+
+    Args:
+        workers (int): Number of workers that will lease sessions at once;
+            the pool grows to fit them plus the configured warm spares
+
+    Returns:
+        SessionPool: Shared pool
+    """
+    global _pool
+    settings = get_scraper_settings()
+    max_size = workers + settings['warm_spare_sessions']
+    with _pool_lock:
+        if _pool is None:
+            _pool = SessionPool(
+                max_size,
+                settings['max_searches_per_session'],
+                probe_after_idle=settings['session_probe_after_idle']
+            )
+        elif _pool.max_size < max_size:
+            with _pool._condition:
+                _pool.max_size = max_size
+                _pool._condition.notify_all()
+        return _pool
+
+
+def close_session_pool():
+    """Close the shared session pool and print its metrics"""
+    global _pool
+    with _pool_lock:
+        pool = _pool
+        _pool = None
+    if pool is None:
+        return
+
+    pool.close()
+    metrics = pool.metrics()
+    print(f'\n🧰 SESSION POOL:')
+    print(f'   🚀 Sessions created: {metrics["created"]} ({metrics["create_failures"]} failed)')
+    print(f'   🔁 Leases: {metrics["leases"]} ({metrics["reused"]} reused an open session)')
+    print(f'   🗑️ Retired: {metrics["retired"]} ({metrics["lost"]} lost, {metrics["probe_failures"]} failed probes)')
+    print(f'   ⏳ Time waiting for sessions: {metrics["lease_wait_seconds"]:.1f}s')
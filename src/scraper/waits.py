@@ -0,0 +1,143 @@
+"""
+Condition-driven waits for hotel price scraper
+
+Conditions are evaluated with small scripts inside the page instead of
+find_element, so a missing element never costs the WebDriver implicit wait.
+"""
+
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class SearchDeadline:
+    """
+    Time budget shared by all steps of one search
+
+    Every wait of the search is capped by the remaining budget, so a search
+    cannot exceed it no matter how many steps it goes through or retries.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self):
+        """Seconds left in the budget (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        """True once the budget is used up"""
+        return self.remaining() <= 0
+
+    def cap(self, timeout):
+        """Limit a step timeout to what is left in the budget"""
+        return min(timeout, self.remaining())
+
+
+def wait_until(driver, condition, timeout, deadline=None, poll_frequency=0.1):
+    """
+    Wait until a condition holds, returning as soon as it does
+
+    Args:
+        driver: WebDriver instance
+        condition (callable): Called with the driver, waited on until truthy
+        timeout (float): Maximum wait for this step in seconds
+        deadline (SearchDeadline, optional): Search budget capping the timeout
+        poll_frequency (float): Seconds between checks
+
+    Returns:
+        The truthy value returned by the condition, or False on timeout
+    """
+    if deadline is not None:
+        timeout = deadline.cap(timeout)
+    if timeout <= 0:
+        return False
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(condition)
+    except TimeoutException:
+        return False
+
+
+def _script_condition(script, *args):
+    """Build a condition that evaluates a JavaScript expression in the page"""
+    def condition(driver):
+        try:
+            return driver.execute_script(script, *args)
+        except Exception:
+            return False
+    return condition
+
+
+def document_ready():
+    """The page finished loading"""
+    return _script_condition("return document.readyState === 'complete';")
+
+
+def element_visible(selector):
+    """An element matching the CSS selector is present and rendered"""
+    return _script_condition(
+        "const el = document.querySelector(arguments[0]);"
+        "return !!el && el.getClientRects().length > 0;",
+        selector
+    )
+
+
+def element_gone(selector):
+    """No visible element matches the CSS selector"""
+    visible = element_visible(selector)
+    return lambda driver: not visible(driver)
+
+
+def input_has_value(element, value):
+    """The input element holds exactly the given value"""
+    def condition(driver):
+        try:
+            return element.get_attribute('value') == value
+        except Exception:
+            return False
+    return condition
+
+
+def calendar_open():
+    """The search box date picker calendar is visible"""
+    return element_visible("[data-testid='searchbox-datepicker-calendar']")
+
+
+def autocomplete_populated(settle_polls=3):
+    """
+    The autocomplete list has options and stopped changing
+
+    The list fills in progressively, so the option count must stay the same
+    for a few consecutive polls before the list is considered complete.
+    """
+    count_options = _script_condition(
+        "return document.querySelectorAll(\"ul[role='group'] li[role='option']\").length;"
+    )
+    state = {'count': 0, 'stable': 0}
+
+    def condition(driver):
+        count = count_options(driver) or 0
+        if count and count == state['count']:
+            state['stable'] += 1
+        else:
+            state['count'] = count
+            state['stable'] = 0
+        return count if state['stable'] >= settle_polls else False
+    return condition
+
+
+def results_rendered(previous_url=None):
+    """
+    A search results page finished rendering its property cards
+
+    Args:
+        previous_url (str, optional): URL before the search, which must have changed
+    """
+    return _script_condition(
+        "if (document.readyState !== 'complete') return false;"
+        "if (arguments[0] && location.href === arguments[0]) return false;"
+        "return !!(document.querySelector(\"[data-testid='property-card']\")"
+        " || document.querySelector(\"[data-testid='next-available-dates-carousel']\"));",
+        previous_url
+    )
@@ -4,7 +4,9 @@ Utility modules for hotel price scraper
 
 from .dates import calculate_dates
 from .files import clean_filename, load_hotel_names, load_hotel_names_from_args
-from .config import get_webdriver_url, get_scraper_settings
+from .config import get_webdriver_url, get_scraper_settings, set_scraper_overrides
+from .console import worker_output, set_worker_label
+from .prices import parse_price, parse_prices, add_price_fields, result_price
 
 __all__ = [
     'calculate_dates', 
@@ -12,5 +14,12 @@ __all__ = [
     'load_hotel_names', 
     'load_hotel_names_from_args',
     'get_webdriver_url', 
-    'get_scraper_settings'
+    'get_scraper_settings',
+    'set_scraper_overrides',
+    'worker_output',
+    'set_worker_label',
+    'parse_price',
+    'parse_prices',
+    'add_price_fields',
+    'result_price'
 ] 
\ No newline at end of file
@@ -8,6 +8,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Settings overridden for the current run (e.g. from command line flags)
+_settings_overrides = {}
+
 
 def get_webdriver_url():
     """Get the Bright Data WebDriver URL from environment variables"""
@@ -23,16 +26,82 @@ def get_webdriver_url():
     return f'https://{auth}@{host}:{port}'
 
 
+def get_http_proxy_url():
+    """Get the proxy URL for HTTP-only fetching (BRIGHT_DATA_PROXY_URL), or None to connect directly"""
+    return os.environ.get("BRIGHT_DATA_PROXY_URL") or None
+
+
+def get_proxy_zone():
+    """
+    Get the Bright Data proxy zone of the configured credentials
+    
+    The zone is read from usernames like 'brd-customer-<id>-zone-<zone>';
+    other usernames (or none) count as a single 'default' zone.
+    """
+    username = os.environ.get("BRIGHT_DATA_USERNAME") or ''
+    marker = '-zone-'
+    if marker not in username:
+        return 'default'
+    return username.split(marker, 1)[1].split('-', 1)[0] or 'default'
+
+
+def set_scraper_overrides(**overrides):
+    """
+    Override scraper settings for the rest of the run
+    
+    Args:
+        **overrides: Setting values by name, None values are ignored
+    """
+    _settings_overrides.update({key: value for key, value in overrides.items() if value is not None})
+
+
 def get_scraper_settings():
     """Get scraper configuration settings"""
-    return {
+    settings = {
         'max_searches_per_session': 6,
+        'warm_spare_sessions': 1,
+        'tabs_per_session': 1,
+        'prefetch_next_search': False,
+        'session_probe_after_idle': 30,
         'page_load_timeout': 60,
         'implicit_wait': 20,
-        'search_delay': 3,
-        'hotel_delay': 10,
-        'session_restart_delay': 5,
+        'host_requests_per_minute': 12,
+        'host_burst': 2,
+        'zone_requests_per_minute': 20,
+        'zone_burst': 4,
         'country': 'co',
         'language': 'es-CO',
-        'currency': 'COP'
-    } 
\ No newline at end of file
+        'currency': 'COP',
+        'search_budget': 90,
+        'max_attempts': 3,
+        'retry_backoff': 5,
+        'retry_backoff_max': 60,
+        'blocked_backoff': 30,
+        'circuit_breaker_threshold': 3,
+        'circuit_breaker_cooldown': 120,
+        'circuit_breaker_max_probes': 1,
+        'adaptive_concurrency': False,
+        'adaptive_min_workers': 1,
+        'adaptive_window': 10,
+        'adaptive_min_success_rate': 0.8,
+        'adaptive_max_p90_latency': 60,
+        'adaptive_min_searches_per_session': 2,
+        'adaptive_max_searches_per_session': 12,
+        'results_timeout': 20,
+        'navigation_mode': 'direct',
+        'price_extraction': 'dom',
+        'fetch_mode': 'browser',
+        'sweep_max_pages': 10,
+        'http_pool_size': 10,
+        'http_timeout': 20,
+        'http_cookie_file': os.path.join('cache', 'http_cookies.json'),
+        'stream_fsync_every': 20,
+        'stream_fsync_interval': 5,
+        'sqlite_batch_size': 50,
+        'export_dir': 'exports',
+        'resolution_cache_file': os.path.join('cache', 'hotel_resolutions.json'),
+        'resolution_cache_ttl_days': 30,
+        'refresh_resolution': False
+    }
+    settings.update(_settings_overrides)
+    return settings 
\ No newline at end of file
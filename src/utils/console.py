@@ -0,0 +1,84 @@
+"""
+Console output helpers for hotel price scraper
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+
+
+class _WorkerStdout:
+    """
+    stdout proxy that keeps concurrent worker output readable
+
+    Lines written from a thread with a worker label are buffered until the
+    newline and then written in one piece prefixed with that label, so the
+    output of parallel workers never interleaves mid-line.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def set_label(self, label):
+        self.flush_worker()
+        self._local.label = label
+        self._local.buffer = ''
+
+    def flush_worker(self):
+        buffer = getattr(self._local, 'buffer', '')
+        if buffer:
+            self._local.buffer = ''
+            self._write_lines([buffer])
+
+    def write(self, text):
+        label = getattr(self._local, 'label', None)
+        if label is None:
+            with self._lock:
+                return self._stream.write(text)
+
+        buffer = self._local.buffer + text
+        *lines, self._local.buffer = buffer.split('\n')
+        if lines:
+            self._write_lines(lines)
+        return len(text)
+
+    def _write_lines(self, lines):
+        label = self._local.label
+        with self._lock:
+            for line in lines:
+                self._stream.write(f'[{label}] {line}\n')
+            self._stream.flush()
+
+    def flush(self):
+        with self._lock:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def worker_output():
+    """
+    Route stdout through a worker-aware proxy for the duration of the block
+    """
+    original = sys.stdout
+    proxy = _WorkerStdout(original)
+    sys.stdout = proxy
+    try:
+        yield proxy
+    finally:
+        sys.stdout = original
+
+
+def set_worker_label(label):
+    """
+    Label all further output of the current thread (no-op outside worker_output)
+
+    Args:
+        label (str or None): Prefix shown on every line, None to stop labelling
+    """
+    if isinstance(sys.stdout, _WorkerStdout):
+        sys.stdout.set_label(label)
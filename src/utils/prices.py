@@ -0,0 +1,230 @@
+"""
+Price parsing for hotel price scraper
+"""
+
+import re
+from collections import namedtuple
+
+
+# ISO 4217 minor unit exponents of the currencies Booking.com shows; only
+# these codes (and the configured currency) are read as currency codes
+CURRENCY_EXPONENTS = {
+    'ARS': 2,
+    'AUD': 2,
+    'BRL': 2,
+    'CAD': 2,
+    'CHF': 2,
+    'CNY': 2,
+    'COP': 2,
+    'CZK': 2,
+    'DKK': 2,
+    'EUR': 2,
+    'GBP': 2,
+    'HKD': 2,
+    'INR': 2,
+    'MXN': 2,
+    'NOK': 2,
+    'NZD': 2,
+    'PEN': 2,
+    'PLN': 2,
+    'SEK': 2,
+    'THB': 2,
+    'TRY': 2,
+    'USD': 2,
+    'UYU': 2,
+    'ZAR': 2,
+    'CLP': 0,
+    'ISK': 0,
+    'JPY': 0,
+    'KRW': 0,
+    'PYG': 0,
+    'VND': 0,
+    'BHD': 3,
+    'JOD': 3,
+    'KWD': 3,
+    'OMR': 3,
+    'TND': 3
+}
+
+# Symbols as Booking.com renders them; a bare '$' takes the default currency
+CURRENCY_SYMBOLS = {
+    'US$': 'USD',
+    'COL$': 'COP',
+    'R$': 'BRL',
+    'MX$': 'MXN',
+    'CA$': 'CAD',
+    'AU$': 'AUD',
+    'CLP$': 'CLP',
+    'AR$': 'ARS',
+    'S/.': 'PEN',
+    'S/': 'PEN',
+    '€': 'EUR',
+    '£': 'GBP',
+    '¥': 'JPY',
+    '₩': 'KRW',
+    '₹': 'INR'
+}
+
+_SPACES = re.compile(r'\s+')
+_PRICE = re.compile(
+    r'(?P<currency>(?<![A-Za-z])[A-Z]{3}(?![A-Za-z])|' + '|'.join(re.escape(symbol) for symbol in CURRENCY_SYMBOLS) + r'|\$)?'
+    r'\s?'
+    r'(?P<number>\d{1,3}(?:[.,\s]\d{3})+(?:[.,]\d{1,2})?|\d+(?:[.,]\d{1,2})?)'
+)
+_DECIMAL_PART = re.compile(r'[.,](\d{1,2})$')
+_PERCENT = re.compile(r'\s?%')
+# Lines with the taxes and charges added on top of the price
+_CHARGES_LINE = re.compile(r'impuesto|cargo|\btax|\bcharge|\bfee', re.IGNORECASE)
+
+ParsedPrice = namedtuple('ParsedPrice', ['amount', 'currency'])
+
+
+def currency_exponent(currency):
+    """Number of minor unit digits of a currency (2 for cents, and for currencies not listed)"""
+    return CURRENCY_EXPONENTS.get(currency, 2)
+
+
+def _to_minor_units(number, currency):
+    """Convert a matched number like '1.234.567' or '1,234.50' into integer minor units"""
+    decimal_match = _DECIMAL_PART.search(number)
+    if decimal_match:
+        whole = number[:decimal_match.start()]
+        fraction = decimal_match.group(1)
+    else:
+        whole, fraction = number, ''
+
+    # Every separator left in the whole part groups thousands, whatever the locale
+    whole = re.sub(r'\D', '', whole)
+    exponent = currency_exponent(currency)
+    fraction = (fraction + '0' * exponent)[:exponent]
+    return int(whole + fraction) if exponent else int(whole)
+
+
+def _line_prices(line, default_currency):
+    """Prices next to a currency and bare numbers of one line of text, in order"""
+    with_currency = []
+    without_currency = []
+    for match in _PRICE.finditer(line):
+        if _PERCENT.match(line, match.end()):
+            # A rate like 'IVA 19%', not an amount
+            continue
+        symbol = match.group('currency')
+        if symbol in CURRENCY_SYMBOLS:
+            currency = CURRENCY_SYMBOLS[symbol]
+        elif symbol and symbol != '$' and (symbol in CURRENCY_EXPONENTS or symbol == default_currency):
+            currency = symbol
+        else:
+            # Bare '$' or a word like 'IVA' or 'TAL' in front of the number
+            symbol = None
+            currency = default_currency
+        parsed = ParsedPrice(_to_minor_units(match.group('number'), currency), currency)
+        (with_currency if symbol else without_currency).append(parsed)
+    return with_currency, without_currency
+
+
+def parse_price(text, default_currency=None):
+    """
+    Parse a scraped price text into integer minor units and a currency code
+
+    Handles thousands separators of any locale ('COP 1.234.567', 'US$1,234.50'),
+    non-breaking and thin spaces, and strikethrough plus discounted price pairs
+    ('COP 1.500.000 COP 1.200.000'), for which the last (discounted) price is kept.
+    Percentages and lines with taxes and charges are ignored unless the text has
+    nothing else.
+
+    Args:
+        text (str): Price text as found on the page
+        default_currency (str, optional): Currency for prices without a code or with a bare '$'
+
+    Returns:
+        ParsedPrice or None: (amount in minor units, ISO currency code), or None if no price
+    """
+    if not text or 'Not available' in str(text):
+        return None
+
+    price_lines = []
+    charges_lines = []
+    for line in str(text).splitlines():
+        # \s also covers the non-breaking and thin spaces used between currency and amount
+        line = _SPACES.sub(' ', line).strip()
+        if line:
+            (charges_lines if _CHARGES_LINE.search(line) else price_lines).append(line)
+
+    for lines in (price_lines, charges_lines):
+        with_currency = []
+        without_currency = []
+        for line in lines:
+            line_with, line_without = _line_prices(line, default_currency)
+            with_currency.extend(line_with)
+            without_currency.extend(line_without)
+
+        # Numbers next to a currency are prices; bare numbers (e.g. '2 noches') only count when there are none
+        if with_currency:
+            return with_currency[-1]
+        if without_currency:
+            return min(without_currency, key=lambda parsed: parsed.amount)
+    return None
+
+
+def parse_prices(texts, default_currency=None):
+    """
+    Parse many price texts at once
+
+    Args:
+        texts (iterable): Price texts (None entries are allowed)
+        default_currency (str, optional): Currency for prices without a code
+
+    Returns:
+        list: ParsedPrice or None for each text
+    """
+    return [parse_price(text, default_currency) for text in texts]
+
+
+def add_price_fields(results, default_currency=None):
+    """
+    Fill price_amount and price_currency of results that do not have them yet
+
+    Args:
+        results (iterable): Result or search dictionaries with a 'price' text
+        default_currency (str, optional): Currency for prices without a code
+
+    Returns:
+        int: Number of dictionaries that were updated
+    """
+    updated = 0
+    for result in results:
+        if result.get('price_amount') is not None:
+            continue
+        parsed = parse_price(result.get('price'), default_currency)
+        result['price_amount'] = parsed.amount if parsed else None
+        result['price_currency'] = parsed.currency if parsed else None
+        updated += 1
+    return updated
+
+
+def to_major_units(amount, currency):
+    """Convert integer minor units back to a float amount (e.g. cents to dollars)"""
+    return amount / (10 ** currency_exponent(currency))
+
+
+def result_price(result):
+    """
+    Numeric price of a result or search dictionary, in major units
+
+    Uses the price_amount stored at scrape time and parses the raw text for
+    older results that do not have it.
+
+    Args:
+        result (dict): Result or search dictionary
+
+    Returns:
+        float or None: Price, or None if the search has no price
+    """
+    amount = result.get('price_amount')
+    currency = result.get('price_currency')
+    if amount is None:
+        parsed = parse_price(result.get('price'))
+        if parsed is None:
+            return None
+        amount, currency = parsed
+    return to_major_units(amount, currency)
@@ -0,0 +1,49 @@
+"""
+Shared fixtures for the hotel price scraper tests
+"""
+
+import pytest
+
+from src.utils import config
+from src.scraper import ratelimit, sessions
+
+
+class FakeDriver:
+    """Stands in for a remote browser session"""
+
+    def __init__(self):
+        self.quit_called = False
+
+    def execute_script(self, script, *args):
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Scraper settings for fast runs: no rate limit waits and short backoffs, editable per test"""
+    overrides = {
+        'host_requests_per_minute': 600000,
+        'host_burst': 100,
+        'zone_requests_per_minute': 600000,
+        'zone_burst': 100,
+        'warm_spare_sessions': 0,
+        'retry_backoff': 0.01,
+        'retry_backoff_max': 0.05,
+        'blocked_backoff': 0.01,
+        'circuit_breaker_cooldown': 0.05
+    }
+    monkeypatch.setattr(config, '_settings_overrides', overrides)
+    monkeypatch.setattr(ratelimit, '_limiter', None)
+    return overrides
+
+
+@pytest.fixture
+def fake_sessions(settings, monkeypatch):
+    """Session pool that hands out FakeDriver sessions, closed after the test"""
+    monkeypatch.setattr(sessions, 'start_booking_session', FakeDriver)
+    monkeypatch.setattr(sessions, '_pool', None)
+    yield
+    sessions.close_session_pool()
@@ -0,0 +1,88 @@
+"""
+Tests for reading search results from server-rendered HTML
+"""
+
+import json
+
+import pytest
+
+from src.scraper.booking import is_challenge_html, parse_results_html
+
+
+def property_json(name, amount=None, soldout=False, price_info=None):
+    prop = {
+        'displayName': {'text': name},
+        'basicPropertyData': {'pageName': 'hotel-casa', 'location': {'countryCode': 'co'}},
+        'soldOutInfo': {'isSoldOut': soldout}
+    }
+    if price_info is not None:
+        prop['priceDisplayInfoIrene'] = price_info
+    elif amount is not None:
+        prop['priceDisplayInfoIrene'] = {
+            'displayPrice': {'amountPerStay': {'amount': f'COP {amount}', 'amountUnformatted': 1, 'currency': 'COP'}},
+            'excludedCharges': {'excludeChargesAggregated': {'amountPerStay': {'amount': 'COP 50.000'}}}
+        }
+    return prop
+
+
+def embedded_html(*properties):
+    state = {'data': {'searchQueries': {'search': {'results': list(properties)}}}}
+    return f'<html><body><script type="application/json" data-capla="x">{json.dumps(state)}</script></body></html>'
+
+
+CARD_HTML = """
+<html><body>
+  <div data-testid="property-card">
+    <div data-testid="title">Hotel Casa</div>
+    <a data-testid="title-link" href="https://www.booking.com/hotel/co/hotel-casa.html">Hotel Casa</a>
+    <span data-testid="price-and-discounted-price">COP 300.000</span>
+    <div data-testid="taxes-and-charges">+COP 57.000 de impuestos y cargos</div>
+  </div>
+</body></html>
+"""
+
+
+def test_embedded_json_picks_the_matching_hotel():
+    html = embedded_html(property_json('Otro Hotel', '100.000'), property_json('Hotel Casa', '300.000'))
+    data = parse_results_html(html, 'Hotel Casa', 'COP')
+    assert data['card_found']
+    assert data['title'] == 'Hotel Casa'
+    assert data['price'] == 'COP 300.000'
+    assert data['taxes'] == 'COP 50.000'
+    assert data['price_selector'] == 'network'
+    assert data['hotel_url'] == 'https://www.booking.com/hotel/co/hotel-casa.html'
+
+
+def test_embedded_json_sold_out():
+    data = parse_results_html(embedded_html(property_json('Hotel Casa', soldout=True)), 'Hotel Casa', 'COP')
+    assert data['soldout'] and not data['price']
+
+
+def test_embedded_json_with_unexpected_types_does_not_raise():
+    html = embedded_html(property_json('Hotel Casa', price_info={'displayPrice': {'amountPerStay': 'COP 1'},
+                                                                  'excludedCharges': ['x']}))
+    # No readable price and no sold out flag: falls through to the card markup, which has no cards
+    data = parse_results_html(html, 'Hotel Casa', 'COP')
+    assert data is None or not data['price']
+
+
+def test_card_markup_when_there_is_no_embedded_json():
+    pytest.importorskip('lxml')
+    data = parse_results_html(CARD_HTML, 'Hotel Casa', 'COP')
+    assert data['card_found']
+    assert data['title'] == 'Hotel Casa'
+    assert data['hotel_url'] == 'https://www.booking.com/hotel/co/hotel-casa.html'
+    assert data['price'] == 'COP 300.000'
+    assert data['price_selector'] == "[data-testid='price-and-discounted-price']"
+    assert data['taxes'] == '+COP 57.000 de impuestos y cargos'
+
+
+def test_card_markup_without_cards():
+    pytest.importorskip('lxml')
+    data = parse_results_html('<html><body><p>Nothing here</p></body></html>', 'Hotel Casa', 'COP')
+    assert not data['card_found']
+
+
+def test_challenge_pages():
+    assert is_challenge_html(202, '')
+    assert not is_challenge_html(200, CARD_HTML)
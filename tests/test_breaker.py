@@ -0,0 +1,100 @@
+"""
+Tests for the per-hotel circuit breaker
+"""
+
+import time
+
+from src.scraper.breaker import CircuitBreaker, HOLD, RUN, SKIP
+from src.scraper.errors import BLOCKED, NOT_FOUND, TIMEOUT, UNAVAILABLE
+
+
+def open_circuit(breaker, hotel='A', error_class=NOT_FOUND):
+    for _ in range(breaker.threshold):
+        breaker.record(hotel, error_class)
+
+
+def wait_cooldown(breaker):
+    time.sleep(breaker.cooldown + 0.01)
+
+
+def test_opens_after_threshold_failures_of_one_class():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    breaker.record('A', NOT_FOUND)
+    breaker.record('A', TIMEOUT)
+    breaker.record('A', NOT_FOUND)
+    assert breaker.check('A') == (RUN, 0)
+    breaker.record('A', NOT_FOUND)
+    breaker.record('A', NOT_FOUND)
+    # Remaining tasks are skipped at once, not held for the cooldown
+    assert breaker.check('A') == (SKIP, 0)
+    assert breaker.check('B') == (RUN, 0)
+
+
+def test_success_and_unavailable_reset_the_streak():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    breaker.record('A', NOT_FOUND)
+    breaker.record('A', UNAVAILABLE)
+    breaker.record('A', NOT_FOUND)
+    assert breaker.check('A') == (RUN, 0)
+
+
+def test_retried_attempts_and_session_failures_do_not_count():
+    breaker = CircuitBreaker(threshold=2, cooldown=60)
+    for _ in range(5):
+        breaker.record('A', TIMEOUT, final=False)
+        breaker.record('A', BLOCKED)
+    assert breaker.check('A') == (RUN, 0)
+
+
+def test_half_open_runs_one_probe_and_closes_on_success():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.05)
+    open_circuit(breaker)
+    wait_cooldown(breaker)
+    assert breaker.check('A') == (RUN, 0)
+    assert breaker.check('A')[0] == HOLD
+    breaker.record('A', None)
+    assert breaker.check('A') == (RUN, 0)
+    assert breaker.check('A') == (RUN, 0)
+
+
+def test_failed_probe_reopens_for_another_cooldown():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.05, max_probes=3)
+    open_circuit(breaker)
+    wait_cooldown(breaker)
+    assert breaker.check('A') == (RUN, 0)
+    breaker.record('A', NOT_FOUND)
+    assert breaker.check('A') == (SKIP, 0)
+    wait_cooldown(breaker)
+    assert breaker.check('A') == (RUN, 0)
+
+
+def test_trips_after_max_failed_probes():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.01, max_probes=2)
+    open_circuit(breaker)
+    for _ in range(2):
+        wait_cooldown(breaker)
+        assert breaker.check('A') == (RUN, 0)
+        breaker.record('A', NOT_FOUND)
+    assert breaker.check('A') == (SKIP, 0)
+    assert breaker.skip_reason('A') == f'Circuit open: repeated {NOT_FOUND} failures'
+
+
+def test_probe_retried_or_lost_lets_another_probe_run():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.01)
+    open_circuit(breaker)
+    wait_cooldown(breaker)
+    assert breaker.check('A') == (RUN, 0)
+    breaker.record('A', TIMEOUT, final=False)
+    assert breaker.check('A') == (RUN, 0)
+    breaker.record('A', BLOCKED)
+    assert breaker.check('A') == (RUN, 0)
+
+
+def test_one_failed_probe_trips_by_default():
+    breaker = CircuitBreaker(threshold=2, cooldown=0.01)
+    open_circuit(breaker)
+    wait_cooldown(breaker)
+    assert breaker.check('A') == (RUN, 0)
+    breaker.record('A', NOT_FOUND)
+    wait_cooldown(breaker)
+    assert breaker.check('A') == (SKIP, 0)
@@ -0,0 +1,98 @@
+"""
+Tests for the adaptive concurrency controller
+"""
+
+import threading
+
+from src.scraper.concurrency import ConcurrencyController
+
+
+class Pool:
+    max_searches = 6
+
+
+def outcome(error_class=None):
+    return {'price': 'COP 1.000' if error_class is None else None, 'error_class': error_class,
+            'error': None if error_class is None else 'x', 'availability': 'Available'}
+
+
+def feed(controller, count, error_class=None, latency=5):
+    for _ in range(count):
+        controller.record(outcome(error_class), latency)
+
+
+def test_healthy_windows_add_workers_and_searches_per_session():
+    pool = Pool()
+    controller = ConcurrencyController(pool, max_workers=3, window=4, max_rotation=7)
+    assert controller.limit == 1
+    feed(controller, 12)
+    assert controller.limit == 3
+    assert pool.max_searches == 7
+    assert controller.decisions == 3
+
+
+def test_blocks_halve_workers_and_rotation():
+    pool = Pool()
+    controller = ConcurrencyController(pool, max_workers=8, window=4, min_rotation=2)
+    controller.limit = 8
+    feed(controller, 3)
+    feed(controller, 1, 'blocked')
+    assert controller.limit == 4
+    assert pool.max_searches == 3
+
+
+def test_slow_or_failing_windows_halve_workers_only():
+    pool = Pool()
+    controller = ConcurrencyController(pool, max_workers=8, window=4, max_p90_latency=10)
+    controller.limit = 8
+    feed(controller, 4, latency=30)
+    assert controller.limit == 4
+    feed(controller, 4, 'timeout')
+    assert controller.limit == 2
+    assert pool.max_searches == 6
+
+
+def test_circuit_open_skips_are_not_counted():
+    controller = ConcurrencyController(Pool(), max_workers=4, window=2)
+    feed(controller, 5, 'circuit_open')
+    assert controller.decisions == 0
+
+
+def test_finish_releases_parked_workers():
+    controller = ConcurrencyController(Pool(), max_workers=4)
+    assert controller.is_active(0) and not controller.is_active(2)
+    waiter = threading.Thread(target=controller.wait_for_turn, args=(2,))
+    waiter.start()
+    waiter.join(0.05)
+    assert waiter.is_alive()
+    controller.finish()
+    waiter.join(1)
+    assert not waiter.is_alive()
+    assert controller.is_active(3)
+
+
+def test_configured_searches_per_session_above_the_adaptive_ceiling_is_kept():
+    pool = Pool()
+    pool.max_searches = 20
+    controller = ConcurrencyController(pool, max_workers=3, window=2, max_rotation=12)
+    feed(controller, 2)
+    assert pool.max_searches == 20
+    assert controller.limit == 2
+
+
+def test_lost_worker_is_replaced_without_lifting_the_limit():
+    controller = ConcurrencyController(Pool(), max_workers=3)
+    assert controller.limit == 1
+    waiter = threading.Thread(target=controller.wait_for_turn, args=(1,))
+    waiter.start()
+    waiter.join(0.05)
+    assert waiter.is_alive()
+
+    controller.worker_lost(0)
+    waiter.join(1)
+    assert not waiter.is_alive()
+    assert controller.is_active(1)
+    # Still one active worker: the third one keeps waiting
+    assert not controller.is_active(2)
+    feed(controller, 10, 'timeout')
+    assert controller.limit == 1 and not controller.is_active(2)
@@ -0,0 +1,52 @@
+"""
+Tests for error classification
+"""
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+
+from src.scraper.errors import (
+    BACK_OFF, BLOCKED, CIRCUIT_OPEN, DOM_CHANGED, NO_ACTION, NOT_FOUND, REBUILD_SESSION, RETRY,
+    SESSION_LOST, SKIP_HOTEL, TIMEOUT, UNAVAILABLE, UNKNOWN,
+    classify_exception, classify_result, is_failed_result, recovery_action
+)
+
+
+@pytest.mark.parametrize('exception, error_class', [
+    (TimeoutException('slow'), TIMEOUT),
+    (NoSuchElementException('gone'), DOM_CHANGED),
+    (WebDriverException('invalid session id'), SESSION_LOST),
+    (WebDriverException('net::ERR_PROXY_CONNECTION_FAILED'), BLOCKED),
+    (ValueError('boom'), UNKNOWN),
+])
+def test_classify_exception(exception, error_class):
+    assert classify_exception(exception) == error_class
+
+
+@pytest.mark.parametrize('result, error_class', [
+    ({'price': 'COP 1.000', 'error': None, 'availability': 'Available'}, None),
+    ({'price': None, 'error': None, 'availability': 'Not available'}, UNAVAILABLE),
+    ({'price': None, 'error': None, 'availability': 'Search failed'}, UNKNOWN),
+    ({'price': None, 'error': 'Hotel search failed', 'availability': 'Search failed'}, NOT_FOUND),
+    ({'price': None, 'error': 'Hotel not in destination results', 'availability': 'Error'}, NOT_FOUND),
+    ({'price': None, 'error': 'Circuit open: repeated not_found failures', 'availability': 'Skipped'}, CIRCUIT_OPEN),
+    ({'price': None, 'error': 'Something new', 'availability': 'Error'}, UNKNOWN),
+    ({'price': None, 'error': 'x', 'error_class': BLOCKED}, BLOCKED),
+])
+def test_classify_result(result, error_class):
+    assert classify_result(result) == error_class
+
+
+def test_is_failed_result():
+    assert not is_failed_result({'price': 'COP 1.000', 'error': None, 'availability': 'Available'})
+    assert not is_failed_result({'price': None, 'error': None, 'availability': 'Not available'})
+    assert is_failed_result({'price': None, 'error': 'Date selection failed', 'availability': 'Date selection failed'})
+    assert is_failed_result({'error_class': CIRCUIT_OPEN})
+
+
+@pytest.mark.parametrize('error_class, action', [
+    (SESSION_LOST, REBUILD_SESSION), (BLOCKED, BACK_OFF), (TIMEOUT, RETRY),
+    (NOT_FOUND, SKIP_HOTEL), (UNAVAILABLE, NO_ACTION), (None, NO_ACTION),
+])
+def test_recovery_action(error_class, action):
+    assert recovery_action(error_class) == action
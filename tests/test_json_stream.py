@@ -0,0 +1,57 @@
+"""
+Tests for streaming JSON reading and writing
+"""
+
+import io
+import json
+
+import pytest
+
+from src.data import json_stream
+from src.data.json_stream import IndentedJsonWriter, walk_json
+
+
+DOCUMENT = {
+    'metadata': {'total': 2, 'name': 'Ñandú'},
+    'hotels': {
+        'A': {'searches': [{'price': 'COP 1.000', 'n': 1.5}, {'price': None}], 'summary': {}},
+        'B': {'searches': [], 'summary': {'ok': True}}
+    },
+    'empty': {}
+}
+
+
+def descend_to_searches(path):
+    return len(path) < 3 or path[-1] == 'searches'
+
+
+def copy(document, descend):
+    source = io.BytesIO(json.dumps(document).encode('utf-8'))
+    target = io.StringIO()
+    writer = IndentedJsonWriter(target)
+    for event, path, value in walk_json(source, descend):
+        key = path[-1] if path else None
+        if event == 'start':
+            writer.start(key, value)
+        elif event == 'end':
+            writer.end()
+        else:
+            writer.value(key, value)
+    return target.getvalue()
+
+
+@pytest.mark.parametrize('use_ijson', [True, False])
+@pytest.mark.parametrize('descend', [descend_to_searches, lambda path: True, lambda path: path == ()])
+def test_copy_is_formatted_like_json_dump(monkeypatch, use_ijson, descend):
+    if not use_ijson:
+        monkeypatch.setattr(json_stream, 'ijson', None)
+    assert copy(DOCUMENT, descend) == json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+
+
+def test_walk_paths_and_events():
+    events = list(walk_json(io.BytesIO(json.dumps(DOCUMENT).encode('utf-8')), descend_to_searches))
+    values = [path for event, path, _ in events if event == 'value']
+    assert ('hotels', 'A', 'searches', 0) in values
+    assert ('hotels', 'A', 'searches', 1) in values
+    assert ('hotels', 'A', 'summary') in values
+    assert events[0] == ('start', (), 'map') and events[-1] == ('end', (), 'map')
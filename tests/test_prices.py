@@ -0,0 +1,74 @@
+"""
+Tests for price parsing
+"""
+
+import pytest
+
+from src.utils.prices import ParsedPrice, add_price_fields, parse_price, result_price, to_major_units
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('COP 1.234.567', ParsedPrice(123456700, 'COP')),
+    ('COP\xa01.234.567', ParsedPrice(123456700, 'COP')),
+    ('COP 300.000', ParsedPrice(30000000, 'COP')),
+    ('US$1,234.50', ParsedPrice(123450, 'USD')),
+    ('€ 95', ParsedPrice(9500, 'EUR')),
+    ('¥12,000', ParsedPrice(12000, 'JPY')),
+    ('KWD 12.5', ParsedPrice(12500, 'KWD')),
+    ('$ 300.000', ParsedPrice(30000000, 'COP')),
+    ('COP 300.000 2 noches', ParsedPrice(30000000, 'COP')),
+])
+def test_prices(text, expected):
+    assert parse_price(text, 'COP') == expected
+
+
+def test_strikethrough_pair_keeps_the_discounted_price_by_position():
+    assert parse_price('COP 1.500.000 COP 1.200.000', 'COP') == ParsedPrice(120000000, 'COP')
+    # A discounted price shown first is not replaced by a smaller number later on
+    assert parse_price('COP 1.200.000 COP 1.500.000', 'COP') == ParsedPrice(150000000, 'COP')
+
+
+def test_percentages_are_not_prices():
+    assert parse_price('COP 1.234.567 + IVA 19%', 'COP') == ParsedPrice(123456700, 'COP')
+    assert parse_price('COP 300.000 -15 %', 'COP') == ParsedPrice(30000000, 'COP')
+
+
+@pytest.mark.parametrize('text', ['Precio COP 300.000 TOTAL 2', 'TOTAL 2 Precio COP 300.000'])
+def test_words_ending_in_capitals_are_not_currencies(text):
+    assert parse_price(text, 'COP') == ParsedPrice(30000000, 'COP')
+
+
+@pytest.mark.parametrize('text, amount', [('DESDE 3', 300), ('WIFI 5', 500), ('ABCCOP 5', 500)])
+def test_letters_before_a_number_are_not_read_as_a_code(text, amount):
+    assert parse_price(text, 'USD') == ParsedPrice(amount, 'USD')
+
+
+def test_unknown_codes_are_ignored_but_the_configured_currency_is_not():
+    assert parse_price('XYZ 5') == ParsedPrice(500, None)
+    assert parse_price('XYZ 5', 'XYZ') == ParsedPrice(500, 'XYZ')
+
+
+def test_taxes_line_is_not_the_price():
+    text = 'COP 1.234.567\n+COP 234.567 de impuestos y cargos'
+    assert parse_price(text, 'COP') == ParsedPrice(123456700, 'COP')
+    assert parse_price('US$150\n+US$22 taxes and charges', 'USD') == ParsedPrice(15000, 'USD')
+
+
+def test_taxes_text_on_its_own_is_parsed():
+    assert parse_price('+COP 234.567 de impuestos y cargos', 'COP') == ParsedPrice(23456700, 'COP')
+
+
+@pytest.mark.parametrize('text', [None, '', 'Not available', 'Sin disponibilidad'])
+def test_no_price(text):
+    assert parse_price(text, 'COP') is None
+
+
+def test_add_price_fields_and_result_price():
+    results = [{'price': 'COP 300.000'}, {'price': None}, {'price': 'x', 'price_amount': 100, 'price_currency': 'USD'}]
+    assert add_price_fields(results, 'COP') == 2
+    assert results[0]['price_amount'] == 30000000 and results[0]['price_currency'] == 'COP'
+    assert results[1]['price_amount'] is None
+    assert result_price(results[0]) == 300000.0
+    assert result_price(results[2]) == 1.0
+    assert result_price({'price': 'COP 1.000'}) == 1000.0
+    assert to_major_units(12345, 'JPY') == 12345
@@ -0,0 +1,52 @@
+"""
+Tests for the token-bucket rate limiter
+"""
+
+import time
+
+from src.scraper.ratelimit import RateLimiter, TokenBucket, host_key, search_keys, zone_key
+
+
+def test_bucket_allows_a_burst_then_waits_for_the_rate():
+    bucket = TokenBucket(rate_per_minute=60, burst=2)
+    now = time.monotonic()
+    for _ in range(2):
+        assert bucket.wait_time(now) == 0
+        bucket.take()
+    assert 0.9 < bucket.wait_time(now) <= 1
+    assert bucket.wait_time(now + 1) == 0
+
+
+def test_bucket_never_holds_more_than_its_burst():
+    bucket = TokenBucket(rate_per_minute=6000, burst=3)
+    assert bucket.wait_time(time.monotonic() + 60) == 0
+    assert bucket.tokens == 3
+
+
+def test_acquire_takes_a_token_from_every_named_bucket():
+    limiter = RateLimiter()
+    limiter.add_bucket('a', 60, 1)
+    limiter.add_bucket('b', 6000, 5)
+    assert limiter.acquire(('a', 'b')) < 0.05
+    assert limiter._buckets['b'].tokens < 5
+    # Unknown bucket names are ignored
+    assert limiter.acquire(('b', 'missing')) < 0.05
+
+
+def test_acquire_waits_for_the_slowest_bucket():
+    limiter = RateLimiter()
+    limiter.add_bucket('fast', 60000, 10)
+    limiter.add_bucket('slow', 600, 1)
+    limiter.acquire(('fast', 'slow'))
+    waited = limiter.acquire(('fast', 'slow'))
+    assert 0.05 < waited < 0.5
+    assert limiter.waited >= waited
+
+
+def test_keys(monkeypatch):
+    monkeypatch.setenv('BRIGHT_DATA_USERNAME', 'brd-customer-hl_1-zone-residential-country-co')
+    assert host_key() == 'host:www.booking.com'
+    assert zone_key() == 'zone:residential'
+    assert search_keys() == (host_key(), 'zone:residential')
+    monkeypatch.delenv('BRIGHT_DATA_USERNAME')
+    assert zone_key() == 'zone:default'
@@ -0,0 +1,95 @@
+"""
+Tests for the streamed rewrite of result files in retry mode
+"""
+
+import json
+
+import pytest
+
+from src.data import json_stream
+from src.data.retry import load_failed_searches_from_json, update_json_with_results
+from src.data.stream import JsonlResultWriter, finalize_results_stream
+
+
+def result(hotel, day, price=None, availability='Available', error=None):
+    return {
+        'hotel_name': hotel, 'checkin': f'2025-01-{day:02d}', 'checkout': f'2025-01-{day + 1:02d}',
+        'price': price, 'availability': availability, 'error': error, 'timestamp': '2025-01-01T00:00:00'
+    }
+
+
+def save_results(results, json_path):
+    """Write results the way a run does, through the stream and its finalize step"""
+    writer = JsonlResultWriter(json_path + 'l')
+    for item in results:
+        writer.write(item)
+    writer.close()
+    return finalize_results_stream(json_path + 'l', json_path=json_path)
+
+
+def failed(hotel, day):
+    return result(hotel, day, availability='Search failed', error='Hotel search failed')
+
+
+ORIGINAL = [
+    result('Ñandú', 1, 'COP 100.000'),
+    failed('Ñandú', 2),
+    failed('Ñandú', 3),
+    result('B', 1, availability='Not available'),
+    failed('B', 2),
+]
+RETRIED = [result('Ñandú', 2, 'COP 200.000'), failed('Ñandú', 3), result('B', 2, 'COP 50.000')]
+
+
+def comparable(data):
+    """Document without the fields that hold the time of writing"""
+    data['metadata'].pop('scrape_timestamp', None)
+    data['metadata'].pop('last_updated', None)
+    hotels = [data] if 'hotel_name' in data else data['hotels'].values()
+    for hotel in hotels:
+        for search in hotel['searches']:
+            search.pop('timestamp')
+    return data
+
+
+@pytest.fixture(params=['ijson', 'json'])
+def parser(request, monkeypatch):
+    """Run each test with the ijson event parser and with the plain json fallback"""
+    if request.param == 'json':
+        monkeypatch.setattr(json_stream, 'ijson', None)
+    return request.param
+
+
+@pytest.mark.parametrize('hotels', [('Ñandú', 'B'), ('Ñandú',)])
+def test_rewrite_matches_a_fresh_save_of_the_updated_results(tmp_path, parser, hotels):
+    original = [r for r in ORIGINAL if r['hotel_name'] in hotels]
+    retried = [r for r in RETRIED if r['hotel_name'] in hotels]
+    path = save_results(original, str(tmp_path / 'run.json'))
+
+    retry_index, failed_searches = load_failed_searches_from_json(path)
+    assert [(s['hotel_name'], s['checkin_date']) for s in failed_searches] == \
+        [(r['hotel_name'], r['checkin']) for r in original if r['error']]
+    assert all(s['original_error_class'] == 'not_found' for s in failed_searches)
+
+    assert update_json_with_results(retry_index, retried, path)
+
+    lookup = {(r['hotel_name'], r['checkin']): r for r in retried}
+    expected_path = save_results([lookup.get((r['hotel_name'], r['checkin']), r) for r in original],
+                                 str(tmp_path / 'expected.json'))
+    with open(path, encoding='utf-8') as f, open(expected_path, encoding='utf-8') as g:
+        assert comparable(json.load(f)) == comparable(json.load(g))
+
+
+def test_rewrite_keeps_the_file_when_there_is_nothing_to_update(tmp_path, parser):
+    path = save_results(ORIGINAL, str(tmp_path / 'run.json'))
+    with open(path, encoding='utf-8') as f:
+        before = f.read()
+    retry_index, _ = load_failed_searches_from_json(path)
+    assert not update_json_with_results(retry_index, [], path)
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == before
+    assert not (tmp_path / 'run.json.tmp').exists()
+
+
+def test_missing_file(tmp_path):
+    assert load_failed_searches_from_json(str(tmp_path / 'missing.json')) == (None, [])
@@ -0,0 +1,117 @@
+"""
+Tests for the shared task queue
+"""
+
+import threading
+import time
+from datetime import date
+
+from src.scraper.scheduler import TaskQueue, build_tasks
+
+
+DATES = [(date(2025, 1, day), date(2025, 1, day + 1)) for day in (1, 2, 3)]
+
+
+def drain(queue):
+    """Take and finish every task in a single thread"""
+    taken = []
+    current_hotel = None
+    while True:
+        task = queue.get(current_hotel)
+        if task is None:
+            return taken
+        taken.append(task)
+        current_hotel = task.hotel_name
+        queue.task_done()
+
+
+def test_build_tasks_indexes_hotels_by_dates():
+    tasks = build_tasks(['A', 'B'], DATES)
+    assert [task.index for task in tasks] == list(range(6))
+    assert [task.hotel_name for task in tasks] == ['A'] * 3 + ['B'] * 3
+    assert tasks[0].attempt == 0 and tasks[0].avoid_session is None
+
+
+def test_drain_returns_every_task_once_and_keeps_hotel_affinity():
+    queue = TaskQueue(build_tasks(['A', 'B'], DATES))
+    taken = drain(queue)
+    assert sorted(task.index for task in taken) == list(range(6))
+    assert [task.hotel_name for task in taken] == ['A'] * 3 + ['B'] * 3
+    assert queue.remaining() == 0
+
+
+def test_get_waits_for_in_flight_tasks_that_may_be_retried():
+    queue = TaskQueue(build_tasks(['A'], DATES[:1]))
+    task = queue.get()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(queue.get()))
+    waiter.start()
+    time.sleep(0.05)
+    assert waiter.is_alive()
+
+    queue.retry(task._replace(attempt=1), 0)
+    queue.task_done()
+    waiter.join(1)
+    assert got[0].index == task.index and got[0].attempt == 1
+    queue.task_done()
+    assert queue.get() is None
+
+
+def test_retry_counts_and_waits_for_the_delay():
+    queue = TaskQueue(build_tasks(['A'], DATES[:1]))
+    task = queue.get()
+    queue.retry(task._replace(attempt=1), 0.1)
+    queue.task_done()
+    assert queue.retried == 1
+    assert queue.remaining() == 1
+
+    started = time.monotonic()
+    again = queue.get()
+    assert time.monotonic() - started >= 0.09
+    assert again.attempt == 1
+    queue.task_done()
+    assert queue.get() is None
+
+
+def test_defer_puts_task_back_without_counting_a_retry():
+    queue = TaskQueue(build_tasks(['A'], DATES[:2]))
+    task = queue.get()
+    queue.defer(task, 0)
+    queue.task_done()
+    assert queue.retried == 0
+    assert sorted(t.index for t in drain(queue)) == [0, 1]
+
+
+def test_retried_task_goes_first_in_line_for_its_hotel():
+    queue = TaskQueue(build_tasks(['A'], DATES))
+    first = queue.get()
+    queue.retry(first._replace(attempt=1), 0)
+    queue.task_done()
+    assert queue.get('A').index == first.index
+
+
+def test_get_batch_takes_dates_of_the_same_hotel():
+    queue = TaskQueue(build_tasks(['A', 'B'], DATES))
+    batch = queue.get_batch(None, 2)
+    assert [task.hotel_name for task in batch] == ['A', 'A']
+    for _ in batch:
+        queue.task_done()
+    assert len(drain(queue)) == 4
+
+
+def test_take_next_counts_as_in_flight():
+    queue = TaskQueue(build_tasks(['A'], DATES[:2]))
+    first = queue.get()
+    second = queue.take_next('A')
+    assert second.index == 1
+    assert queue.take_next('A') is None
+    queue.task_done()
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(queue.get()))
+    waiter.start()
+    time.sleep(0.05)
+    assert waiter.is_alive()
+    queue.task_done()
+    waiter.join(1)
+    assert got == [None]
@@ -0,0 +1,43 @@
+"""
+Tests that a search stays within its time budget
+"""
+
+import time
+
+from selenium.common.exceptions import NoSuchElementException
+
+from src.scraper import core
+
+
+class SlowLookupDriver:
+    """Page without the expected elements, where lookups honour the implicit wait"""
+
+    def __init__(self, implicit_wait):
+        self.implicit_wait = implicit_wait
+        self.waits = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+        self.waits.append(seconds)
+
+    def find_element(self, by, value):
+        time.sleep(self.implicit_wait)
+        raise NoSuchElementException(value)
+
+    def find_elements(self, by, value):
+        time.sleep(self.implicit_wait)
+        return []
+
+    def execute_script(self, script, *args):
+        return False
+
+
+def test_missing_element_fails_within_the_search_budget(settings):
+    settings.update(navigation_mode='ui', search_budget=0.5, implicit_wait=20)
+    driver = SlowLookupDriver(implicit_wait=20)
+    started = time.monotonic()
+    result = core.scrape_search(driver, 'Hotel Casa', '2025-01-01', '2025-01-02')
+    assert time.monotonic() - started < 2
+    assert result['error'] == 'Hotel search failed'
+    # The session gets its implicit wait back for the code outside the search
+    assert driver.waits == [0, 20]
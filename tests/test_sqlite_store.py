@@ -0,0 +1,31 @@
+"""
+Tests for the SQLite price store
+"""
+
+from src.data.sqlite_store import PriceStore, is_sqlite_path
+
+
+def result(hotel, checkin, price=None, error=None, availability='Available', timestamp='2025-01-01T00:00:00'):
+    return {
+        'hotel_name': hotel, 'checkin': checkin, 'checkout': checkin[:-1] + str(int(checkin[-1]) + 1),
+        'price': price, 'availability': availability, 'error': error, 'timestamp': timestamp
+    }
+
+
+def test_is_sqlite_path():
+    assert is_sqlite_path('prices.db') and is_sqlite_path('x/prices.SQLITE3')
+    assert not is_sqlite_path('prices.json')
+
+
+def test_failed_searches_use_the_latest_result_of_each_stay(tmp_path):
+    store = PriceStore(str(tmp_path / 'prices.db'), run_id='run1', batch_size=2)
+    store.write(result('A', '2025-01-01', error='Hotel search failed', availability='Search failed'))
+    store.write(result('A', '2025-01-01', price='COP 1.000', timestamp='2025-01-02T00:00:00'))
+    store.write(result('A', '2025-01-02', error='Date selection failed', availability='Date selection failed'))
+    store.write(result('B', '2025-01-01', availability='Not available'))
+
+    failed = store.failed_searches()
+    assert [(row['hotel_name'], row['checkin_date']) for row in failed] == [('A', '2025-01-02')]
+    assert store.hotels() == ['A', 'B']
+    assert len(store.price_history('A', '2025-01-01', '2025-01-02')) == 2
+    store.close()
@@ -0,0 +1,83 @@
+"""
+Tests for the running price statistics
+"""
+
+import statistics
+
+import pytest
+
+from src.data.stats import PriceStats
+
+
+PRICES = [120000, 95000, 300000, 180000, 150000, 150000, 99000, 410000, 230000, 175000]
+
+
+def stats_of(values):
+    stats = PriceStats()
+    for value in values:
+        stats.add(value)
+    return stats
+
+
+def test_empty():
+    stats = PriceStats()
+    assert stats.count == 0 and stats.variance is None and stats.quantile(0.5) is None
+    fields = stats.summary_fields()
+    assert fields['min_price'] is None and fields['avg_price'] is None and fields['p50_price'] is None
+
+
+def test_moments_match_the_exact_values():
+    stats = stats_of(PRICES)
+    assert stats.count == len(PRICES)
+    assert stats.min == min(PRICES) and stats.max == max(PRICES)
+    assert stats.mean == pytest.approx(statistics.mean(PRICES))
+    assert stats.stddev == pytest.approx(statistics.stdev(PRICES))
+
+
+@pytest.mark.parametrize('q', [0.0, 0.25, 0.5, 0.9, 1.0])
+def test_quantiles_are_within_the_relative_accuracy(q):
+    stats = stats_of(PRICES)
+    exact = sorted(PRICES)[int(q * (len(PRICES) - 1))]
+    assert stats.quantile(q) == pytest.approx(exact, rel=stats.relative_accuracy)
+
+
+def test_zero_prices_count_below_everything():
+    stats = stats_of([0, 0, 100])
+    assert stats.quantile(0.5) == 0.0
+    assert stats.quantile(1.0) == pytest.approx(100, rel=0.01)
+
+
+def test_state_survives_a_round_trip():
+    stats = stats_of(PRICES)
+    restored = PriceStats.from_dict(stats.to_dict())
+    assert restored.to_dict() == stats.to_dict()
+    assert restored.summary_fields() == stats.summary_fields()
+    restored.add(500000)
+    assert restored.max == 500000 and restored.count == len(PRICES) + 1
+
+
+def test_merge_matches_one_stats_fed_every_value():
+    first, second = PRICES[:4], PRICES[4:] + [0, 880000]
+    merged = stats_of(first)
+    merged.merge(stats_of(second))
+    merged.merge(PriceStats())
+    combined = stats_of(first + second)
+
+    assert merged.count == combined.count
+    assert merged.min == combined.min and merged.max == combined.max
+    assert merged.mean == pytest.approx(combined.mean)
+    assert merged.variance == pytest.approx(combined.variance)
+    for q in (0.1, 0.5, 0.9, 1.0):
+        assert merged.quantile(q) == pytest.approx(combined.quantile(q))
+
+
+def test_merge_across_runs_through_saved_state():
+    merged = PriceStats.from_dict(stats_of(PRICES).to_dict())
+    merged.merge(PriceStats.from_dict(stats_of(PRICES).to_dict()))
+    assert merged.count == 2 * len(PRICES)
+    assert merged.quantile(0.5) == stats_of(PRICES * 2).quantile(0.5)
+
+
+def test_merge_needs_the_same_accuracy():
+    with pytest.raises(ValueError):
+        stats_of(PRICES).merge(PriceStats.from_dict({**stats_of(PRICES).to_dict(), 'relative_accuracy': 0.05}))
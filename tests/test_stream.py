@@ -0,0 +1,92 @@
+"""
+Tests for the JSON Lines results stream and its summary JSON
+"""
+
+import json
+
+import pytest
+
+from src.data.stream import JsonlResultWriter, finalize_results_stream, read_results_stream
+
+
+def result(hotel, day, price=None, availability='Available', error=None):
+    return {
+        'hotel_name': hotel, 'checkin': f'2025-01-{day:02d}', 'checkout': f'2025-01-{day + 1:02d}',
+        'price': price, 'availability': availability, 'error': error, 'timestamp': '2025-01-01T00:00:00'
+    }
+
+
+RESULTS = [
+    result('Ñandú', 3, 'COP 300.000'),
+    result('B', 2, availability='Not available'),
+    result('Ñandú', 1, 'COP 100.000'),
+    result('B', 1, availability='Search failed', error='Hotel search failed'),
+    result('Ñandú', 2, 'COP 200.000'),
+]
+
+
+def write_stream(path, results):
+    writer = JsonlResultWriter(str(path))
+    for item in results:
+        writer.write(item)
+    writer.close()
+
+
+def without_timestamp(data):
+    data['metadata'].pop('scrape_timestamp')
+    return data
+
+
+def test_stream_skips_a_truncated_last_line(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    write_stream(path, RESULTS)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"hotel_name": "tru')
+    assert list(read_results_stream(str(path))) == RESULTS
+
+
+@pytest.mark.parametrize('results', [RESULTS, [r for r in RESULTS if r['hotel_name'] == 'Ñandú']])
+def test_finalize_writes_json_dump_formatting(tmp_path, results):
+    path = tmp_path / 'run.jsonl'
+    write_stream(path, results)
+    json_path = finalize_results_stream(str(path))
+    assert json_path == str(tmp_path / 'run.json')
+    with open(json_path, encoding='utf-8') as f:
+        streamed = f.read()
+    assert streamed == json.dumps(json.loads(streamed), indent=2, ensure_ascii=False)
+
+
+def test_finalize_single_hotel_layout(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    write_stream(path, [r for r in RESULTS if r['hotel_name'] == 'Ñandú'])
+    with open(finalize_results_stream(str(path)), encoding='utf-8') as f:
+        data = without_timestamp(json.load(f))
+    assert list(data) == ['metadata', 'hotel_name', 'searches', 'summary']
+    assert data['hotel_name'] == 'Ñandú'
+    assert data['metadata'] == {
+        'hotel_name': 'Ñandú', 'total_searches': 3, 'total_successful': 3, 'overall_success_rate': 100.0
+    }
+    assert [(search['checkin_date'], search['price']) for search in data['searches']] == \
+        [('2025-01-01', 'COP 100.000'), ('2025-01-02', 'COP 200.000'), ('2025-01-03', 'COP 300.000')]
+    assert data['summary']['successful_prices'] == 3
+
+
+def test_finalize_sorts_dates_and_counts(tmp_path):
+    path = tmp_path / 'run.jsonl'
+    write_stream(path, RESULTS)
+    with open(finalize_results_stream(str(path)), encoding='utf-8') as f:
+        data = json.load(f)
+    assert list(data['hotels']) == ['Ñandú', 'B']
+    nandu = data['hotels']['Ñandú']
+    assert [search['checkin_date'] for search in nandu['searches']] == ['2025-01-01', '2025-01-02', '2025-01-03']
+    assert nandu['summary']['min_price'] == 100000 and nandu['summary']['max_price'] == 300000
+    assert data['hotels']['B']['summary']['not_available'] == 1
+    assert data['hotels']['B']['summary']['errors'] == 1
+    assert data['metadata']['total_searches'] == 5 and data['metadata']['total_successful'] == 3
+
+
+def test_finalize_without_results(tmp_path):
+    assert finalize_results_stream(str(tmp_path / 'missing.jsonl')) is None
+    empty = tmp_path / 'empty.jsonl'
+    empty.write_text('')
+    assert finalize_results_stream(str(empty)) is None
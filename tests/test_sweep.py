@@ -0,0 +1,66 @@
+"""
+Tests for destination sweeps and resuming them
+"""
+
+import threading
+from argparse import Namespace
+from datetime import date
+
+import main
+from src.data.checkpoint import create_run_manifest, load_run_manifest
+from src.scraper import core
+from src.scraper.errors import TIMEOUT
+
+
+DATES = [(date(2025, 1, day), date(2025, 1, day + 1)) for day in (1, 2, 3)]
+
+
+def test_failed_date_pair_is_retried_without_holding_up_the_others(fake_sessions, settings, monkeypatch):
+    settings['retry_backoff'] = 0.3
+    calls = []
+    lock = threading.Lock()
+
+    def fake_sweep(driver, destination, hotel_names, checkin_date, checkout_date):
+        with lock:
+            calls.append(checkin_date)
+            first = calls.count(checkin_date) == 1
+        if checkin_date == DATES[0][0] and first:
+            return [], 1, TIMEOUT
+        return [core._build_result(name, checkin_date, checkout_date, price='COP 1.000') for name in hotel_names], 1, None
+
+    monkeypatch.setattr(core, '_sweep_dates', fake_sweep)
+    results = core.sweep_destination('Bogotá', ['A', 'B'], DATES, workers=1)
+    assert len(results) == 6
+    # The other date pairs ran during the first one's backoff, then the retry
+    assert calls == [DATES[0][0], DATES[1][0], DATES[2][0], DATES[0][0]]
+
+
+def test_sweep_skips_completed_date_pairs(fake_sessions, monkeypatch):
+    swept = []
+
+    def fake_sweep(driver, destination, hotel_names, checkin_date, checkout_date):
+        swept.append(checkin_date)
+        return [core._build_result(name, checkin_date, checkout_date, price='COP 1.000') for name in hotel_names], 1, None
+
+    monkeypatch.setattr(core, '_sweep_dates', fake_sweep)
+    completed = {(name, str(DATES[0][0]), str(DATES[0][1])) for name in ('A', 'B')}
+    completed.add(('A', str(DATES[1][0]), str(DATES[1][1])))
+    results = core.sweep_destination('Bogotá', ['A', 'B'], DATES, workers=2, completed=completed)
+    assert sorted(swept) == [DATES[1][0], DATES[2][0]]
+    assert len(results) == 3
+
+
+def test_resume_uses_the_destination_and_workers_of_the_run(tmp_path, monkeypatch):
+    stream_path = str(tmp_path / 'hotel_prices_1.jsonl')
+    create_run_manifest(stream_path, ['A'], DATES, destination='Bogotá', workers=3)
+    manifest = load_run_manifest(stream_path[:-len('.jsonl')] + '.manifest.json')
+    assert manifest['destination'] == 'Bogotá' and manifest['workers'] == 3
+
+    calls = []
+    monkeypatch.setattr(main, '_open_results_stream', lambda path: None)
+    monkeypatch.setattr(main, '_run_and_finalize', lambda writer, run, scrape, **kwargs: scrape(None))
+    monkeypatch.setattr(main, 'sweep_destination', lambda *args: calls.append(('sweep', args[0], args[3])))
+    monkeypatch.setattr(main, 'scrape_hotels', lambda *args: calls.append(('hotels', args[2])))
+    args = Namespace(resume=stream_path[:-len('.jsonl')] + '.manifest.json', sqlite=None, destination=None, workers=1)
+    main.handle_resume_mode(args)
+    assert calls == [('sweep', 'Bogotá', 3)]
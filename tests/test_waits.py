@@ -0,0 +1,43 @@
+"""
+Tests for condition-driven waits and the search budget
+"""
+
+import time
+
+from src.scraper.driver import wait_for_page_load
+from src.scraper.waits import SearchDeadline, document_ready, wait_until
+
+
+class PageDriver:
+    """Driver whose document finishes loading after `ready_after` checks"""
+
+    def __init__(self, ready_after):
+        self.checks = 0
+        self.ready_after = ready_after
+
+    def execute_script(self, script, *args):
+        self.checks += 1
+        return self.checks > self.ready_after
+
+
+def test_deadline_caps_step_timeouts():
+    deadline = SearchDeadline(0.2)
+    assert deadline.cap(30) <= 0.2
+    assert deadline.cap(0.05) == 0.05
+    time.sleep(0.21)
+    assert deadline.expired() and deadline.cap(30) == 0
+
+
+def test_wait_until_returns_as_soon_as_the_condition_holds():
+    driver = PageDriver(ready_after=2)
+    started = time.monotonic()
+    assert wait_until(driver, document_ready(), 5, poll_frequency=0.01)
+    assert time.monotonic() - started < 1
+
+
+def test_page_load_wait_stops_at_the_search_deadline():
+    deadline = SearchDeadline(0.2)
+    started = time.monotonic()
+    assert not wait_for_page_load(PageDriver(ready_after=10 ** 6), deadline=deadline)
+    assert time.monotonic() - started < 1
+    assert not wait_until(PageDriver(ready_after=0), document_ready(), 30, deadline)